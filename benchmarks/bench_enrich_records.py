@@ -0,0 +1,175 @@
+"""Benchmark: enrichment of a large records page by the high-level Table.
+
+Measures rows/sec of turning raw records.list rows (keyed by attnum) into
+rows keyed by column name, with JSON and timestamp columns converted to
+Python objects. The per-row enricher used before the compiled column plan
+is kept here as the baseline. The columnar format is compared with building
+row dicts and transposing them. The table's column cache is filled in
+advance, so no server is needed.
+
+Run with:
+    python benchmarks/bench_enrich_records.py [--rows 100000] [--codec stdlib]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from timeit import repeat
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mathesar_client.client import RecordsPage, Table  # noqa: E402
+from mathesar_client.client_raw import MathesarClientRaw  # noqa: E402
+from mathesar_client.client_raw_models import ColumnInfo, RecordList  # noqa: E402
+
+COLUMNS = [
+    ("id", "integer", True),
+    ("name", "text", False),
+    ("email", "character varying", False),
+    ("created", "timestamp without time zone", False),
+    ("updated", "timestamp with time zone", False),
+    ("birthday", "date", False),
+    ("meta", "jsonb", False),
+    ("score", "numeric", False),
+    ("active", "boolean", False),
+    ("notes", "text", False),
+]
+
+
+def make_table(json_codec: str = "auto") -> Table:
+    # No request is sent; the raw client only provides the JSON codec
+    raw = MathesarClientRaw("http://localhost/", "user", "password", json_codec=json_codec)
+    table = Table(raw, database_id=1, table_oid=1)
+    table._columns_cache = [
+        ColumnInfo(
+            id=attnum,
+            name=name,
+            type=type_,
+            nullable=not pk,
+            primary_key=pk,
+            has_dependents=False,
+            current_role_priv=["SELECT"],
+        )
+        for attnum, (name, type_, pk) in enumerate(COLUMNS, start=1)
+    ]
+    table._attnum_to_name = {c.id: c.name for c in table._columns_cache}
+    table._name_to_attnum = {c.name: c.id for c in table._columns_cache}
+    return table
+
+
+def make_page(rows: int) -> RecordList:
+    results = [
+        {
+            "1": i,
+            "2": f"user {i}",
+            "3": f"user{i}@example.com",
+            "4": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:{i % 60:02d}:00",
+            "5": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00Z",
+            "6": f"19{i % 100:02d}-01-01" if i % 5 else None,
+            "7": json.dumps({"k": i, "tags": ["a", "b"]}),
+            "8": i * 1.5,
+            "9": bool(i % 2),
+            "10": None,
+        }
+        for i in range(rows)
+    ]
+    return RecordList.model_construct(count=rows, results=results, linked_record_summaries=None)
+
+
+def legacy_enrich_records(table: Table, record_list: RecordList) -> RecordsPage:
+    """The row enrichment as it was before the compiled column plan (baseline).
+
+    Looks up each cell's column name and type per row, parses JSON with the
+    stdlib and validates the finished page.
+    """
+    cols = table._cached_columns()
+    att_to_name = {c.id: c.name for c in cols}
+    att_to_type = {c.id: (c.type or "").lower() for c in cols}
+    linked = table._linked_map(record_list)
+    pk_attnum: Optional[int] = next((c.id for c in cols if c.primary_key), None)
+
+    def enrich(rec: Dict[str, Any]) -> Dict[str, Any]:
+        row: Dict[str, Any] = {}
+        pk_value: Optional[Any] = None
+        if pk_attnum is not None:
+            pk_value = rec.get(str(pk_attnum))
+            if pk_value is None:
+                pk_value = rec.get(pk_attnum)  # type: ignore[call-overload]
+        for k, v in rec.items():
+            try:
+                att = int(k)
+            except (ValueError, TypeError):
+                row[k] = v
+                continue
+            colname = att_to_name.get(att, str(att))
+            linked_records = linked.get(str(att), {})
+            linked_summary = linked_records.get(str(pk_value), None) if pk_value is not None else None
+            if linked_records and v is not None:
+                row[colname] = {"id": v, "summary": linked_summary}
+            else:
+                if isinstance(v, str):
+                    col_type = att_to_type.get(att, "")
+                    if "json" in col_type:
+                        try:
+                            row[colname] = json.loads(v)
+                            continue
+                        except Exception:
+                            pass
+                    if "date" in col_type or "timestamp" in col_type or "datetime" in col_type:
+                        s = v.strip()
+                        if s.endswith(" AD"):
+                            s = s[:-3].strip()
+                        if s.endswith(" BC"):
+                            s = s[:-3].strip()
+                        if s.endswith("Z"):
+                            s = s[:-1] + "+00:00"
+                        parsed: Optional[datetime] = None
+                        try:
+                            parsed = datetime.fromisoformat(s)
+                        except Exception:
+                            try:
+                                if len(s) == 10 and s[4] == "-" and s[7] == "-":
+                                    parsed = datetime.strptime(s, "%Y-%m-%d")
+                            except Exception:
+                                parsed = None
+                        if parsed is not None:
+                            row[colname] = parsed
+                            continue
+                row[colname] = v
+        return row
+
+    return RecordsPage(count=record_list.count, results=list(map(enrich, record_list.results)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--codec", default="auto", help="JSON codec parsing json columns")
+    args = parser.parse_args()
+    table = make_table(args.codec)
+    page = make_page(args.rows)
+    names = [name for name, _, _ in COLUMNS]
+
+    def transposed() -> dict:
+        results = table._enrich_records(page).results
+        return {name: [row.get(name) for row in results] for name in names}
+
+    print(f"{args.rows} rows x {len(COLUMNS)} columns")
+    for label, fn in (
+        ("row dicts, baseline", lambda: legacy_enrich_records(table, page)),
+        ("row dicts", lambda: table._enrich_records(page)),
+        ("row dicts + transpose", transposed),
+        ("columnar", lambda: table._columnar_page(page, arrays=False)),
+        ("columnar, arrays", lambda: table._columnar_page(page, arrays=True)),
+    ):
+        best = min(repeat(fn, number=1, repeat=5))
+        print(f"{label:>22}: {best * 1e3:6.0f}ms, {args.rows / best:>10,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
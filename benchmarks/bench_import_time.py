@@ -0,0 +1,78 @@
+"""Benchmark: cold-start import time of mathesar_client.
+
+Each scenario runs in a fresh interpreter with ``python -X importtime`` and
+reports the wall-clock time of the statement, the cumulative import time of
+the top-level modules it pulled in and the slowest of them. Modules that the
+interpreter imports at startup anyway are left out.
+
+Run with:
+    python benchmarks/bench_import_time.py [--runs 5] [--top 8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+
+SCENARIOS = {
+    "package": "import mathesar_client",
+    "high-level client": "from mathesar_client import MathesarClient",
+    "raw client + models": "from mathesar_client import MathesarClientRaw, TableInfo",
+    "first validation": (
+        "from mathesar_client import TableInfo; TableInfo.model_validate({'oid': 1, 'name': 't', "
+        "'schema': 2200, 'owner_oid': 10, 'current_role_priv': [], 'current_role_owns': True})"
+    ),
+}
+
+_TIMER = "import time; _t = time.perf_counter(); {stmt}; print((time.perf_counter() - _t) * 1e3)"
+
+
+def run(stmt: str) -> Tuple[float, Dict[str, int]]:
+    env = {**os.environ, "PYTHONPATH": SRC + os.pathsep + os.environ.get("PYTHONPATH", "")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMER.format(stmt=stmt)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    top_level: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative)
+    return float(proc.stdout.strip().splitlines()[-1]), top_level
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+
+    _, startup = run("pass")
+    for label, stmt in SCENARIOS.items():
+        results = [run(stmt) for _ in range(args.runs)]
+        wall = median(r[0] for r in results)
+        modules: Dict[str, List[int]] = {}
+        for _, top_level in results:
+            for name, us in top_level.items():
+                if name in startup:
+                    continue
+                modules.setdefault(name, []).append(us)
+        imported = sum(median(v) for v in modules.values()) / 1e3
+        print(f"{label}: {wall:.1f} ms wall, {imported:.1f} ms in imports  [{stmt[:60]}]")
+        slowest = sorted(modules.items(), key=lambda kv: median(kv[1]), reverse=True)[:args.top]
+        for name, us in slowest:
+            print(f"    {median(us) / 1e3:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
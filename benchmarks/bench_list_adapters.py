@@ -0,0 +1,74 @@
+"""Microbenchmark: per-item model_validate vs. a cached TypeAdapter(List[Model]).
+
+The raw client validates list replies (``tables_list``, ``columns_list``, ...)
+with one cached TypeAdapter per model. This compares it with validating each
+element separately.
+
+Run with:
+    python benchmarks/bench_list_adapters.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mathesar_client.client_raw import _list_of  # noqa: E402
+from mathesar_client.client_raw_models import ColumnInfo, TableInfo  # noqa: E402
+
+
+def make_columns(n: int) -> list:
+    return [
+        {
+            "id": i,
+            "name": f"column_{i}",
+            "type": "numeric",
+            "type_options": {"precision": 10, "scale": 2},
+            "nullable": True,
+            "primary_key": i == 1,
+            "default": None,
+            "has_dependents": False,
+            "description": None,
+            "current_role_priv": ["SELECT", "INSERT", "UPDATE"],
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def make_tables(n: int) -> list:
+    return [
+        {
+            "oid": 10_000 + i,
+            "name": f"table_{i}",
+            "schema": 2200,
+            "description": None,
+            "owner_oid": 10,
+            "current_role_priv": ["SELECT"],
+            "current_role_owns": True,
+        }
+        for i in range(n)
+    ]
+
+
+def best_of(fn, data: list, number: int) -> float:
+    return min(repeat(lambda: fn(data), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{'model':>12} {'items':>7} {'per item':>11} {'adapter':>11} {'speedup':>8}")
+    for model, make in ((ColumnInfo, make_columns), (TableInfo, make_tables)):
+        adapter = _list_of(model)
+        for n in (1_000, 10_000):
+            data = make(n)
+            assert adapter(data) == [model.model_validate(x) for x in data]
+            number = max(1, 20_000 // n)
+            per_item = best_of(lambda d: [model.model_validate(x) for x in d], data, number)
+            batched = best_of(adapter, data, number)
+            print(f"{model.__name__:>12} {n:>7} {per_item * 1e3:>9.2f}ms {batched * 1e3:>9.2f}ms {per_item / batched:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
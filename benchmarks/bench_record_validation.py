@@ -0,0 +1,50 @@
+"""Benchmark: validated vs. trusted parsing of large records pages.
+
+Compares ``RecordList.model_validate`` (the default) with the ``validate=False``
+fast path of MathesarClientRaw on synthetic records.list results.
+
+Run with:
+    python benchmarks/bench_record_validation.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from timeit import repeat
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from mathesar_client.client_raw import _construct_record_list  # noqa: E402
+from mathesar_client.client_raw_models import RecordList  # noqa: E402
+
+
+def make_result(rows: int, columns: int = 12) -> dict:
+    return {
+        "count": rows,
+        "results": [
+            {str(c): (i * c if c % 3 else f"value {i}-{c}") for c in range(1, columns + 1)}
+            for i in range(rows)
+        ],
+        "grouping": None,
+        "linked_record_summaries": None,
+        "record_summaries": None,
+    }
+
+
+def best_of(fn, result: dict, number: int) -> float:
+    return min(repeat(lambda: fn(result), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{'rows':>8} {'validated':>12} {'trusted':>12} {'speedup':>9}")
+    for rows in (1_000, 10_000, 50_000):
+        result = make_result(rows)
+        number = max(1, 20_000 // rows)
+        validated = best_of(RecordList.model_validate, result, number)
+        trusted = best_of(_construct_record_list, result, number)
+        print(f"{rows:>8} {validated * 1e3:>10.2f}ms {trusted * 1e3:>10.3f}ms {validated / trusted:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
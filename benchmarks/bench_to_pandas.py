@@ -0,0 +1,88 @@
+"""Benchmark: building a pandas DataFrame from records pages.
+
+Compares ``pd.DataFrame`` over enriched row dicts with the page-by-page
+frame builder behind ``Table.to_pandas``, in time and in peak memory
+allocated on top of the raw pages. The frame's size is the memory still
+allocated once it is built, which unlike ``memory_usage(deep=True)`` also
+counts the nested objects of JSON columns. Memory is traced with
+tracemalloc, plus pyarrow's pool for pyarrow-backed string columns. The
+pages are built in advance, so no server is needed.
+
+Run with:
+    python benchmarks/bench_to_pandas.py [--rows 200000] [--page-size 10000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from bench_enrich_records import make_page, make_table
+
+
+def arrow_bytes() -> int:
+    return pa.total_allocated_bytes() if pa is not None else 0
+
+
+def measure(fn):
+    """Run ``fn``; return its result, the time taken, the peak and the retained memory."""
+    gc.collect()
+    arrow_before = arrow_bytes()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    # pyarrow buffers are not traced; they are allocated once per column
+    # when the frame is built, so the retained size stands in for their peak
+    arrow = arrow_bytes() - arrow_before
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak + arrow, retained + arrow
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=10_000)
+    args = parser.parse_args()
+    table = make_table()
+    page = make_page(args.rows)
+    pages = [
+        page.model_copy(update={"results": page.results[i:i + args.page_size]})
+        for i in range(0, args.rows, args.page_size)
+    ]
+
+    def from_rows() -> pd.DataFrame:
+        rows = []
+        for p in pages:
+            rows.extend(table._enrich_records(p).results)
+        return pd.DataFrame(rows)
+
+    def from_builder() -> pd.DataFrame:
+        builder = table._frame_builder(None, 1000)
+        for p in pages:
+            builder.add(p.results, total=args.rows)
+        return builder.frame()
+
+    print(f"{args.rows} rows x {len(table._columns_cache)} columns, pages of {args.page_size}")
+    for label, fn in (("pd.DataFrame(rows)", from_rows), ("to_pandas builder", from_builder)):
+        df, elapsed, peak, size = measure(fn)
+        print(
+            f"{label:>20}: {elapsed * 1e3:6.0f}ms, peak {peak / 2**20:6.1f} MiB, "
+            f"frame {size / 2**20:6.1f} MiB, peak/frame {peak / size:4.2f}"
+        )
+        del df
+
+
+if __name__ == "__main__":
+    main()
@@ -21,102 +21,185 @@ Quick Start:
 
 Environment Variables:
     MATHESAR_BASE_URL: Base URL of the Mathesar instance
-    MATHESAR_USERNAME: Username for basic authentication
-    MATHESAR_PASSWORD: Password for basic authentication
+    MATHESAR_USERNAME: Username for authentication
+    MATHESAR_PASSWORD: Password for authentication
 
 Main Components:
     MathesarClient: High-level ergonomic client (recommended)
     MathesarClientRaw: Low-level JSON-RPC client
     MathesarClientError: Exception for API errors
+    DeadlineExceeded: Raised when an operation runs past its deadline
+    deadline: Context manager bounding the total time of all calls inside it
+    AsyncMathesarClient / AsyncMathesarClientRaw: asyncio counterparts (requires httpx)
+    HttpTransport: Pooled keep-alive HTTP transport shared by a client
+    Http2Transport: Multiplexed HTTP/2 transport with HTTP/1.1 fallback (requires httpx[http2])
+    AsyncHttpTransport: httpx-based pooled transport for the async clients
+    BasicAuth / SessionAuth: Basic auth on every call, or a reused Django session
+    RpcBatch: JSON-RPC batch returned by MathesarClientRaw.batch()
+    RetryPolicy / RetryBudget: Backoff retries of transient failures, capped by a budget
+    AdaptiveLimiter / CircuitBreaker: Client-side overload protection (raises CircuitOpenError)
+    RecordStream: Rows of records.list parsed incrementally (records_list_stream)
+    col / Condition: Column-name filter expressions, e.g. (col("age") > 30) & (col("name") != "x")
+    JsonCodec: Base class for custom JSON codecs (msgspec is used when installed)
+    mathesar_client.compact: Slotted metadata classes returned with model_backend="compact"
     
     All Pydantic models are also exported for type hints and validation.
 """
 
-from .client_raw import MathesarClientRaw, MathesarClientError
-from .client import MathesarClient
-from .client_raw_models import (
-	# Records
-	OrderBy,
-	Filter,
-	FilterAttnum,
-	FilterLiteral,
-	Grouping,
-	Group,
-	GroupingResponse,
-	SearchParam,
-	RecordList,
-	RecordAdded,
-	RecordSummaryList,
-	SummarizedRecordReference,
-	# Analytics
-	AnalyticsState,
-	AnalyticsReport,
-	# Collaborators
-	CollaboratorInfo,
-	# Columns
-	TypeOptions,
-	ColumnDefault,
-	ColumnInfo,
-	CreatablePkColumnInfo,
-	CreatableColumnInfo,
-	SettableColumnInfo,
-	ColumnMetaDataBlob,
-	ColumnMetaDataRecord,
-	# Configured databases
-	ConfiguredDatabaseInfo,
-	ConfiguredDatabasePatch,
-	# Constraints
-	ForeignKeyConstraint,
-	PrimaryKeyConstraint,
-	UniqueConstraint,
-	CreatableConstraintInfo,
-	ConstraintInfo,
-	# Data modeling
-	MappingColumn,
-	SplitTableInfo,
-	# Databases and privileges
-	DatabaseInfo,
-	DBPrivileges,
-	# Setup
-	ConfiguredServerInfo,
-	ConfiguredRoleInfo,
-	DatabaseConnectionResult,
-	# Explorations
-	ExplorationInfo,
-	ExplorationDef,
-	ExplorationResult,
-	# Forms
-	FieldInfo,
-	FormInfo,
-	AddOrReplaceFieldDef,
-	AddFormDef,
-	SettableFormDef,
-	# Roles
-	RoleMember,
-	RoleInfo,
-	# Schemas and privileges
-	SchemaInfo,
-	SchemaPatch,
-	SchemaPrivileges,
-	# Tables and metadata and privileges
-	TableInfo,
-	AddedTableInfo,
-	SettableTableInfo,
-	JoinableTableRecord,
-	JoinableTableInfo,
-	TableMetaDataBlob,
-	TableMetaDataRecord,
-	TablePrivileges,
-	# Users
-	UserInfo,
-	UserDef,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+# Public names and the submodule defining them. Everything else listed in
+# __all__ is a model from client_raw_models. Submodules (and with them requests,
+# httpx and the model schemas) are only imported when a name is first used.
+_EXPORTS = {
+	"MathesarClientRaw": "client_raw",
+	"MathesarClientError": "errors",
+	"DeadlineExceeded": "errors",
+	"CircuitOpenError": "errors",
+	"deadline": "deadlines",
+	"HttpTransport": "transport",
+	"Http2Transport": "transport",
+	"AsyncHttpTransport": "transport",
+	"Auth": "auth",
+	"BasicAuth": "auth",
+	"SessionAuth": "auth",
+	"RpcBatch": "batch",
+	"RetryPolicy": "retry",
+	"RetryBudget": "retry",
+	"AdaptiveLimiter": "limiter",
+	"CircuitBreaker": "limiter",
+	"JsonCodec": "codec",
+	"RecordStream": "stream",
+	"col": "filters",
+	"ColumnRef": "filters",
+	"Condition": "filters",
+	"AsyncRecordStream": "stream",
+	"MathesarClient": "client",
+	"AsyncMathesarClientRaw": "client_raw_async",
+	"AsyncMathesarClient": "client_async",
+}
+
+if TYPE_CHECKING:
+	from .client_raw import MathesarClientRaw, MathesarClientError
+	from .errors import DeadlineExceeded, CircuitOpenError
+	from .deadlines import deadline
+	from .transport import HttpTransport, Http2Transport, AsyncHttpTransport
+	from .auth import Auth, BasicAuth, SessionAuth
+	from .batch import RpcBatch
+	from .retry import RetryPolicy, RetryBudget
+	from .limiter import AdaptiveLimiter, CircuitBreaker
+	from .codec import JsonCodec
+	from .stream import RecordStream, AsyncRecordStream
+	from .filters import col, ColumnRef, Condition
+	from .client import MathesarClient
+	from .client_raw_async import AsyncMathesarClientRaw
+	from .client_async import AsyncMathesarClient
+	from .client_raw_models import (
+		# Records
+		OrderBy,
+		Filter,
+		FilterAttnum,
+		FilterLiteral,
+		Grouping,
+		Group,
+		GroupingResponse,
+		SearchParam,
+		RecordList,
+		RecordAdded,
+		RecordSummaryList,
+		SummarizedRecordReference,
+		# Analytics
+		AnalyticsState,
+		AnalyticsReport,
+		# Collaborators
+		CollaboratorInfo,
+		# Columns
+		TypeOptions,
+		ColumnDefault,
+		ColumnInfo,
+		CreatablePkColumnInfo,
+		CreatableColumnInfo,
+		SettableColumnInfo,
+		ColumnMetaDataBlob,
+		ColumnMetaDataRecord,
+		# Configured databases
+		ConfiguredDatabaseInfo,
+		ConfiguredDatabasePatch,
+		# Constraints
+		ForeignKeyConstraint,
+		PrimaryKeyConstraint,
+		UniqueConstraint,
+		CreatableConstraintInfo,
+		ConstraintInfo,
+		# Data modeling
+		MappingColumn,
+		SplitTableInfo,
+		# Databases and privileges
+		DatabaseInfo,
+		DBPrivileges,
+		# Setup
+		ConfiguredServerInfo,
+		ConfiguredRoleInfo,
+		DatabaseConnectionResult,
+		# Explorations
+		ExplorationInfo,
+		ExplorationDef,
+		ExplorationResult,
+		# Forms
+		FieldInfo,
+		FormInfo,
+		AddOrReplaceFieldDef,
+		AddFormDef,
+		SettableFormDef,
+		# Roles
+		RoleMember,
+		RoleInfo,
+		# Schemas and privileges
+		SchemaInfo,
+		SchemaPatch,
+		SchemaPrivileges,
+		# Tables and metadata and privileges
+		TableInfo,
+		AddedTableInfo,
+		SettableTableInfo,
+		JoinableTableRecord,
+		JoinableTableInfo,
+		TableMetaDataBlob,
+		TableMetaDataRecord,
+		TablePrivileges,
+		# Users
+		UserInfo,
+		UserDef,
+	)
 
 __all__ = [
 	# Client
 	"MathesarClientRaw",
 	"MathesarClientError",
+	"DeadlineExceeded",
+	"CircuitOpenError",
+	"deadline",
 	"MathesarClient",
+	"AsyncMathesarClientRaw",
+	"AsyncMathesarClient",
+	"HttpTransport",
+	"Http2Transport",
+	"AsyncHttpTransport",
+	"Auth",
+	"BasicAuth",
+	"SessionAuth",
+	"RpcBatch",
+	"RetryPolicy",
+	"RetryBudget",
+	"AdaptiveLimiter",
+	"CircuitBreaker",
+	"JsonCodec",
+	"RecordStream",
+	"AsyncRecordStream",
+	"col",
+	"ColumnRef",
+	"Condition",
 	# Records
 	"OrderBy",
 	"Filter",
@@ -193,3 +276,15 @@ __all__ = [
 	"UserInfo",
 	"UserDef",
 ]
+
+
+def __getattr__(name: str) -> Any:
+	if name not in __all__:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(import_module(f".{_EXPORTS.get(name, 'client_raw_models')}", __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> List[str]:
+	return sorted(set(globals()) | set(__all__))
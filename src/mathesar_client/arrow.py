@@ -0,0 +1,150 @@
+"""Apache Arrow export of Mathesar records.
+
+Maps Mathesar column types to Arrow types and builds record batches
+straight from raw ``records.list`` rows. Only the current page is ever held
+as Python objects; the batches themselves live in Arrow memory, ready for
+DuckDB, Polars or Parquet writers.
+
+Requires pyarrow (``pip install mathesar-client[arrow]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+except ImportError as e:
+    raise ImportError("Arrow export requires pyarrow; install it with 'pip install mathesar-client[arrow]'") from e
+
+from .client_raw_models import ColumnInfo, TypeOptions
+
+# Postgres types with a direct Arrow counterpart; anything else becomes a string
+_ARROW_TYPES: Dict[str, pa.DataType] = {
+    "smallint": pa.int16(),
+    "integer": pa.int32(),
+    "bigint": pa.int64(),
+    "real": pa.float32(),
+    "double precision": pa.float64(),
+    "boolean": pa.bool_(),
+    "date": pa.date32(),
+    "timestamp without time zone": pa.timestamp("us"),
+    "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+}
+# Array item types kept typed; other items are exported as strings
+_ARROW_ITEM_TYPES = ("smallint", "integer", "bigint", "real", "double precision", "boolean")
+# Largest precision of decimal128; wider numerics use decimal256
+_DECIMAL128_MAX_PRECISION = 38
+
+_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError)
+
+
+def arrow_type(type_name: str, type_options: Optional[TypeOptions] = None) -> pa.DataType:
+    """Arrow type for a Mathesar column type.
+
+    Numeric columns with a precision become decimals of that precision and
+    scale; unconstrained numerics become float64. Timestamps with time zone
+    are normalized to UTC. Arrays become lists of their ``item_type``. JSON,
+    text, time, interval and all other types become strings.
+
+    Args:
+        type_name: Column type as reported in ``ColumnInfo.type``.
+        type_options: The column's ``type_options``, if any.
+
+    Returns:
+        The Arrow data type.
+    """
+    name = type_name.lower()
+    if name in ("_array", "array") or name.endswith("[]"):
+        item = type_options.item_type if type_options is not None else None
+        item = (item or name[:-2]).lower()
+        return pa.list_(_ARROW_TYPES[item] if item in _ARROW_ITEM_TYPES else pa.string())
+    if name in ("numeric", "decimal"):
+        precision = type_options.precision if type_options is not None else None
+        if precision is None:
+            return pa.float64()
+        scale = (type_options.scale if type_options is not None else None) or 0
+        if precision > _DECIMAL128_MAX_PRECISION:
+            return pa.decimal256(precision, scale)
+        return pa.decimal128(precision, scale)
+    return _ARROW_TYPES.get(name, pa.string())
+
+
+def arrow_schema(columns: List[ColumnInfo]) -> Tuple[pa.Schema, List[str]]:
+    """Arrow schema for a table's columns, and the raw row key of each field.
+
+    Args:
+        columns: The table's columns, in the order of the schema fields.
+
+    Returns:
+        The schema and the attnum strings keying each column in raw rows.
+    """
+    fields = [pa.field(c.name, arrow_type(c.type or "", c.type_options), nullable=True) for c in columns]
+    return pa.schema(fields), [str(c.id) for c in columns]
+
+
+def record_batch(
+    rows: List[Dict[str, Any]],
+    schema: pa.Schema,
+    keys: List[str],
+    encode_json: Callable[[Any], bytes],
+    parse_datetime: Callable[[Any], Any],
+) -> pa.RecordBatch:
+    """Build a record batch from raw ``records.list`` rows.
+
+    Args:
+        rows: Raw rows keyed by attnum strings.
+        schema: Schema from ``arrow_schema``.
+        keys: Raw row keys from ``arrow_schema``, in field order.
+        encode_json: Encoder used to turn JSON values into text.
+        parse_datetime: Fallback parser for date/time strings Arrow cannot parse.
+
+    Returns:
+        A record batch with one row per raw row.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a value does not fit its column's type.
+    """
+    arrays = [
+        _column_array([rec.get(key) for rec in rows], field.type, encode_json, parse_datetime)
+        for key, field in zip(keys, schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _column_array(
+    values: List[Any],
+    type: pa.DataType,
+    encode_json: Callable[[Any], bytes],
+    parse_datetime: Callable[[Any], Any],
+) -> pa.Array:
+    if pa.types.is_string(type):
+        # JSON documents (and any other non-text value) are exported as JSON text
+        return pa.array(
+            [v if v is None or isinstance(v, str) else encode_json(v).decode() for v in values],
+            type=type,
+        )
+    if pa.types.is_list(type) and pa.types.is_string(type.value_type):
+        return pa.array(
+            [
+                v if v is None else [i if i is None or isinstance(i, str) else encode_json(i).decode() for i in v]
+                for v in values
+            ],
+            type=type,
+        )
+    if pa.types.is_decimal(type):
+        # Decimals are parsed from their text, so floats do not lose digits twice
+        return pa.array([v if v is None else str(v) for v in values], type=pa.string()).cast(type)
+    try:
+        return pa.array(values, type=type)
+    except _CONVERSION_ERRORS:
+        pass
+    # Date/time values arrive as ISO strings, numbers sometimes as text; Arrow
+    # parses both in C++, and anything it rejects goes through the Python parser
+    text = pa.array([v if v is None else str(v) for v in values], type=pa.string())
+    try:
+        return text.cast(type)
+    except _CONVERSION_ERRORS:
+        if not pa.types.is_temporal(type):
+            raise
+    return pa.array([parse_datetime(v) for v in values], type=type)
@@ -0,0 +1,184 @@
+"""Authentication strategies for the Mathesar JSON-RPC client.
+
+BasicAuth sends the username and password with every request. SessionAuth logs
+in once through Mathesar's Django login form and then authenticates RPC calls
+with the session cookie and CSRF token, so the server does not have to verify
+the password hash on every call. Expired sessions are renewed automatically.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin
+
+from .errors import MathesarClientError
+
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class Auth:
+    """Base class for authentication strategies.
+
+    The raw client asks ``prepare`` for extra request arguments before every
+    call. When ``rejected`` or ``rejected_reply`` report that the server refused
+    the credentials, the client calls ``login`` and retries the request once.
+    """
+
+    def prepare(self, transport: Any) -> Dict[str, Any]:
+        """Return extra keyword arguments for ``transport.post``."""
+        return {}
+
+    async def aprepare(self, transport: Any) -> Dict[str, Any]:
+        """Async counterpart of ``prepare``."""
+        return self.prepare(transport)
+
+    def rejected(self, response: Any) -> bool:
+        """Whether the HTTP response means the credentials were not accepted."""
+        return False
+
+    def rejected_reply(self, reply: Any) -> bool:
+        """Whether a decoded JSON-RPC reply means the credentials were not accepted."""
+        return False
+
+    def login(self, transport: Any) -> None:
+        """Renew the credentials after a rejection."""
+
+    async def alogin(self, transport: Any) -> None:
+        """Async counterpart of ``login``."""
+
+
+class BasicAuth(Auth):
+    """HTTP Basic authentication sent with every request.
+
+    Args:
+        username: Mathesar username.
+        password: Mathesar password.
+    """
+
+    def __init__(self, username: str, password: str):
+        self._credentials: Tuple[str, str] = (username, password)
+
+    def prepare(self, transport: Any) -> Dict[str, Any]:
+        return {"auth": self._credentials}
+
+
+class SessionAuth(Auth):
+    """Django session-cookie authentication.
+
+    On first use the client fetches the login page for a CSRF cookie, posts the
+    credentials to Mathesar's login form and keeps the resulting session cookie
+    in the transport's cookie jar. RPC calls then carry the session cookie and
+    the CSRF token instead of the password. A 401/403 response, a redirect to
+    the login page or an authentication error reply triggers a fresh login and
+    a single retry.
+
+    Args:
+        base_url: Base URL of the Mathesar instance.
+        username: Mathesar username.
+        password: Mathesar password.
+        login_path: Path of the login form relative to ``base_url``.
+    """
+
+    session_cookie = "sessionid"
+    csrf_cookie = "csrftoken"
+
+    def __init__(self, base_url: str, username: str, password: str, *, login_path: str = "auth/login/"):
+        self._base_url = base_url
+        self._login_url = urljoin(base_url, login_path)
+        self._login_path = "/" + login_path.lstrip("/")
+        self._username = username
+        self._password = password
+        self._lock = Lock()
+        self._async_lock: Optional[Any] = None
+        # Session cookie the current thread or task last sent, compared on rejection
+        self._sent_session: ContextVar[Optional[str]] = ContextVar(f"mathesar_session_{id(self)}", default=None)
+
+    def _headers(self, transport: Any) -> Dict[str, Any]:
+        self._sent_session.set(transport.cookies.get(self.session_cookie))
+        headers = {"Referer": self._base_url}
+        csrf = transport.cookies.get(self.csrf_cookie)
+        if csrf:
+            headers["X-CSRFToken"] = csrf
+        return {"headers": headers}
+
+    def _login_form(self, transport: Any) -> Dict[str, Any]:
+        csrf = transport.cookies.get(self.csrf_cookie) or ""
+        return {
+            "data": {"username": self._username, "password": self._password, "csrfmiddlewaretoken": csrf},
+            "headers": {"Referer": self._login_url, "X-CSRFToken": csrf},
+        }
+
+    @property
+    def _alock(self) -> Any:
+        # asyncio is imported only by clients that actually use it
+        if self._async_lock is None:
+            from asyncio import Lock as AsyncLock
+
+            self._async_lock = AsyncLock()
+        return self._async_lock
+
+    def _check_logged_in(self, transport: Any) -> None:
+        if not transport.cookies.get(self.session_cookie):
+            raise MathesarClientError(f"Login to {self._login_url} failed")
+
+    def prepare(self, transport: Any) -> Dict[str, Any]:
+        if not transport.cookies.get(self.session_cookie):
+            with self._lock:
+                # Another thread may have logged in while we waited
+                if not transport.cookies.get(self.session_cookie):
+                    self._login(transport)
+        return self._headers(transport)
+
+    async def aprepare(self, transport: Any) -> Dict[str, Any]:
+        if not transport.cookies.get(self.session_cookie):
+            async with self._alock:
+                if not transport.cookies.get(self.session_cookie):
+                    await self._alogin(transport)
+        return self._headers(transport)
+
+    def rejected(self, response: Any) -> bool:
+        if response.status_code in (401, 403):
+            return True
+        if response.status_code in _REDIRECT_CODES:
+            return self._login_path in response.headers.get("location", "")
+        # requests follows redirects, so the login page may be the final URL
+        return self._login_path in str(response.url)
+
+    def rejected_reply(self, reply: Any) -> bool:
+        replies = reply if isinstance(reply, list) else [reply]
+        return bool(replies) and all(
+            isinstance(r, dict) and "Authentication failed" in str(r.get("error", ""))
+            for r in replies
+        )
+
+    def _renewed(self, transport: Any) -> bool:
+        # Whether another thread or task replaced the rejected session already,
+        # so that requests rejected together log in only once
+        rejected = self._sent_session.get()
+        current = transport.cookies.get(self.session_cookie)
+        return rejected is not None and current is not None and current != rejected
+
+    def login(self, transport: Any) -> None:
+        with self._lock:
+            if not self._renewed(transport):
+                self._login(transport)
+
+    def _login(self, transport: Any) -> None:
+        transport.cookies.pop(self.session_cookie, None)
+        transport.request("GET", self._login_url)
+        transport.request("POST", self._login_url, **self._login_form(transport))
+        self._check_logged_in(transport)
+
+    async def alogin(self, transport: Any) -> None:
+        async with self._alock:
+            if not self._renewed(transport):
+                await self._alogin(transport)
+
+    async def _alogin(self, transport: Any) -> None:
+        transport.cookies.pop(self.session_cookie, None)
+        await transport.request("GET", self._login_url)
+        await transport.request("POST", self._login_url, **self._login_form(transport))
+        self._check_logged_in(transport)
@@ -0,0 +1,215 @@
+"""JSON-RPC 2.0 batching for the raw Mathesar client.
+
+A batch records calls made through the regular typed raw client methods and
+sends them together as one JSON-RPC array in a single HTTP round trip. Every
+queued call gets a Future that is resolved once the replies arrive.
+
+The AutoBatcher does the same transparently for calls made concurrently from
+many threads, coalescing everything issued within a short window. Only calls
+made under the same ``idempotent()`` marking, idempotency key and deadline
+share a batch, since these apply to the HTTP request as a whole.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextvars import Context, copy_context
+from dataclasses import dataclass, field
+from functools import wraps
+from os import getpid
+from threading import Condition
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .deadlines import deadline_at, remaining
+from .errors import DeadlineExceeded
+from .retry import idempotency_key, is_idempotent
+
+if TYPE_CHECKING:
+    from .client_raw import MathesarClientRaw
+
+
+@dataclass
+class PendingCall:
+    """A queued RPC call waiting for its reply.
+
+    Attributes:
+        method: JSON-RPC method name.
+        params: Call parameters.
+        parse: Optional converter applied to the call result.
+        future: Future resolved with the parsed result or the call's error.
+        context: Context of the caller, for calls sent from another thread.
+    """
+    method: str
+    params: Dict[str, Any]
+    parse: Optional[Callable[[Any], Any]] = None
+    future: Future = field(default_factory=Future)
+    context: Optional[Context] = None
+
+
+def _call_scope() -> Tuple[bool, Optional[str], Optional[float]]:
+    # Per-call state applied to the whole request: whether it may be retried,
+    # its Idempotency-Key and its deadline
+    return is_idempotent(), idempotency_key(), deadline_at()
+
+
+def resolve_calls(raw: MathesarClientRaw, calls: List[PendingCall]) -> None:
+    """Send ``calls`` as one batch and resolve their futures.
+
+    A failure of the whole request (HTTP or transport error) is set on every
+    future. Errors reported for a single call only fail that call's future.
+    A lone call is sent as a plain, non-batched request.
+    """
+    if not calls:
+        return
+    if len(calls) == 1:
+        c = calls[0]
+        try:
+            result = raw._post(c.method, c.params)
+            c.future.set_result(c.parse(result) if c.parse is not None else result)
+        except BaseException as e:
+            c.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        return
+    try:
+        replies = raw._post_batch([(c.method, c.params) for c in calls])
+    except BaseException as e:
+        for c in calls:
+            c.future.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+        return
+    for c, reply in zip(calls, replies):
+        try:
+            result = raw._unwrap(reply)
+            c.future.set_result(c.parse(result) if c.parse is not None else result)
+        except Exception as e:
+            c.future.set_exception(e)
+
+
+class RpcBatch:
+    """Collects raw client calls and sends them in one JSON-RPC batch request.
+
+    The batch exposes the same methods as MathesarClientRaw. Instead of
+    returning the parsed result, each method returns a Future that is resolved
+    when the batch is sent. Leaving the ``with`` block sends the batch; if the
+    block raises, queued calls are cancelled instead.
+
+    Args:
+        raw: The raw client whose transport and credentials are used.
+
+    Example:
+        >>> with raw.batch() as b:
+        ...     table = b.tables_get(table_oid=123, database_id=1)
+        ...     columns = b.columns_list(table_oid=123, database_id=1)
+        >>> table.result().name, len(columns.result())
+    """
+
+    def __init__(self, raw: MathesarClientRaw):
+        self._raw = raw
+        self._calls: List[PendingCall] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        if name.startswith("_") or name in ("batch", "close") or name.endswith("_stream"):
+            raise AttributeError(name)
+        method = getattr(self._raw, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        @wraps(method)
+        def queue(*args: Any, **kwargs: Any) -> Future:
+            self._raw._local.batch = self
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._raw._local.batch = None
+
+        return queue
+
+    def _enqueue(self, method: str, params: Dict[str, Any], parse: Optional[Callable[[Any], Any]]) -> Future:
+        call = PendingCall(method, params, parse)
+        self._calls.append(call)
+        return call.future
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def send(self) -> None:
+        """Send all queued calls in one request and resolve their futures."""
+        calls, self._calls = self._calls, []
+        resolve_calls(self._raw, calls)
+
+    def cancel(self) -> None:
+        """Drop all queued calls without sending them."""
+        calls, self._calls = self._calls, []
+        for c in calls:
+            c.future.cancel()
+
+    def __enter__(self) -> RpcBatch:
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.send()
+        else:
+            self.cancel()
+
+
+class AutoBatcher:
+    """Coalesces RPC calls made concurrently from many threads into batches.
+
+    The first thread to submit a call becomes the leader of a new batch. It
+    waits up to ``window`` seconds (or until ``max_size`` calls are queued),
+    sends everything queued so far as one JSON-RPC batch and resolves the
+    futures. Every other thread just blocks on its own call's future, so each
+    caller still gets its own typed result or MathesarClientError. Calls made
+    under different ``idempotent()`` blocks or deadlines are sent as separate
+    requests, each in the context of the thread that made it.
+
+    Args:
+        raw: The raw client used to send the batches.
+        window: Maximum time in seconds the leader waits for more calls.
+        max_size: Number of queued calls that triggers an immediate send.
+    """
+
+    def __init__(self, raw: MathesarClientRaw, *, window: float = 0.002, max_size: int = 50):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._raw = raw
+        self.window = window
+        self.max_size = max_size
+        self._reset()
+
+    def _reset(self) -> None:
+        self._cond = Condition()
+        self._pending: List[Tuple[Tuple[bool, Optional[str], Optional[float]], PendingCall]] = []
+        self._pid = getpid()
+
+    def submit(self, method: str, params: Dict[str, Any], parse: Optional[Callable[[Any], Any]]) -> Any:
+        """Queue a call, wait for its batch to be sent and return the parsed result."""
+        if self._pid != getpid():
+            # Threads (and possibly a held lock) do not survive os.fork()
+            self._reset()
+        call = PendingCall(method, params, parse, context=copy_context())
+        with self._cond:
+            self._pending.append((_call_scope(), call))
+            leader = len(self._pending) == 1
+            if leader:
+                self._cond.wait_for(lambda: len(self._pending) >= self.max_size, timeout=self.window)
+                calls, self._pending = self._pending, []
+            elif len(self._pending) >= self.max_size:
+                self._cond.notify_all()
+        if leader:
+            scopes: Dict[Tuple[bool, Optional[str], Optional[float]], List[PendingCall]] = {}
+            for scope, pending in calls:
+                scopes.setdefault(scope, []).append(pending)
+            for group in scopes.values():
+                for start in range(0, len(group), self.max_size):
+                    chunk = group[start:start + self.max_size]
+                    context = chunk[0].context
+                    assert context is not None
+                    context.run(resolve_calls, self._raw, chunk)
+        try:
+            return call.future.result(timeout=remaining())
+        except FutureTimeoutError as e:
+            raise DeadlineExceeded("Deadline exceeded while waiting for a batched call") from e
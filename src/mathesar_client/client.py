@@ -12,12 +12,16 @@ Features:
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Literal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Literal
+from contextlib import AbstractContextManager
+from array import array
 from datetime import datetime
-import json
 from pydantic import BaseModel
 
 from .client_raw import MathesarClientRaw
+from .filters import Condition
+from .paging import ordered_map, prefetched
+from .stream import DEFAULT_CHUNK_SIZE
 from .client_raw_models import (
     # Columns
     ColumnInfo,
@@ -26,6 +30,10 @@ from .client_raw_models import (
     SettableColumnInfo,
     # Records
     OrderBy,
+    Filter,
+    FilterAttnum,
+    FilterLiteral,
+    Grouping,
     RecordList as RawRecordList,
     RecordAdded as RawRecordAdded,
     SearchParam,
@@ -75,6 +83,153 @@ from .client_raw_models import (
     UserDef,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from .dataframe import FrameBuilder
+
+
+def _json_parser(decode: Callable[[bytes], Any]) -> Callable[[Any], Any]:
+    def parse_json(value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        try:
+            return decode(value.encode())
+        except Exception:
+            return value
+
+    return parse_json
+
+
+def _parse_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        # Handles plain dates and the trailing 'Z' as well
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    s = value.strip()
+    # Drop historical suffixes like ' AD'/' BC' if present
+    if s.endswith(" AD"):
+        s = s[:-3].strip()
+    if s.endswith(" BC"):
+        s = s[:-3].strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        return value
+
+
+def _converter(col_type: str, parse_json: Callable[[Any], Any]) -> Optional[Callable[[Any], Any]]:
+    """Converter for string values of a column type, or None to keep values as-is."""
+    col_type = col_type.lower()
+    if "json" in col_type:
+        return parse_json
+    if "date" in col_type or "timestamp" in col_type or "datetime" in col_type:
+        return _parse_datetime
+    return None
+
+
+# array.array typecodes for the column types whose values always fit one
+_ARRAY_TYPECODES = {
+    "smallint": "q",
+    "integer": "q",
+    "bigint": "q",
+    "real": "d",
+    "double precision": "d",
+}
+
+# Per-column plan entry: output name, value converter and the attnum string
+# indexing linked record summaries (None for keys that are not attnums)
+_Step = Tuple[str, Optional[Callable[[Any], Any]], Optional[str]]
+
+
+class _ColumnPlan:
+    """Row enrichment compiled from one column list.
+
+    Maps each raw row key (the attnum as a string) straight to the output
+    column name and value converter, so enriching a cell is a dict lookup and
+    at most one call. JSON columns are parsed with the raw client's codec.
+    """
+
+    __slots__ = ("columns", "steps", "typecodes", "pk_key", "pk_attnum")
+
+    def __init__(self, columns: List[ColumnInfo], decode_json: Callable[[bytes], Any]):
+        self.columns = columns
+        parse_json = _json_parser(decode_json)
+        self.steps: Dict[str, _Step] = {
+            str(c.id): (c.name, _converter(c.type or "", parse_json), str(c.id)) for c in columns
+        }
+        self.typecodes = {str(c.id): _ARRAY_TYPECODES.get((c.type or "").lower()) for c in columns}
+        # Use the first primary key column if the key is composite
+        self.pk_attnum: Optional[int] = next((c.id for c in columns if c.primary_key), None)
+        self.pk_key = str(self.pk_attnum) if self.pk_attnum is not None else None
+
+    def columnar(self, rows: List[Dict[str, Any]], arrays: bool = False) -> Dict[str, Any]:
+        """Values of ``rows`` per column name, converted column by column.
+
+        Keys that are not attnums of the columns are left out.
+        """
+        columns: Dict[str, Any] = {}
+        for key, (name, convert, _) in self.steps.items():
+            values = [rec.get(key) for rec in rows]
+            if convert is not None:
+                values = [convert(v) for v in values]
+            columns[name] = self.column(key, values, arrays)
+        return columns
+
+    def column(self, key: str, values: List[Any], arrays: bool) -> Any:
+        # Converted values of one column, as an array.array if requested and possible
+        typecode = self.typecodes[key] if arrays else None
+        if typecode is not None:
+            try:
+                return array(typecode, values)
+            except (TypeError, OverflowError):
+                # Nulls (or out of range values) keep the list
+                pass
+        return values
+
+    def resolve(self, key: Any) -> _Step:
+        # Keys that are not in canonical form, e.g. ints or unknown attnums
+        try:
+            att = int(key)
+        except (ValueError, TypeError):
+            # unexpected key, keep as-is
+            return (key, None, None)
+        step = self.steps.get(str(att))
+        return step if step is not None else (str(att), None, str(att))
+
+
+class _ColumnBuffers:
+    """Per-column lists filled one raw row at a time.
+
+    Used for streamed replies: each parsed row's values are converted and
+    appended to their column as the row arrives, so the rows of a page are
+    never held together.
+    """
+
+    __slots__ = ("plan", "lists", "cells")
+
+    def __init__(self, plan: _ColumnPlan):
+        self.plan = plan
+        self.lists: Dict[str, List[Any]] = {key: [] for key in plan.steps}
+        self.cells = [(key, convert, self.lists[key].append) for key, (_, convert, _) in plan.steps.items()]
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        get = rec.get
+        for key, convert, append in self.cells:
+            value = get(key)
+            append(value if convert is None else convert(value))
+
+    def columns(self, arrays: bool = False) -> Dict[str, Any]:
+        """Column names mapped to their values; see ``_ColumnPlan.columnar``."""
+        steps = self.plan.steps
+        return {steps[key][0]: self.plan.column(key, values, arrays) for key, values in self.lists.items()}
+
 
 class LinkedRecordRef(SummarizedRecordReference):
     """A reference to a linked record enriched with summary text.
@@ -96,6 +251,52 @@ class RecordsPage(BaseModel):
     results: List[Dict[str, Any]]
 
 
+class ColumnarPage(BaseModel):
+    """A page of records as one sequence per column, without per-row dicts.
+
+    Attributes:
+        count: Total number of records matching the query.
+        columns: Column names mapped to their values in row order. Integer and
+                 floating point columns are ``array.array`` when arrays were
+                 requested and the page has no nulls in them; others are lists.
+    """
+    count: int
+    columns: Dict[str, Any]
+
+
+class RecordGroup(BaseModel):
+    """Records of one group of a grouped query.
+
+    Attributes:
+        id: Group identifier assigned by the server.
+        count: Number of records in the group, as counted by the server.
+        key: Grouping column names mapped to the (preprocessed) values defining the group.
+        results: Records of the page that belong to the group, in page order.
+    """
+    id: int
+    count: int
+    key: Dict[str, Any]
+    results: List[Dict[str, Any]]
+
+
+class GroupedRecordsPage(RecordsPage):
+    """A page of records together with their server-side grouping.
+
+    Attributes:
+        groups: Groups in the order returned by the server, each with its records.
+    """
+    groups: List[RecordGroup]
+
+
+def _after_key(key: OrderBy, value: Any, where: Optional[Filter] = None) -> Filter:
+    """Filter for the rows after ``value`` in the direction of the ``key`` ordering, within ``where``."""
+    after = Filter(
+        type="greater" if key.direction == "asc" else "lesser",
+        args=[FilterAttnum(value=key.attnum), FilterLiteral(value=value)],
+    )
+    return Filter(type="and", args=[where, after]) if where is not None else after
+
+
 class MathesarClient:
     """High-level ergonomic client for Mathesar API.
     
@@ -106,6 +307,9 @@ class MathesarClient:
     - Name-based lookups
     - Convenience methods for common operations
     
+    All Database, Schema and Table handles created from one client share its raw
+    client and therefore its pooled HTTP transport.
+    
     Args:
         raw: Optional MathesarClientRaw instance. If not provided, creates one using
              environment variables (MATHESAR_BASE_URL, MATHESAR_USERNAME, MATHESAR_PASSWORD).
@@ -121,6 +325,30 @@ class MathesarClient:
     def __init__(self, raw: Optional[MathesarClientRaw] = None):
         self.raw = raw or MathesarClientRaw()
 
+    def close(self) -> None:
+        """Close pooled connections of the underlying raw client."""
+        self.raw.close()
+
+    def deadline(self, seconds: float) -> AbstractContextManager[None]:
+        """Limit a whole multi-call operation to ``seconds``.
+
+        Every RPC made inside the ``with`` block, including retries, shares the
+        budget: each call gets the time left as its timeout, and DeadlineExceeded
+        is raised as soon as the budget runs out.
+
+        Example:
+            >>> with client.deadline(2.0):
+            ...     table = client.database(1).schema_by_name("public").table_by_name("users")
+            ...     page = table.records_list(limit=10)
+        """
+        return self.raw.deadline(seconds)
+
+    def __enter__(self) -> MathesarClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def database(self, database_id: int) -> Database:
         """Get a Database object for the specified database.
         
@@ -638,6 +866,7 @@ class Table:
         self._columns_cache: Optional[List[ColumnInfo]] = None
         self._attnum_to_name: Optional[Dict[int, str]] = None
         self._name_to_attnum: Optional[Dict[str, int]] = None
+        self._plan: Optional[_ColumnPlan] = None
 
     # ----- Columns helpers -----
     def columns(self, use_cache: bool = True) -> List[ColumnInfo]:
@@ -655,6 +884,10 @@ class Table:
             self._name_to_attnum = {c.name: c.id for c in self._columns_cache}
         return self._columns_cache
 
+    def _cached_columns(self) -> List[ColumnInfo]:
+        """Columns used by the synchronous record transforms."""
+        return self.columns()
+
     def _ensure_column_maps(self):
         """Ensure column name/attnum mappings are loaded."""
         if self._attnum_to_name is None or self._name_to_attnum is None:
@@ -681,6 +914,12 @@ class Table:
                 mapped.append(self._colname_to_attnum(v))
         return mapped
 
+    def _filter_from_names(self, where: Optional[Condition | Filter]) -> Optional[Filter]:
+        # Column names in a filter expression are resolved through the column cache
+        if where is None or isinstance(where, Filter):
+            return where
+        return where.compile(lambda column: self._map_names_or_attnums([column])[0])
+
     # ----- Record transforms -----
     def _order_by_from_names(self, order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]]) -> Optional[List[OrderBy]]:
         if not order_by:
@@ -690,88 +929,108 @@ class Table:
             for name, direction in order_by
         ]
 
-    def _enrich_records(self, record_list: RawRecordList) -> RecordsPage:
-        cols = self.columns()
-        att_to_name = {c.id: c.name for c in cols}
-        att_to_type = {c.id: (c.type or "").lower() for c in cols}
+    @staticmethod
+    def _linked_map(record_list: RawRecordList) -> Dict[str, Dict[str, str]]:
         # Support both spellings from backend and normalize keys to str
         raw_linked = (
             getattr(record_list, "linked_record_summaries", None)
             or getattr(record_list, "linked_record_smmaries", None)  # legacy misspelling
             or {}
         )
-        linked_map: Dict[str, Dict[str, str]] = {str(k): v for k, v in raw_linked.items()}  # row-id -> {attnum: summary}
+        return {str(k): v for k, v in raw_linked.items()}  # row-id -> {attnum: summary}
 
-        # Determine the primary key attnum (use first PK if composite), if present
-        pk_attnum: Optional[int] = None
-        for col in self.columns():
-            if col.primary_key:
-                pk_attnum = col.id
-                break
+    def _enrich_records(self, record_list: RawRecordList) -> RecordsPage:
+        linked_map = self._linked_map(record_list)
+        # The rows were just built here, so validating them again would only copy them
+        return RecordsPage.model_construct(
+            count=record_list.count,
+            results=list(self._enrich_rows(record_list.results, linked_map)),
+        )
 
-        enriched: List[Dict[str, Any]] = []
-        for rec in record_list.results:
+    def _column_buffers(self) -> _ColumnBuffers:
+        return _ColumnBuffers(self._column_plan())
+
+    def _columnar_page(self, record_list: RawRecordList, arrays: bool) -> ColumnarPage:
+        columns = self._column_plan().columnar(record_list.results, arrays)
+        return ColumnarPage.model_construct(count=record_list.count, columns=columns)
+
+    def _group_records(self, record_list: RawRecordList) -> GroupedRecordsPage:
+        page = self._enrich_records(record_list)
+        rows = page.results
+        groups: List[RecordGroup] = []
+        if record_list.grouping is not None:
+            # result_indices point into the page, so each row is visited once
+            # overall; the enriched rows are shared, not validated again
+            for g in record_list.grouping.groups:
+                groups.append(RecordGroup.model_construct(
+                    id=g.id,
+                    count=g.count,
+                    key={self._attnum_to_colname(eq["id"]): eq["value"] for eq in g.results_eq},
+                    results=[rows[i] for i in g.result_indices],
+                ))
+        return GroupedRecordsPage.model_construct(count=page.count, results=rows, groups=groups)
+
+    def _enrich_rows(
+        self,
+        records: Iterable[Dict[str, Any]],
+        linked_map: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        return map(self._record_enricher(linked_map), records)
+
+    def _column_plan(self) -> _ColumnPlan:
+        # Compiled once per column cache; a reload of the columns replaces the
+        # cached list, which makes the plan stale
+        cols = self._cached_columns()
+        plan = self._plan
+        if plan is None or plan.columns is not cols:
+            plan = self._plan = _ColumnPlan(cols, self._raw.codec.decode)
+        return plan
+
+    def _record_enricher(
+        self,
+        linked_map: Optional[Dict[str, Dict[str, str]]] = None,
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        # Enriches one row at a time, so streamed rows never form a full page
+        plan = self._column_plan()
+        steps = plan.steps
+        resolve = plan.resolve
+        # Only columns that actually have summaries on this page are wrapped
+        linked = {k: v for k, v in (linked_map or {}).items() if v}
+
+        if not linked:
+            def enrich(rec: Dict[str, Any]) -> Dict[str, Any]:
+                row: Dict[str, Any] = {}
+                for k, v in rec.items():
+                    step = steps.get(k) or resolve(k)
+                    convert = step[1]
+                    row[step[0]] = v if convert is None or v is None else convert(v)
+                return row
+
+            return enrich
+
+        pk_key = plan.pk_key
+        pk_attnum = plan.pk_attnum
+
+        def enrich_linked(rec: Dict[str, Any]) -> Dict[str, Any]:
             row: Dict[str, Any] = {}
-            # Resolve the identifier to index linked summaries per row
-            pk_value: Optional[Any] = None
-            if pk_attnum is not None:
-                # keys in results may be strings, so try both
-                pk_value = rec.get(str(pk_attnum))
-                if pk_value is None:
-                    pk_value = rec.get(pk_attnum)  # type: ignore[index]
-
-            # keys may be string attnums; normalize to ints when possible
+            # Linked summaries are indexed by the row's primary key value;
+            # keys in results may be strings, so try both
+            pk_value = rec.get(pk_key) if pk_key is not None else None
+            if pk_value is None and pk_attnum is not None:
+                pk_value = rec.get(pk_attnum)  # type: ignore[call-overload]
+            pk_str = str(pk_value) if pk_value is not None else None
             for k, v in rec.items():
-                try:
-                    att = int(k)
-                except (ValueError, TypeError):
-                    # unexpected key, keep as-is
-                    row[k] = v
-                    continue
-                colname = att_to_name.get(att, str(att))
-                # If we have linked summary for this row and column, wrap it
-                linked_records = linked_map.get(str(att), {})
-                linked_summary = linked_records.get(str(pk_value), None) if pk_value is not None else None
-                if linked_records and v is not None:
+                step = steps.get(k) or resolve(k)
+                links = linked.get(step[2]) if step[2] is not None else None
+                if links is not None and v is not None:
                     # Return plain dict with id and summary for linked columns
-                    row[colname] = {"id": v, "summary": linked_summary}
-                else:
-                    # Optionally convert JSON and date/datetime-like strings into Python objects
-                    if isinstance(v, str):
-                        col_type = att_to_type.get(att, "")
-                        # Parse JSON first if column type is JSON/JSONB
-                        if "json" in col_type:
-                            try:
-                                row[colname] = json.loads(v)
-                                continue
-                            except Exception:
-                                pass
-                        if "date" in col_type or "timestamp" in col_type or "datetime" in col_type:
-                            s = v.strip()
-                            # Drop historical suffixes like ' AD'/' BC' if present
-                            if s.endswith(" AD"):
-                                s = s[:-3].strip()
-                            if s.endswith(" BC"):
-                                s = s[:-3].strip()
-                            # Replace trailing 'Z' with +00:00 for fromisoformat
-                            if s.endswith("Z"):
-                                s = s[:-1] + "+00:00"
-                            parsed: Optional[datetime] = None
-                            try:
-                                parsed = datetime.fromisoformat(s)
-                            except Exception:
-                                # Fallbacks for plain dates
-                                try:
-                                    if len(s) == 10 and s[4] == "-" and s[7] == "-":
-                                        parsed = datetime.strptime(s, "%Y-%m-%d")
-                                except Exception:
-                                    parsed = None
-                            if parsed is not None:
-                                row[colname] = parsed
-                                continue
-                    row[colname] = v
-            enriched.append(row)
-        return RecordsPage(count=record_list.count, results=enriched)
+                    row[step[0]] = {"id": v, "summary": links.get(pk_str) if pk_str is not None else None}
+                    continue
+                convert = step[1]
+                row[step[0]] = v if convert is None or v is None else convert(v)
+            return row
+
+        return enrich_linked
 
     # ----- Records API (high-level) -----
     def records_list(
@@ -780,8 +1039,11 @@ class Table:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
         return_record_summaries: bool = True,
-    ) -> RecordsPage:
+        format: Literal["rows", "columnar"] = "rows",
+        arrays: bool = False,
+    ) -> RecordsPage | ColumnarPage:
         """List records from this table with enriched column names.
         
         This method returns records with column names as keys (instead of attnums)
@@ -792,10 +1054,20 @@ class Table:
             offset: Number of records to skip.
             order_by: List of (column_name, direction) tuples for sorting.
                      Example: [("created_at", "desc"), ("name", "asc")]
+            filter: Filter expression built with ``col()``, e.g.
+                    ``(col("status") == "open") & (col("age") > 30)``, or a raw Filter.
+                    Filtering runs on the server.
             return_record_summaries: Whether to include summaries of linked records.
+                                     Ignored in columnar format.
+            format: "rows" (default) returns a dict per record. "columnar" returns a
+                    ColumnarPage with one sequence per column. The reply is then
+                    streamed, and each row's values are appended to their columns
+                    as the row is parsed, so the page is never held as row dicts.
+            arrays: In columnar format, return integer and floating point columns
+                    without nulls as ``array.array`` (usable with ``numpy.frombuffer``).
         
         Returns:
-            RecordsPage with count and enriched results.
+            RecordsPage with count and enriched results, or a ColumnarPage.
         
         Example:
             >>> page = table.records_list(
@@ -804,18 +1076,544 @@ class Table:
             ... )
             >>> for record in page.results:
             ...     print(record["email"], record["full_name"])
+            >>> scores = table.records_list(format="columnar", arrays=True).columns["score"]
         """
+        if format not in ("rows", "columnar"):
+            raise ValueError(f"Unknown records format: {format!r}")
         order = self._order_by_from_names(order_by)
+        if format == "columnar":
+            buffers = self._column_buffers()
+            with self._raw.records_list_stream(
+                database_id=self.database_id,
+                table_id=self.table_oid,
+                limit=limit,
+                offset=offset,
+                order=order,
+                filter=self._filter_from_names(filter),
+            ) as stream:
+                for rec in stream:
+                    buffers.add(rec)
+            return ColumnarPage.model_construct(count=stream.count, columns=buffers.columns(arrays))
         raw = self._raw.records_list(
             database_id=self.database_id,
             table_id=self.table_oid,
             limit=limit,
             offset=offset,
             order=order,
+            filter=self._filter_from_names(filter),
             return_record_summaries=return_record_summaries,
         )
         return self._enrich_records(raw)
 
+    def records_grouped(
+        self,
+        group_by: List[int | str],
+        *,
+        preproc: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        return_record_summaries: bool = True,
+    ) -> GroupedRecordsPage:
+        """List records grouped by columns, with the groups computed by the server.
+
+        Each group carries the server's count of its records and the records of
+        the returned page that belong to it, so per-category summaries need no
+        client-side pass over the rows.
+
+        Args:
+            group_by: Names (or attnums) of the columns to group by.
+            preproc: Optional preprocessing applied to each grouping column before
+                     grouping, e.g. ``["truncate_to_month"]`` for a timestamp column.
+            limit: Maximum number of records to return.
+            offset: Number of records to skip.
+            order_by: List of (column_name, direction) tuples for sorting.
+            filter: Filter expression built with ``col()``, or a raw Filter.
+            return_record_summaries: Whether to include summaries of linked records.
+
+        Returns:
+            GroupedRecordsPage with the enriched records and their groups.
+
+        Example:
+            >>> page = table.records_grouped(["status"], limit=500)
+            >>> for group in page.groups:
+            ...     print(group.key["status"], group.count, len(group.results))
+        """
+        raw = self._raw.records_list(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=limit,
+            offset=offset,
+            order=self._order_by_from_names(order_by),
+            filter=self._filter_from_names(filter),
+            grouping=Grouping(columns=self._map_names_or_attnums(group_by), preproc=preproc),
+            return_record_summaries=return_record_summaries,
+        )
+        return self._group_records(raw)
+
+    def records_stream(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream records from this table one at a time, with enriched column names.
+
+        Rows are parsed incrementally from the response and enriched as they
+        arrive, so memory use stays bounded by the row size even for very large
+        pages. Linked record summaries are not inlined in this mode.
+
+        Args:
+            limit: Maximum number of records to return.
+            offset: Number of records to skip.
+            order_by: List of (column_name, direction) tuples for sorting.
+            filter: Filter expression built with ``col()``, e.g.
+                    ``(col("status") == "open") & (col("age") > 30)``, or a raw Filter.
+                    Filtering runs on the server.
+            chunk_size: Number of bytes read from the response body at a time.
+
+        Returns:
+            Iterator over record dictionaries with column names as keys.
+
+        Example:
+            >>> for record in table.records_stream(limit=50000):
+            ...     print(record["email"])
+        """
+        enrich = self._record_enricher()
+        stream = self._raw.records_list_stream(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=limit,
+            offset=offset,
+            order=self._order_by_from_names(order_by),
+            filter=self._filter_from_names(filter),
+            chunk_size=chunk_size,
+        )
+        with stream:
+            for rec in stream:
+                yield enrich(rec)
+
+    def _keyset_order(self, order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]]) -> OrderBy:
+        """Primary key ordering used for keyset pagination.
+
+        Raises:
+            ValueError: If the table has no single-column primary key, or if
+                        ``order_by`` names anything but that column.
+        """
+        pks = [c for c in self._cached_columns() if c.primary_key]
+        if len(pks) != 1:
+            raise ValueError("Keyset pagination needs a table with a single-column primary key")
+        pk = pks[0]
+        if not order_by:
+            return OrderBy(attnum=pk.id, direction="asc")
+        if len(order_by) == 1 and self._colname_to_attnum(order_by[0][0]) == pk.id:
+            return OrderBy(attnum=pk.id, direction=order_by[0][1])
+        raise ValueError(f"Keyset pagination orders by the primary key; order_by may only name '{pk.name}'")
+
+    def _scan(
+        self,
+        page_size: int,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]],
+        filter: Optional[Condition | Filter],
+        pagination: Literal["offset", "keyset"],
+        return_record_summaries: bool,
+    ) -> Iterator[RawRecordList]:
+        # Pages of a full-table scan. Names are resolved here, so that errors
+        # surface in the caller and not in the prefetch thread
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if pagination not in ("offset", "keyset"):
+            raise ValueError(f"Unknown pagination mode: {pagination!r}")
+        self._cached_columns()
+        keyset = self._keyset_order(order_by) if pagination == "keyset" else None
+        order = self._order_by_from_names(order_by)
+        where = self._filter_from_names(filter)
+        return self._pages(page_size, order, return_record_summaries, keyset, where)
+
+    def _pages(
+        self,
+        page_size: int,
+        order: Optional[List[OrderBy]],
+        return_record_summaries: bool,
+        keyset: Optional[OrderBy] = None,
+        where: Optional[Filter] = None,
+    ) -> Iterator[RawRecordList]:
+        # Raw pages of the whole table (or the rows matching ``where``), ending
+        # with the first short page. With a keyset ordering, each page starts
+        # after the last key seen instead of at an offset, so the server never
+        # walks past skipped rows.
+        offset = 0
+        filter = where
+        while True:
+            page = self._raw.records_list(
+                database_id=self.database_id,
+                table_id=self.table_oid,
+                limit=page_size,
+                offset=None if keyset else offset,
+                order=[keyset] if keyset else order,
+                filter=filter,
+                return_record_summaries=return_record_summaries,
+            )
+            yield page
+            offset += len(page.results)
+            # With a keyset filter, count only covers the rows after the previous page
+            left = page.count - (len(page.results) if keyset else offset)
+            if len(page.results) < page_size or left <= 0:
+                return
+            if keyset:
+                filter = _after_key(keyset, page.results[-1][str(keyset.attnum)], where)
+
+    def iter_records(
+        self,
+        *,
+        page_size: int = 500,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        return_record_summaries: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all records of this table, page by page, with enriched column names.
+
+        The next pages are fetched in a background thread while the rows of the
+        current one are consumed. At most ``prefetch`` fetched pages are
+        buffered, so memory use stays bounded however large the table is.
+
+        Args:
+            page_size: Number of records fetched per call.
+            order_by: List of (column_name, direction) tuples for sorting. Give a
+                      stable order (e.g. by a unique column) if the table may change
+                      during the scan.
+            filter: Filter expression built with ``col()``, e.g.
+                    ``(col("status") == "open") & (col("age") > 30)``, or a raw Filter.
+                    Filtering runs on the server.
+            prefetch: Number of pages fetched ahead of the consumer. 0 fetches each
+                      page only when the previous one has been consumed.
+            pagination: "offset" (default) pages with limit/offset. "keyset" orders
+                        by the primary key and fetches each page with a filter on the
+                        last key seen, so every page costs the same however deep the
+                        scan is. It needs a single-column primary key, and ``order_by``
+                        may then only give that column's direction. Pages cannot be
+                        fetched ahead of the previous one in this mode, but the
+                        prefetch thread still overlaps them with the consumer.
+            return_record_summaries: Whether to include summaries of linked records.
+
+        Returns:
+            Iterator over record dictionaries with column names as keys.
+
+        Raises:
+            ValueError: If keyset pagination is not possible for this table or ordering.
+
+        Example:
+            >>> for record in table.iter_records(page_size=1000, pagination="keyset", prefetch=2):
+            ...     print(record["email"])
+        """
+        pages = self._scan(page_size, order_by, filter, pagination, return_record_summaries)
+        for page in prefetched(pages, prefetch):
+            yield from self._enrich_rows(page.results, self._linked_map(page))
+
+    def iter_columns(
+        self,
+        *,
+        page_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        arrays: bool = False,
+    ) -> Iterator[ColumnarPage]:
+        """Iterate over all records of this table as columnar pages.
+
+        The columnar counterpart of iter_records: pages are fetched the same way
+        (with background prefetch and optional keyset pagination), and each one
+        is yielded as a ColumnarPage instead of as row dicts.
+
+        Args:
+            page_size: Number of records per page.
+            order_by: List of (column_name, direction) tuples for sorting.
+            filter: Filter expression built with ``col()``, or a raw Filter.
+            prefetch: Number of pages fetched ahead of the consumer.
+            pagination: "offset" or "keyset". See iter_records.
+            arrays: Return integer and floating point columns without nulls as
+                    ``array.array``. See records_list.
+
+        Returns:
+            Iterator over ColumnarPage objects, one per fetched page.
+
+        Example:
+            >>> total = sum(sum(page.columns["amount"]) for page in table.iter_columns(arrays=True))
+        """
+        for page in prefetched(self._scan(page_size, order_by, filter, pagination, False), prefetch):
+            yield self._columnar_page(page, arrays)
+
+    def _arrow_batches(self) -> Tuple[pa.Schema, Callable[[RawRecordList], pa.RecordBatch]]:
+        # Schema of the cached columns and a builder turning raw pages into its batches
+        from .arrow import arrow_schema, record_batch
+
+        schema, keys = arrow_schema(self._cached_columns())
+        encode = self._raw.codec.encode
+        return schema, lambda page: record_batch(page.results, schema, keys, encode, _parse_datetime)
+
+    def iter_arrow_batches(
+        self,
+        *,
+        batch_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+    ) -> Iterator[pa.RecordBatch]:
+        """Iterate over all records of this table as Arrow record batches.
+
+        Each fetched page is converted column by column into one record batch
+        and then dropped, so at most ``prefetch + 1`` pages exist as Python
+        objects at a time. Fields are named after the columns and typed from
+        their metadata: integers, floats, booleans, dates and timestamps map to
+        the Arrow types of the same width, numerics with a precision to
+        decimals, arrays to lists of their item type, and JSON, text and all
+        other types to strings. Requires pyarrow.
+
+        Args:
+            batch_size: Number of records per page, and so per batch.
+            order_by: List of (column_name, direction) tuples for sorting.
+            filter: Filter expression built with ``col()``, or a raw Filter.
+            prefetch: Number of pages fetched ahead of the consumer.
+            pagination: "offset" or "keyset". See iter_records.
+
+        Returns:
+            Iterator over ``pyarrow.RecordBatch`` objects sharing one schema.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        Example:
+            >>> import pyarrow.parquet as pq
+            >>> batches = table.iter_arrow_batches(batch_size=50_000)
+            >>> first = next(batches)
+            >>> with pq.ParquetWriter("orders.parquet", first.schema) as writer:
+            ...     writer.write_batch(first)
+            ...     for batch in batches:
+            ...         writer.write_batch(batch)
+        """
+        pages = self._scan(batch_size, order_by, filter, pagination, False)
+        _, build = self._arrow_batches()
+        for page in prefetched(pages, prefetch):
+            yield build(page)
+
+    def to_arrow(
+        self,
+        *,
+        batch_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+    ) -> pa.Table:
+        """Fetch all records of this table (or those matching ``filter``) as an Arrow table.
+
+        The table is assembled from the batches of iter_arrow_batches without
+        copying them, so the records never exist as Python objects all at once.
+        Arguments are those of iter_arrow_batches. Requires pyarrow.
+
+        Returns:
+            A ``pyarrow.Table``; empty, with the full schema, if no records match.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        Example:
+            >>> import duckdb
+            >>> orders_arrow = table.to_arrow(filter=col("status") == "open")
+            >>> duckdb.sql("SELECT customer, sum(amount) FROM orders_arrow GROUP BY 1")
+        """
+        import pyarrow as pa
+
+        schema, _ = self._arrow_batches()
+        batches = self.iter_arrow_batches(
+            batch_size=batch_size, order_by=order_by, filter=filter, prefetch=prefetch, pagination=pagination
+        )
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def _frame_builder(self, columns: Optional[List[int | str]], max_categories: int) -> FrameBuilder:
+        # Builder for the selected columns, in the order given
+        from .dataframe import FrameBuilder
+
+        cols = self._cached_columns()
+        if columns is not None:
+            by_attnum = {c.id: c for c in cols}
+            attnums = self._map_names_or_attnums(columns)
+            unknown = [a for a in attnums if a not in by_attnum]
+            if unknown:
+                raise KeyError(f"Unknown column attnums: {unknown}")
+            cols = [by_attnum[a] for a in attnums]
+        return FrameBuilder(cols, _json_parser(self._raw.codec.decode), _parse_datetime, max_categories)
+
+    def to_pandas(
+        self,
+        *,
+        filter: Optional[Condition | Filter] = None,
+        columns: Optional[List[int | str]] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        page_size: int = 10000,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        max_categories: int = 1000,
+    ) -> pd.DataFrame:
+        """Fetch all records of this table (or those matching ``filter``) as a pandas DataFrame.
+
+        Dtypes are taken from the column metadata instead of being inferred
+        from the values: integers become nullable ``Int16``/``Int32``/``Int64``,
+        floating point and numeric columns nullable ``Float32``/``Float64``,
+        booleans ``boolean``, and dates and timestamps ``datetime64[us]``
+        (in UTC for timestamps with time zone). Text columns with few distinct
+        values become categoricals, other text columns ``string``, and JSON
+        and all other types keep the values records_list returns.
+
+        The frame is filled one page at a time into buffers sized from the
+        record count of the first page, and the columns are converted one at a
+        time at the end. Peak memory is about 1.1x the size of the final frame
+        in ``benchmarks/bench_to_pandas.py``, plus ``prefetch + 1`` raw pages.
+        Requires pandas.
+
+        Args:
+            filter: Filter expression built with ``col()``, or a raw Filter.
+            columns: Names (or attnums) of the columns to include, in order.
+                     All columns by default. Other columns are still fetched,
+                     but never converted.
+            order_by: List of (column_name, direction) tuples for sorting.
+            page_size: Number of records fetched per call.
+            prefetch: Number of pages fetched ahead of the conversion.
+            pagination: "offset" or "keyset". See iter_records.
+            max_categories: Text columns with more distinct values than this,
+                            or with distinct values for more than half of the
+                            rows, are returned as strings instead of categoricals.
+
+        Returns:
+            DataFrame with one row per record and a default RangeIndex.
+
+        Raises:
+            ImportError: If pandas is not installed.
+            KeyError: If ``columns`` names an unknown column.
+
+        Example:
+            >>> df = table.to_pandas(filter=col("status") == "open", columns=["id", "status", "created"])
+            >>> df.dtypes
+            id                  Int32
+            status           category
+            created    datetime64[us]
+            dtype: object
+        """
+        pages = self._scan(page_size, order_by, filter, pagination, False)
+        builder = self._frame_builder(columns, max_categories)
+        for page in prefetched(pages, prefetch):
+            builder.add(page.results, total=page.count)
+        return builder.frame()
+
+    def _stable_order(self, order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]]) -> Optional[List[OrderBy]]:
+        # Primary key as the last sort key, so that independently fetched pages never overlap
+        order = self._order_by_from_names(order_by) or []
+        pk = next((c.id for c in self._cached_columns() if c.primary_key), None)
+        if pk is not None and all(o.attnum != pk for o in order):
+            order.append(OrderBy(attnum=pk, direction="asc"))
+        return order or None
+
+    def fetch_all(
+        self,
+        *,
+        parallelism: int = 4,
+        page_size: int = 1000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        return_record_summaries: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch all records of this table with several pages in flight at once.
+
+        The first page tells how many records there are; the remaining pages
+        are then fetched concurrently over the client's shared connection pool,
+        with at most ``parallelism`` pages in flight for this call. All fetch_all
+        calls on the same table and client share a cap of the client's
+        ``table_concurrency`` pages at a time, however many Table handles they
+        use. Rows are yielded in the requested order, the same as iter_records
+        would yield them. The primary key is added as a final sort key so that
+        pages never overlap.
+
+        Records added after the first page is read may be missed; use
+        ``iter_records(pagination="keyset")`` for tables that are written to
+        during the export.
+
+        Args:
+            parallelism: Maximum number of concurrent calls made by this fetch.
+                         Keep it within the client's ``pool_size``.
+            page_size: Number of records fetched per call.
+            order_by: List of (column_name, direction) tuples for sorting.
+            filter: Filter expression built with ``col()``, e.g.
+                    ``(col("status") == "open") & (col("age") > 30)``, or a raw Filter.
+                    Filtering runs on the server.
+            return_record_summaries: Whether to include summaries of linked records.
+
+        Returns:
+            Iterator over record dictionaries with column names as keys.
+
+        Example:
+            >>> rows = list(table.fetch_all(parallelism=8, page_size=5000))
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if parallelism < 1:
+            raise ValueError("parallelism must be at least 1")
+        order = self._stable_order(order_by)
+        where = self._filter_from_names(filter)
+        slots = self._raw._slots_for_table(self.database_id, self.table_oid)
+
+        def fetch(offset: int) -> RawRecordList:
+            with slots:
+                return self._raw.records_list(
+                    database_id=self.database_id,
+                    table_id=self.table_oid,
+                    limit=page_size,
+                    offset=offset,
+                    order=order,
+                    filter=where,
+                    return_record_summaries=return_record_summaries,
+                )
+
+        first = fetch(0)
+        if len(first.results) < page_size:
+            yield from self._enrich_rows(first.results, self._linked_map(first))
+            return
+        # The first page goes through the pool too, so the following pages are
+        # already requested while its rows are consumed
+        offsets = range(0, first.count, page_size)
+        pages = ordered_map(lambda offset: first if offset == 0 else fetch(offset), offsets, parallelism)
+        for page in pages:
+            yield from self._enrich_rows(page.results, self._linked_map(page))
+
+    def count(self, *, filter: Optional[Condition | Filter] = None) -> int:
+        """Count the records of this table, or those matching ``filter``, on the server.
+
+        Args:
+            filter: Filter expression built with ``col()``, e.g.
+                    ``(col("status") == "open") & (col("age") > 30)``, or a raw Filter.
+                    Filtering runs on the server.
+
+        Returns:
+            Number of matching records.
+
+        Example:
+            >>> open_tickets = table.count(filter=col("status") == "open")
+        """
+        return self._raw.records_list(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=1,
+            filter=self._filter_from_names(filter),
+            validate=False,
+        ).count
+
     def records_search(
         self,
         *,
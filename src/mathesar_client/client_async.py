@@ -0,0 +1,582 @@
+"""High-level asyncio client for Mathesar API.
+
+Async counterparts of the classes in ``client``, with the same hierarchy
+(AsyncMathesarClient → AsyncDatabase → AsyncSchema → AsyncTable), the same
+method names and the same return types. Every API method is awaitable.
+
+Example:
+    >>> async with AsyncMathesarClient() as client:
+    ...     schema = await client.database(1).schema_by_name("public")
+    ...     table = await schema.table_by_name("users")
+    ...     page = await table.records_list(limit=10)
+"""
+
+from __future__ import annotations
+
+from asyncio import Lock, Queue, Semaphore, Task, create_task
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, List, Literal, Optional, Tuple, TypeVar
+
+from .client import ColumnarPage, Database, GroupedRecordsPage, MathesarClient, RecordsPage, Schema, Table, _after_key
+from .client_raw_async import AsyncMathesarClientRaw
+from .filters import Condition
+from .paging import _DONE
+from .stream import DEFAULT_CHUNK_SIZE
+from .client_raw_models import (
+    ColumnInfo,
+    Filter,
+    Grouping,
+    OrderBy,
+    RecordList as RawRecordList,
+    SearchParam,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+
+async def aprefetched(pages: AsyncIterator[T], depth: int) -> AsyncIterator[T]:
+    """Async counterpart of ``paging.prefetched``, fetching ahead in a task."""
+    if depth < 0:
+        raise ValueError("depth must not be negative")
+    if depth == 0:
+        async for page in pages:
+            yield page
+        return
+    buffer: Queue[Tuple[Any, Optional[BaseException]]] = Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+        except Exception as e:
+            await buffer.put((_DONE, e))
+        else:
+            await buffer.put((_DONE, None))
+
+    # Tasks run in a copy of the current context, so deadlines carry over
+    producer = create_task(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        producer.cancel()
+
+
+async def aordered_map(fn: Callable[[A], Awaitable[T]], items: Iterable[A], parallelism: int) -> AsyncIterator[T]:
+    """Async counterpart of ``paging.ordered_map``, running the calls as tasks."""
+    if parallelism < 1:
+        raise ValueError("parallelism must be at least 1")
+    slots = Semaphore(parallelism)
+
+    async def call(item: A) -> T:
+        async with slots:
+            return await fn(item)
+
+    items = iter(items)
+    pending: Deque[Task[T]] = deque(create_task(call(item)) for item in islice(items, 2 * parallelism))
+    try:
+        while pending:
+            result = await pending.popleft()
+            pending.extend(create_task(call(item)) for item in islice(items, 1))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncMathesarClient(MathesarClient):
+    """High-level asyncio client for Mathesar API.
+
+    Mirrors MathesarClient; all methods are coroutines. Every handle created
+    from one client shares its AsyncMathesarClientRaw and its connection pool.
+
+    Args:
+        raw: Optional AsyncMathesarClientRaw instance. If not provided, creates one
+             using environment variables.
+    """
+
+    raw: AsyncMathesarClientRaw
+
+    def __init__(self, raw: Optional[AsyncMathesarClientRaw] = None):
+        self.raw = raw or AsyncMathesarClientRaw()
+
+    def database(self, database_id: int) -> AsyncDatabase:
+        """Get an AsyncDatabase object for the specified database."""
+        return AsyncDatabase(self.raw, database_id)
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the underlying raw client."""
+        await self.raw.aclose()
+
+    async def __aenter__(self) -> AsyncMathesarClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class AsyncDatabase(Database):
+    """Async database-level operations and navigation. See Database."""
+
+    _raw: AsyncMathesarClientRaw
+
+    def table(self, table_oid: int) -> AsyncTable:
+        return AsyncTable(self._raw, self.database_id, table_oid)
+
+    def schema(self, schema_oid: int) -> AsyncSchema:
+        """Get an AsyncSchema object for the specified schema."""
+        return AsyncSchema(self._raw, self.database_id, schema_oid)
+
+    async def schema_by_name(self, name: str) -> AsyncSchema:  # type: ignore[override]
+        """Get an AsyncSchema object by name.
+
+        Raises:
+            ValueError: If no schema with the given name exists.
+        """
+        schemas = await self._raw.schemas_list(database_id=self.database_id)
+        for s in schemas:
+            if s.name == name:
+                return AsyncSchema(self._raw, self.database_id, s.oid)
+        raise ValueError(f"Schema with name '{name}' not found")
+
+
+class AsyncSchema(Schema):
+    """Async schema-level operations and navigation. See Schema."""
+
+    _raw: AsyncMathesarClientRaw
+
+    def table(self, table_oid: int) -> AsyncTable:
+        """Get an AsyncTable object for the specified table."""
+        return AsyncTable(self._raw, self.database_id, table_oid)
+
+    async def table_by_name(self, name: str) -> AsyncTable:  # type: ignore[override]
+        """Get an AsyncTable object by name.
+
+        Raises:
+            ValueError: If no table with the given name exists.
+        """
+        tables = await self.list_tables()
+        for t in tables:
+            if t.name == name:
+                return AsyncTable(self._raw, self.database_id, t.oid)
+        raise ValueError(f"Table with name '{name}' not found")
+
+
+class AsyncTable(Table):
+    """Async table-level operations with column name resolution. See Table.
+
+    The column cache is loaded once per table handle, guarded by a lock so that
+    many concurrent calls on a fresh handle issue a single ``columns.list``.
+    """
+
+    _raw: AsyncMathesarClientRaw
+
+    def __init__(self, raw: AsyncMathesarClientRaw, database_id: int, table_oid: int):
+        super().__init__(raw, database_id, table_oid)
+        self._columns_lock = Lock()
+
+    # ----- Columns helpers -----
+    async def columns(self, use_cache: bool = True) -> List[ColumnInfo]:  # type: ignore[override]
+        """Get list of columns for this table."""
+        if use_cache and self._columns_cache is not None:
+            return self._columns_cache
+        async with self._columns_lock:
+            if not use_cache or self._columns_cache is None:
+                cols = await self._raw.columns_list(table_oid=self.table_oid, database_id=self.database_id)
+                self._columns_cache = cols
+                self._attnum_to_name = {c.id: c.name for c in cols}
+                self._name_to_attnum = {c.name: c.id for c in cols}
+        return self._columns_cache
+
+    def _cached_columns(self) -> List[ColumnInfo]:
+        self._ensure_column_maps()
+        assert self._columns_cache is not None
+        return self._columns_cache
+
+    def _ensure_column_maps(self):
+        # Async methods load the columns before running the shared sync helpers
+        if self._attnum_to_name is None or self._name_to_attnum is None:
+            raise RuntimeError("Column cache not loaded; await table.columns() first")
+
+    # ----- Records API (high-level) -----
+    async def records_list(  # type: ignore[override]
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        return_record_summaries: bool = True,
+        format: Literal["rows", "columnar"] = "rows",
+        arrays: bool = False,
+    ) -> RecordsPage | ColumnarPage:
+        """List records from this table with enriched column names. See Table.records_list."""
+        if format not in ("rows", "columnar"):
+            raise ValueError(f"Unknown records format: {format!r}")
+        await self.columns()
+        order = self._order_by_from_names(order_by)
+        if format == "columnar":
+            buffers = self._column_buffers()
+            stream = await self._raw.records_list_stream(
+                database_id=self.database_id,
+                table_id=self.table_oid,
+                limit=limit,
+                offset=offset,
+                order=order,
+                filter=self._filter_from_names(filter),
+            )
+            async with stream:
+                async for rec in stream:
+                    buffers.add(rec)
+            return ColumnarPage.model_construct(count=stream.count, columns=buffers.columns(arrays))
+        raw = await self._raw.records_list(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=limit,
+            offset=offset,
+            order=order,
+            filter=self._filter_from_names(filter),
+            return_record_summaries=return_record_summaries,
+        )
+        return self._enrich_records(raw)
+
+    async def records_grouped(  # type: ignore[override]
+        self,
+        group_by: List[int | str],
+        *,
+        preproc: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        return_record_summaries: bool = True,
+    ) -> GroupedRecordsPage:
+        """List records grouped by columns on the server. See Table.records_grouped."""
+        await self.columns()
+        raw = await self._raw.records_list(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=limit,
+            offset=offset,
+            order=self._order_by_from_names(order_by),
+            filter=self._filter_from_names(filter),
+            grouping=Grouping(columns=self._map_names_or_attnums(group_by), preproc=preproc),
+            return_record_summaries=return_record_summaries,
+        )
+        return self._group_records(raw)
+
+    async def records_stream(  # type: ignore[override]
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream records one at a time with ``async for``. See Table.records_stream."""
+        await self.columns()
+        enrich = self._record_enricher()
+        stream = await self._raw.records_list_stream(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=limit,
+            offset=offset,
+            order=self._order_by_from_names(order_by),
+            filter=self._filter_from_names(filter),
+            chunk_size=chunk_size,
+        )
+        async with stream:
+            async for rec in stream:
+                yield enrich(rec)
+
+    async def _pages(  # type: ignore[override]
+        self,
+        page_size: int,
+        order: Optional[List[OrderBy]],
+        return_record_summaries: bool,
+        keyset: Optional[OrderBy] = None,
+        where: Optional[Filter] = None,
+    ) -> AsyncIterator[RawRecordList]:
+        offset = 0
+        filter = where
+        while True:
+            page = await self._raw.records_list(
+                database_id=self.database_id,
+                table_id=self.table_oid,
+                limit=page_size,
+                offset=None if keyset else offset,
+                order=[keyset] if keyset else order,
+                filter=filter,
+                return_record_summaries=return_record_summaries,
+            )
+            yield page
+            offset += len(page.results)
+            left = page.count - (len(page.results) if keyset else offset)
+            if len(page.results) < page_size or left <= 0:
+                return
+            if keyset:
+                filter = _after_key(keyset, page.results[-1][str(keyset.attnum)], where)
+
+    async def iter_records(  # type: ignore[override]
+        self,
+        *,
+        page_size: int = 500,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        return_record_summaries: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all records with ``async for``, prefetching pages in a task. See Table.iter_records."""
+        await self.columns()
+        pages = self._scan(page_size, order_by, filter, pagination, return_record_summaries)
+        async for page in aprefetched(pages, prefetch):  # type: ignore[arg-type]
+            for rec in self._enrich_rows(page.results, self._linked_map(page)):
+                yield rec
+
+    async def iter_columns(  # type: ignore[override]
+        self,
+        *,
+        page_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        arrays: bool = False,
+    ) -> AsyncIterator[ColumnarPage]:
+        """Iterate over all records as columnar pages with ``async for``. See Table.iter_columns."""
+        await self.columns()
+        pages = self._scan(page_size, order_by, filter, pagination, False)
+        async for page in aprefetched(pages, prefetch):  # type: ignore[arg-type]
+            yield self._columnar_page(page, arrays)
+
+    async def iter_arrow_batches(  # type: ignore[override]
+        self,
+        *,
+        batch_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Iterate over all records as Arrow record batches with ``async for``. See Table.iter_arrow_batches."""
+        await self.columns()
+        pages = self._scan(batch_size, order_by, filter, pagination, False)
+        _, build = self._arrow_batches()
+        async for page in aprefetched(pages, prefetch):  # type: ignore[arg-type]
+            yield build(page)
+
+    async def to_arrow(  # type: ignore[override]
+        self,
+        *,
+        batch_size: int = 10000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+    ) -> pa.Table:
+        """Fetch all records (or those matching ``filter``) as an Arrow table. See Table.to_arrow."""
+        import pyarrow as pa
+
+        await self.columns()
+        schema, _ = self._arrow_batches()
+        batches = [
+            batch
+            async for batch in self.iter_arrow_batches(
+                batch_size=batch_size, order_by=order_by, filter=filter, prefetch=prefetch, pagination=pagination
+            )
+        ]
+        return pa.Table.from_batches(batches, schema=schema)
+
+    async def to_pandas(  # type: ignore[override]
+        self,
+        *,
+        filter: Optional[Condition | Filter] = None,
+        columns: Optional[List[int | str]] = None,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        page_size: int = 10000,
+        prefetch: int = 1,
+        pagination: Literal["offset", "keyset"] = "offset",
+        max_categories: int = 1000,
+    ) -> pd.DataFrame:
+        """Fetch all records (or those matching ``filter``) as a pandas DataFrame. See Table.to_pandas."""
+        await self.columns()
+        pages = self._scan(page_size, order_by, filter, pagination, False)
+        builder = self._frame_builder(columns, max_categories)
+        async for page in aprefetched(pages, prefetch):  # type: ignore[arg-type]
+            builder.add(page.results, total=page.count)
+        return builder.frame()
+
+    async def fetch_all(  # type: ignore[override]
+        self,
+        *,
+        parallelism: int = 4,
+        page_size: int = 1000,
+        order_by: Optional[List[Tuple[str, Literal["asc", "desc"]]]] = None,
+        filter: Optional[Condition | Filter] = None,
+        return_record_summaries: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fetch all records with several pages in flight, with ``async for``. See Table.fetch_all."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if parallelism < 1:
+            raise ValueError("parallelism must be at least 1")
+        await self.columns()
+        order = self._stable_order(order_by)
+        where = self._filter_from_names(filter)
+        slots = self._raw._slots_for_table(self.database_id, self.table_oid)
+
+        async def fetch(offset: int) -> RawRecordList:
+            async with slots:
+                return await self._raw.records_list(
+                    database_id=self.database_id,
+                    table_id=self.table_oid,
+                    limit=page_size,
+                    offset=offset,
+                    order=order,
+                    filter=where,
+                    return_record_summaries=return_record_summaries,
+                )
+
+        async def page_at(offset: int) -> RawRecordList:
+            return first if offset == 0 else await fetch(offset)
+
+        first = await fetch(0)
+        if len(first.results) < page_size:
+            for rec in self._enrich_rows(first.results, self._linked_map(first)):
+                yield rec
+            return
+        async for page in aordered_map(page_at, range(0, first.count, page_size), parallelism):
+            for rec in self._enrich_rows(page.results, self._linked_map(page)):
+                yield rec
+
+    async def count(self, *, filter: Optional[Condition | Filter] = None) -> int:  # type: ignore[override]
+        """Count the records of this table, or those matching ``filter``. See Table.count."""
+        await self.columns()
+        page = await self._raw.records_list(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            limit=1,
+            filter=self._filter_from_names(filter),
+            validate=False,
+        )
+        return page.count
+
+    async def records_search(  # type: ignore[override]
+        self,
+        *,
+        search_params: Optional[List[SearchParam]] = None,
+        limit: int = 10,
+        offset: int = 0,
+        return_record_summaries: bool = True,
+    ) -> RecordsPage:
+        """Search records in this table. See Table.records_search."""
+        await self.columns()
+        raw = await self._raw.records_search(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            search_params=search_params,
+            limit=limit,
+            offset=offset,
+            return_record_summaries=return_record_summaries,
+        )
+        return self._enrich_records(raw)
+
+    async def record_get(self, *, record_id: Any, return_record_summaries: bool = True) -> Dict[str, Any]:  # type: ignore[override]
+        """Get a single record by ID. See Table.record_get."""
+        await self.columns()
+        raw = await self._raw.records_get(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            record_id=record_id,
+            return_record_summaries=return_record_summaries,
+        )
+        page = self._enrich_records(raw)
+        if not page.results:
+            raise ValueError("Record not found")
+        return page.results[0]
+
+    async def record_add(self, *, record_def_by_name: Dict[str, Any], return_record_summaries: bool = True) -> Dict[str, Any]:  # type: ignore[override]
+        """Add a new record to the table. See Table.record_add."""
+        await self.columns()
+        record_def: Dict[str, Any] = {
+            str(self._colname_to_attnum(k)): v for k, v in record_def_by_name.items()
+        }
+        raw = await self._raw.records_add(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            record_def=record_def,
+            return_record_summaries=return_record_summaries,
+        )
+        temp_list = RawRecordList(count=1, results=raw.results, record_summaries=raw.record_summaries, linked_record_summaries=getattr(raw, "linked_record_summaries", None))  # type: ignore[arg-type]
+        return self._enrich_records(temp_list).results[0]
+
+    async def record_patch(  # type: ignore[override]
+        self,
+        *,
+        record_id: Any,
+        record_def_by_name: Dict[str, Any],
+        return_record_summaries: bool = True,
+    ) -> Dict[str, Any]:
+        """Update an existing record. See Table.record_patch."""
+        await self.columns()
+        record_def: Dict[str, Any] = {
+            str(self._colname_to_attnum(k)): v for k, v in record_def_by_name.items()
+        }
+        raw = await self._raw.records_patch(
+            database_id=self.database_id,
+            table_id=self.table_oid,
+            record_id=record_id,
+            record_def=record_def,
+            return_record_summaries=return_record_summaries,
+        )
+        temp_list = RawRecordList(count=1, results=raw.results, record_summaries=raw.record_summaries, linked_record_summaries=getattr(raw, "linked_record_summaries", None))  # type: ignore[arg-type]
+        return self._enrich_records(temp_list).results[0]
+
+    # ----- Name-resolving operations -----
+    # These load the column cache, then reuse the synchronous implementation,
+    # which resolves names and returns the raw client's awaitable.
+
+    async def columns_patch(self, *, columns: List[Dict[str, Any]]) -> int:  # type: ignore[override]
+        await self.columns()
+        return await super().columns_patch(columns=columns)
+
+    async def columns_delete(self, *, column_names_or_attnums: List[int | str]) -> int:  # type: ignore[override]
+        await self.columns()
+        return await super().columns_delete(column_names_or_attnums=column_names_or_attnums)
+
+    async def reset_file_mash(self, *, column: int | str) -> None:  # type: ignore[override]
+        await self.columns()
+        return await super().reset_file_mash(column=column)
+
+    async def add_primary_key_constraint(self, **kwargs: Any) -> List[int]:  # type: ignore[override]
+        await self.columns()
+        return await super().add_primary_key_constraint(**kwargs)
+
+    async def add_unique_constraint(self, **kwargs: Any) -> List[int]:  # type: ignore[override]
+        await self.columns()
+        return await super().add_unique_constraint(**kwargs)
+
+    async def add_foreign_key_constraint(self, **kwargs: Any) -> List[int]:  # type: ignore[override]
+        await self.columns()
+        return await super().add_foreign_key_constraint(**kwargs)
+
+    async def split_table(self, **kwargs: Any) -> Any:  # type: ignore[override]
+        await self.columns()
+        return await super().split_table(**kwargs)
+
+    async def move_columns(self, **kwargs: Any) -> None:  # type: ignore[override]
+        await self.columns()
+        return await super().move_columns(**kwargs)
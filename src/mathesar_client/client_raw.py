@@ -4,16 +4,32 @@ This module provides direct 1:1 mapping to Mathesar API methods with typed
 parameters and return values using Pydantic models for validation.
 """
 
-from typing import Any, Dict, List, Optional, Literal
-from requests import post
+from typing import Any, Callable, Dict, List, Optional, Literal, Tuple
+import gzip
+from functools import lru_cache
+from pydantic import TypeAdapter
 from os import environ
+from time import monotonic, sleep
+from contextlib import AbstractContextManager
 from urllib.parse import urljoin
-from random import randint
+from itertools import count
+from threading import BoundedSemaphore, Lock, local
+from .auth import Auth, BasicAuth, SessionAuth
+from .batch import AutoBatcher, RpcBatch
+from .codec import CodecName, JsonCodec, get_codec
+from .compact import ModelBackend, compact_parser
+from .deadlines import deadline, expired, remaining
+from .errors import CircuitOpenError, DeadlineExceeded, MathesarClientError
+from .limiter import AdaptiveLimiter, CircuitBreaker, is_overload
+from .stream import DEFAULT_CHUNK_SIZE, RecordStream
+from .retry import RetryPolicy, idempotency_key, idempotent, payload_methods
+from .transport import _DEFAULT, Http2Transport, HttpTransport, Timeout, capped_timeout
 from .client_raw_models import (
     # Records
     OrderBy,
     Filter,
     Grouping,
+    GroupingResponse,
     SearchParam,
     RecordList,
     RecordAdded,
@@ -73,9 +89,34 @@ from .client_raw_models import (
 )
 
 
-class MathesarClientError(Exception):
-    """Exception raised when a Mathesar API call returns an error."""
-    pass
+def _ignore(result: Any) -> None:
+    return None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Any) -> TypeAdapter:
+    # Built on first use of each model and shared by all clients afterwards
+    return TypeAdapter(List[model])
+
+
+def _list_of(model: Any) -> Callable[[Any], List[Any]]:
+    # Validates the whole list in a single pydantic-core call
+    return _list_adapter(model).validate_python
+
+
+def _construct_record_list(result: Dict[str, Any]) -> RecordList:
+    # Trusted-server fast path: rows are plain dicts, so they are used as-is
+    # instead of being validated (and copied) one by one
+    fields = {k: v for k, v in result.items() if k in RecordList.model_fields}
+    if fields.get("grouping") is not None:
+        fields["grouping"] = GroupingResponse.model_validate(fields["grouping"])
+    return RecordList.model_construct(**fields)
+
+
+# Response encodings decoded by both requests and httpx out of the box
+ACCEPT_ENCODING = "gzip, deflate"
+# Request compression level; higher levels cost much more CPU for little gain on JSON
+GZIP_LEVEL = 5
 
 
 class MathesarClientRaw:
@@ -86,8 +127,44 @@ class MathesarClientRaw:
     
     Args:
         base_url: Base URL of the Mathesar instance. Falls back to MATHESAR_BASE_URL env var.
-        username: Username for basic auth. Falls back to MATHESAR_USERNAME env var.
-        password: Password for basic auth. Falls back to MATHESAR_PASSWORD env var.
+        username: Username to authenticate with. Falls back to MATHESAR_USERNAME env var.
+        password: Password to authenticate with. Falls back to MATHESAR_PASSWORD env var.
+        auth: "basic" to send the credentials with every request (default), "session"
+              to log in once and reuse the Django session cookie and CSRF token,
+              or a custom Auth instance.
+        retry: Retry policy for transient failures. The default retries read methods
+               only; pass None to disable retries.
+        limiter: Optional AdaptiveLimiter capping concurrent calls from all threads
+                 using this client, with a window adapted to latency and errors.
+        breaker: Optional CircuitBreaker failing calls fast after a run of failures.
+        compress_requests: Gzip request bodies of at least this many bytes, e.g. bulk
+                           ``records_add`` payloads. None (default) never compresses;
+                           the server or its proxy must accept ``Content-Encoding: gzip``.
+                           Responses are always requested compressed.
+        validate: Validate record pages (records_list, records_search, records_get)
+                  against RecordList. False trusts the server and builds the models
+                  without validating each row, which is much faster on large pages.
+        model_backend: "pydantic" (default) returns the models of client_raw_models.
+                       "compact" returns slotted dataclasses with the same field names
+                       for column, constraint, schema and table metadata; they are
+                       smaller and faster to build, but are not validated.
+        json_codec: JSON codec for request bodies and responses: "auto" (default) uses
+                    msgspec when installed and the stdlib otherwise, or pass
+                    "stdlib", "orjson", "msgspec" or a JsonCodec instance.
+        transport: Optional HttpTransport to send requests through. Pass the same
+                   transport to several clients to share one connection pool.
+        pool_size: Maximum number of keep-alive connections when no transport is given.
+        timeout: Default per-call timeout in seconds (or a (connect, read) tuple)
+                 when no transport is given. None waits indefinitely.
+        http2: When no transport is given, multiplex calls over one HTTP/2 connection
+               (Http2Transport), falling back to HTTP/1.1 if the server does not
+               support it. Requires ``pip install mathesar-client[http2]``.
+        auto_batch: Coalesce calls issued concurrently from several threads into
+                    JSON-RPC batches. Each call still blocks and returns its own result.
+        batch_window: Seconds to wait for more calls before sending an automatic batch.
+        max_batch_size: Number of calls that triggers sending an automatic batch early.
+        table_concurrency: Maximum number of pages of one table fetched at the same
+                           time by all ``Table.fetch_all`` calls using this client.
     
     Example:
         >>> client = MathesarClientRaw(
@@ -98,11 +175,131 @@ class MathesarClientRaw:
         >>> records = client.records_list(database_id=1, table_id=123)
     """
     
-    def __init__(self, base_url: Optional[str] = None, username: Optional[str] = None, password: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        *,
+        auth: Literal["basic", "session"] | Auth = "basic",
+        retry: Optional[RetryPolicy] = _DEFAULT,
+        limiter: Optional[AdaptiveLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        compress_requests: Optional[int] = None,
+        validate: bool = True,
+        model_backend: ModelBackend = "pydantic",
+        json_codec: CodecName | JsonCodec = "auto",
+        transport: Optional[HttpTransport] = None,
+        pool_size: int = 10,
+        timeout: Timeout = None,
+        http2: bool = False,
+        auto_batch: bool = False,
+        batch_window: float = 0.002,
+        max_batch_size: int = 50,
+        table_concurrency: int = 8,
+    ):
         self.__base_url = base_url or environ['MATHESAR_BASE_URL']
         self.__username = username or environ['MATHESAR_USERNAME']
         self.__password = password or environ['MATHESAR_PASSWORD']
         self.__api_url = urljoin(self.__base_url, "api/rpc/v0/")
+        if auth == "basic":
+            self._auth: Auth = BasicAuth(self.__username, self.__password)
+        elif auth == "session":
+            self._auth = SessionAuth(self.__base_url, self.__username, self.__password)
+        elif isinstance(auth, Auth):
+            self._auth = auth
+        else:
+            raise ValueError(f"Unknown auth mode: {auth!r}")
+        # Each client gets its own policy, and with it its own retry budget
+        self.retry: Optional[RetryPolicy] = RetryPolicy() if retry is _DEFAULT else retry
+        self.limiter = limiter
+        self.breaker = breaker
+        self.codec = get_codec(json_codec)
+        self.compress_requests = compress_requests
+        self.validate = validate
+        if model_backend not in ("pydantic", "compact"):
+            raise ValueError(f"Unknown model backend: {model_backend!r}")
+        self.model_backend = model_backend
+        if transport is None:
+            transport = (
+                Http2Transport(max_connections=pool_size, timeout=timeout)
+                if http2
+                else HttpTransport(pool_maxsize=pool_size, timeout=timeout)
+            )
+        self.transport = transport
+        self._ids = count(1)
+        self._local = local()
+        self._auto_batcher: Optional[AutoBatcher] = (
+            AutoBatcher(self, window=batch_window, max_size=max_batch_size) if auto_batch else None
+        )
+        if table_concurrency < 1:
+            raise ValueError("table_concurrency must be at least 1")
+        self.table_concurrency = table_concurrency
+        self._table_slots: Dict[Tuple[int, int], Any] = {}
+        self._table_slots_lock = Lock()
+
+    def _slots_for_table(self, database_id: int, table_oid: int) -> Any:
+        # One semaphore per table, shared by every handle created from this client
+        key = (database_id, table_oid)
+        with self._table_slots_lock:
+            slots = self._table_slots.get(key)
+            if slots is None:
+                slots = self._table_slots[key] = self._new_table_slots()
+        return slots
+
+    def _new_table_slots(self) -> Any:
+        return BoundedSemaphore(self.table_concurrency)
+
+    def idempotent(self, key: Optional[str] = None) -> AbstractContextManager[None]:
+        """Mark write calls made inside the ``with`` block as safe to retry.
+
+        Args:
+            key: Optional client-generated idempotency key, sent as the
+                 ``Idempotency-Key`` header so repeated deliveries can be detected.
+
+        Example:
+            >>> with client.idempotent(key=str(uuid4())):
+            ...     client.records_add(database_id=1, table_id=123, record_def={"2": "x"})
+        """
+        return idempotent(key)
+
+    def deadline(self, seconds: float) -> AbstractContextManager[None]:
+        """Limit all calls made inside the ``with`` block to ``seconds`` in total.
+
+        Each call gets the time left as its timeout, and DeadlineExceeded is raised
+        as soon as the budget runs out.
+
+        Example:
+            >>> with client.deadline(2.0):
+            ...     tables = client.tables_list(schema_oid=2200, database_id=1)
+            ...     columns = client.columns_list(table_oid=tables[0].oid, database_id=1)
+        """
+        return deadline(seconds)
+
+    def batch(self) -> RpcBatch:
+        """Start a JSON-RPC batch.
+
+        Methods called on the returned batch queue their call and return a
+        Future instead of executing it. All queued calls are sent in a single
+        HTTP request when the ``with`` block exits (or on ``send()``), and each
+        reply is matched to its call by request id.
+
+        Example:
+            >>> with client.batch() as b:
+            ...     futures = {oid: b.columns_list(table_oid=oid, database_id=1) for oid in oids}
+            >>> columns = {oid: f.result() for oid, f in futures.items()}
+        """
+        return RpcBatch(self)
+
+    def close(self) -> None:
+        """Close pooled connections held by the underlying transport."""
+        self.transport.close()
+
+    def __enter__(self) -> "MathesarClientRaw":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def records_list(
         self,
@@ -115,6 +312,7 @@ class MathesarClientRaw:
         filter: Optional[Filter] = None,
         grouping: Optional[Grouping] = None,
         return_record_summaries: bool = False,
+        validate: Optional[bool] = None,
     ) -> RecordList:
         """List records from a table with optional filtering, sorting, and grouping.
         
@@ -127,6 +325,8 @@ class MathesarClientRaw:
             filter: Filter specification for filtering records.
             grouping: Grouping specification for aggregating records.
             return_record_summaries: Whether to include summaries of linked records.
+            validate: Validate the reply against RecordList; defaults to the client's
+                      ``validate`` setting. False skips per-row validation.
         
         Returns:
             RecordList containing the query results and metadata.
@@ -147,8 +347,54 @@ class MathesarClientRaw:
         if grouping is not None:
             data["grouping"] = grouping.model_dump(mode="json")
 
-        result = self._post("records.list", data)
-        return RecordList.model_validate(result)
+        return self._call("records.list", data, self._record_list_parser(validate))
+
+    def records_list_stream(
+        self,
+        *,
+        database_id: int,
+        table_id: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order: Optional[List[OrderBy]] = None,
+        filter: Optional[Filter] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> RecordStream:
+        """Stream records from a table, parsing rows incrementally from the response.
+
+        Unlike records_list, the reply is never held in memory as a whole: rows
+        are parsed one by one while the response body is being read, so memory
+        use is bounded by the row size rather than the page size. Record
+        summaries are not requested, as they can only be sent after all rows.
+
+        Args:
+            database_id: Database ID containing the table.
+            table_id: Table OID to query.
+            limit: Maximum number of records to return.
+            offset: Number of records to skip.
+            order: List of OrderBy specifications for sorting.
+            filter: Filter specification for filtering records.
+            chunk_size: Number of bytes read from the response body at a time.
+
+        Returns:
+            RecordStream yielding raw record dicts (attnum keys); its ``count``
+            is set once that part of the reply has been read.
+        """
+        data: Dict[str, Any] = {
+            "database_id": database_id,
+            "table_oid": table_id,
+            "return_record_summaries": False,
+        }
+        if limit is not None:
+            data["limit"] = limit
+        if offset is not None:
+            data["offset"] = offset
+        if order is not None:
+            data["order"] = [o.model_dump(mode="json") for o in order]
+        if filter is not None:
+            data["filter"] = filter.model_dump(mode="json")
+
+        return self._open_stream("records.list", data, chunk_size)
 
     def records_get(
         self,
@@ -158,6 +404,7 @@ class MathesarClientRaw:
         record_id: Any,
         return_record_summaries: bool = False,
         table_record_summary_templates: Optional[Dict[str, Any]] = None,
+        validate: Optional[bool] = None,
     ) -> RecordList:
         data: Dict[str, Any] = {
             "database_id": database_id,
@@ -167,8 +414,7 @@ class MathesarClientRaw:
         }
         if table_record_summary_templates is not None:
             data["table_record_summary_templates"] = table_record_summary_templates
-        result = self._post("records.get", data)
-        return RecordList.model_validate(result)
+        return self._call("records.get", data, self._record_list_parser(validate))
 
     def records_add(
         self,
@@ -184,8 +430,7 @@ class MathesarClientRaw:
             "record_def": record_def,
             "return_record_summaries": return_record_summaries,
         }
-        result = self._post("records.add", data)
-        return RecordAdded.model_validate(result)
+        return self._call("records.add", data, RecordAdded.model_validate)
 
     def records_patch(
         self,
@@ -203,8 +448,7 @@ class MathesarClientRaw:
             "record_def": record_def,
             "return_record_summaries": return_record_summaries,
         }
-        result = self._post("records.patch", data)
-        return RecordAdded.model_validate(result)
+        return self._call("records.patch", data, RecordAdded.model_validate)
 
     def records_delete(
         self,
@@ -218,8 +462,7 @@ class MathesarClientRaw:
             "table_oid": table_id,
             "record_ids": record_ids,
         }
-        result = self._post("records.delete", data)
-        return result
+        return self._call("records.delete", data)
 
     def records_search(
         self,
@@ -230,6 +473,7 @@ class MathesarClientRaw:
         limit: int = 10,
         offset: int = 0,
         return_record_summaries: bool = False,
+        validate: Optional[bool] = None,
     ) -> RecordList:
         data: Dict[str, Any] = {
             "database_id": database_id,
@@ -240,8 +484,7 @@ class MathesarClientRaw:
         }
         if search_params is not None:
             data["search_params"] = [p.model_dump(mode="json") for p in search_params]
-        result = self._post("records.search", data)
-        return RecordList.model_validate(result)
+        return self._call("records.search", data, self._record_list_parser(validate))
 
     def records_list_summaries(
         self,
@@ -262,60 +505,51 @@ class MathesarClientRaw:
             data["offset"] = offset
         if search is not None:
             data["search"] = search
-        result = self._post("records.list_summaries", data)
-        return RecordSummaryList.model_validate(result)
+        return self._call("records.list_summaries", data, RecordSummaryList.model_validate)
 
     # Analytics
     def analytics_get_state(self) -> AnalyticsState:
-        result = self._post("analytics.get_state", {})
-        return AnalyticsState.model_validate(result)
+        return self._call("analytics.get_state", {}, AnalyticsState.model_validate)
 
     def analytics_initialize(self) -> None:
-        self._post("analytics.initialize", {})
-        return None
+        return self._call("analytics.initialize", {}, _ignore)
 
     def analytics_disable(self) -> None:
-        self._post("analytics.disable", {})
-        return None
+        return self._call("analytics.disable", {}, _ignore)
 
     def analytics_view_report(self) -> AnalyticsReport:
-        result = self._post("analytics.view_report", {})
-        return AnalyticsReport.model_validate(result)
+        return self._call("analytics.view_report", {}, AnalyticsReport.model_validate)
 
     def analytics_upload_feedback(self, *, message: str) -> None:
-        self._post("analytics.upload_feedback", {"message": message})
-        return None
+        return self._call("analytics.upload_feedback", {"message": message}, _ignore)
 
     # Collaborators
     def collaborators_list(self, *, database_id: Optional[int] = None) -> List[CollaboratorInfo]:
         params: Dict[str, Any] = {}
         if database_id is not None:
             params["database_id"] = database_id
-        result = self._post("collaborators.list", params)
-        return [CollaboratorInfo.model_validate(x) for x in result]
+        return self._call("collaborators.list", params, _list_of(CollaboratorInfo))
 
     def collaborators_add(self, *, database_id: int, user_id: int, configured_role_id: int) -> None:
-        self._post(
+        return self._call(
             "collaborators.add",
             {"database_id": database_id, "user_id": user_id, "configured_role_id": configured_role_id},
+            _ignore,
         )
-        return None
 
     def collaborators_delete(self, *, collaborator_id: int) -> None:
-        self._post("collaborators.delete", {"collaborator_id": collaborator_id})
-        return None
+        return self._call("collaborators.delete", {"collaborator_id": collaborator_id}, _ignore)
 
     def collaborators_set_role(self, *, collaborator_id: int, configured_role_id: int) -> None:
-        self._post(
+        return self._call(
             "collaborators.set_role",
             {"collaborator_id": collaborator_id, "configured_role_id": configured_role_id},
+            _ignore,
         )
-        return None
 
     # Columns
     def columns_list(self, *, table_oid: int, database_id: int) -> List[ColumnInfo]:
-        result = self._post("columns.list", {"table_oid": table_oid, "database_id": database_id})
-        return [ColumnInfo.model_validate(x) for x in result]
+        return self._call("columns.list", {"table_oid": table_oid, "database_id": database_id}, self._model_parser(ColumnInfo, many=True))
 
     def columns_add(
         self,
@@ -329,7 +563,7 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        return self._post("columns.add", data)
+        return self._call("columns.add", data)
 
     def columns_add_primary_key_column(
         self,
@@ -347,8 +581,7 @@ class MathesarClientRaw:
             "drop_existing_pkey_column": drop_existing_pkey_column,
             "name": name,
         }
-        self._post("columns.add_primary_key_column", data)
-        return None
+        return self._call("columns.add_primary_key_column", data, _ignore)
 
     def columns_patch(
         self,
@@ -362,7 +595,7 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        return self._post("columns.patch", data)
+        return self._call("columns.patch", data)
 
     def columns_delete(self, *, column_attnums: List[int], table_oid: int, database_id: int) -> int:
         data = {
@@ -370,7 +603,7 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        return self._post("columns.delete", data)
+        return self._call("columns.delete", data)
 
     def columns_reset_mash(self, *, column_attnum: int, table_oid: int, database_id: int) -> None:
         data = {
@@ -378,16 +611,21 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        self._post("columns.reset_mash", data)
-        return None
+        return self._call("columns.reset_mash", data, _ignore)
 
     def columns_list_with_metadata(self, *, table_oid: int, database_id: int) -> List[ColumnInfo]:
-        result = self._post("columns.list_with_metadata", {"table_oid": table_oid, "database_id": database_id})
-        return [ColumnInfo.model_validate(x) for x in result]
+        return self._call(
+            "columns.list_with_metadata",
+            {"table_oid": table_oid, "database_id": database_id},
+            self._model_parser(ColumnInfo, many=True),
+        )
 
     def columns_metadata_list(self, *, table_oid: int, database_id: int) -> List[ColumnMetaDataRecord]:
-        result = self._post("columns.metadata.list", {"table_oid": table_oid, "database_id": database_id})
-        return [ColumnMetaDataRecord.model_validate(x) for x in result]
+        return self._call(
+            "columns.metadata.list",
+            {"table_oid": table_oid, "database_id": database_id},
+            _list_of(ColumnMetaDataRecord),
+        )
 
     def columns_metadata_set(
         self, *, column_meta_data_list: List[ColumnMetaDataBlob], table_oid: int, database_id: int
@@ -397,21 +635,18 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        self._post("columns.metadata.set", data)
-        return None
+        return self._call("columns.metadata.set", data, _ignore)
 
     # Configured Databases
     def databases_configured_list(self, *, server_id: Optional[int] = None) -> List[ConfiguredDatabaseInfo]:
         params: Dict[str, Any] = {}
         if server_id is not None:
             params["server_id"] = server_id
-        result = self._post("databases.configured.list", params)
-        return [ConfiguredDatabaseInfo.model_validate(x) for x in result]
+        return self._call("databases.configured.list", params, _list_of(ConfiguredDatabaseInfo))
 
     def databases_configured_patch(self, *, database_id: int, patch: ConfiguredDatabasePatch) -> ConfiguredDatabaseInfo:
         data = {"database_id": database_id, "patch": patch.model_dump(mode="json")}
-        result = self._post("databases.configured.patch", data)
-        return ConfiguredDatabaseInfo.model_validate(result)
+        return self._call("databases.configured.patch", data, ConfiguredDatabaseInfo.model_validate)
 
     def databases_configured_disconnect(
         self,
@@ -434,13 +669,15 @@ class MathesarClientRaw:
             data["role_name"] = role_name
         if password is not None:
             data["password"] = password
-        self._post("databases.configured.disconnect", data)
-        return None
+        return self._call("databases.configured.disconnect", data, _ignore)
 
     # Constraints
     def constraints_list(self, *, table_oid: int, database_id: int) -> List[ConstraintInfo]:
-        result = self._post("constraints.list", {"table_oid": table_oid, "database_id": database_id})
-        return [ConstraintInfo.model_validate(x) for x in result]
+        return self._call(
+            "constraints.list",
+            {"table_oid": table_oid, "database_id": database_id},
+            self._model_parser(ConstraintInfo, many=True),
+        )
 
     def constraints_add(
         self, *, table_oid: int, constraint_def_list: CreatableConstraintInfo, database_id: int
@@ -450,11 +687,11 @@ class MathesarClientRaw:
             "constraint_def_list": [c.model_dump(mode="json") for c in constraint_def_list],
             "database_id": database_id,
         }
-        return self._post("constraints.add", data)
+        return self._call("constraints.add", data)
 
     def constraints_delete(self, *, table_oid: int, constraint_oid: int, database_id: int) -> str:
         data = {"table_oid": table_oid, "constraint_oid": constraint_oid, "database_id": database_id}
-        return self._post("constraints.delete", data)
+        return self._call("constraints.delete", data)
 
     # Data Modeling
     def data_modeling_add_foreign_key_column(
@@ -466,8 +703,7 @@ class MathesarClientRaw:
             "referent_table_oid": referent_table_oid,
             "database_id": database_id,
         }
-        self._post("data_modeling.add_foreign_key_column", data)
-        return None
+        return self._call("data_modeling.add_foreign_key_column", data, _ignore)
 
     def data_modeling_add_mapping_table(
         self,
@@ -483,11 +719,10 @@ class MathesarClientRaw:
             "schema_oid": schema_oid,
             "database_id": database_id,
         }
-        self._post("data_modeling.add_mapping_table", data)
-        return None
+        return self._call("data_modeling.add_mapping_table", data, _ignore)
 
     def data_modeling_suggest_types(self, *, table_oid: int, database_id: int) -> Dict[str, str]:
-        return self._post("data_modeling.suggest_types", {"table_oid": table_oid, "database_id": database_id})
+        return self._call("data_modeling.suggest_types", {"table_oid": table_oid, "database_id": database_id})
 
     def data_modeling_split_table(
         self,
@@ -506,8 +741,7 @@ class MathesarClientRaw:
         }
         if relationship_fk_column_name is not None:
             data["relationship_fk_column_name"] = relationship_fk_column_name
-        result = self._post("data_modeling.split_table", data)
-        return SplitTableInfo.model_validate(result)
+        return self._call("data_modeling.split_table", data, SplitTableInfo.model_validate)
 
     def data_modeling_move_columns(
         self, *, source_table_oid: int, target_table_oid: int, move_column_attnums: List[int], database_id: int
@@ -518,17 +752,14 @@ class MathesarClientRaw:
             "move_column_attnums": move_column_attnums,
             "database_id": database_id,
         }
-        self._post("data_modeling.move_columns", data)
-        return None
+        return self._call("data_modeling.move_columns", data, _ignore)
 
     # Databases
     def databases_get(self, *, database_id: int) -> DatabaseInfo:
-        result = self._post("databases.get", {"database_id": database_id})
-        return DatabaseInfo.model_validate(result)
+        return self._call("databases.get", {"database_id": database_id}, DatabaseInfo.model_validate)
 
     def databases_delete(self, *, database_oid: int, database_id: int) -> None:
-        self._post("databases.delete", {"database_oid": database_oid, "database_id": database_id})
-        return None
+        return self._call("databases.delete", {"database_oid": database_oid, "database_id": database_id}, _ignore)
 
     def databases_upgrade_sql(
         self, *, database_id: int, username: Optional[str] = None, password: Optional[str] = None
@@ -538,13 +769,11 @@ class MathesarClientRaw:
             data["username"] = username
         if password is not None:
             data["password"] = password
-        self._post("databases.upgrade_sql", data)
-        return None
+        return self._call("databases.upgrade_sql", data, _ignore)
 
     # Database privileges
     def databases_privileges_list_direct(self, *, database_id: int) -> List[DBPrivileges]:
-        result = self._post("databases.privileges.list_direct", {"database_id": database_id})
-        return [DBPrivileges.model_validate(x) for x in result]
+        return self._call("databases.privileges.list_direct", {"database_id": database_id}, _list_of(DBPrivileges))
 
     def databases_privileges_replace_for_roles(
         self, *, privileges: List[DBPrivileges], database_id: int
@@ -553,14 +782,14 @@ class MathesarClientRaw:
             "privileges": [p.model_dump(mode="json") for p in privileges],
             "database_id": database_id,
         }
-        result = self._post("databases.privileges.replace_for_roles", data)
-        return [DBPrivileges.model_validate(x) for x in result]
+        return self._call("databases.privileges.replace_for_roles", data, _list_of(DBPrivileges))
 
     def databases_privileges_transfer_ownership(self, *, new_owner_oid: int, database_id: int) -> DatabaseInfo:
-        result = self._post(
-            "databases.privileges.transfer_ownership", {"new_owner_oid": new_owner_oid, "database_id": database_id}
+        return self._call(
+            "databases.privileges.transfer_ownership",
+            {"new_owner_oid": new_owner_oid, "database_id": database_id},
+            DatabaseInfo.model_validate,
         )
-        return DatabaseInfo.model_validate(result)
 
     # Database setup
     def databases_setup_create_new(
@@ -571,8 +800,7 @@ class MathesarClientRaw:
             data["sample_data"] = sample_data
         if nickname is not None:
             data["nickname"] = nickname
-        result = self._post("databases.setup.create_new", data)
-        return DatabaseConnectionResult.model_validate(result)
+        return self._call("databases.setup.create_new", data, DatabaseConnectionResult.model_validate)
 
     def databases_setup_connect_existing(
         self,
@@ -597,32 +825,34 @@ class MathesarClientRaw:
             data["sample_data"] = sample_data
         if nickname is not None:
             data["nickname"] = nickname
-        result = self._post("databases.setup.connect_existing", data)
-        return DatabaseConnectionResult.model_validate(result)
+        return self._call("databases.setup.connect_existing", data, DatabaseConnectionResult.model_validate)
 
     # Explorations
     def explorations_list(self, *, database_id: int, schema_oid: Optional[int] = None) -> List[ExplorationInfo]:
         data: Dict[str, Any] = {"database_id": database_id}
         if schema_oid is not None:
             data["schema_oid"] = schema_oid
-        result = self._post("explorations.list", data)
-        return [ExplorationInfo.model_validate(x) for x in result]
+        return self._call("explorations.list", data, _list_of(ExplorationInfo))
 
     def explorations_get(self, *, exploration_id: int) -> ExplorationInfo:
-        result = self._post("explorations.get", {"exploration_id": exploration_id})
-        return ExplorationInfo.model_validate(result)
+        return self._call("explorations.get", {"exploration_id": exploration_id}, ExplorationInfo.model_validate)
 
     def explorations_add(self, *, exploration_def: ExplorationDef) -> ExplorationInfo:
-        result = self._post("explorations.add", {"exploration_def": exploration_def.model_dump(mode="json")})
-        return ExplorationInfo.model_validate(result)
+        return self._call(
+            "explorations.add",
+            {"exploration_def": exploration_def.model_dump(mode="json")},
+            ExplorationInfo.model_validate,
+        )
 
     def explorations_delete(self, *, exploration_id: int) -> None:
-        self._post("explorations.delete", {"exploration_id": exploration_id})
-        return None
+        return self._call("explorations.delete", {"exploration_id": exploration_id}, _ignore)
 
     def explorations_replace(self, *, new_exploration: ExplorationInfo) -> ExplorationInfo:
-        result = self._post("explorations.replace", {"new_exploration": new_exploration.model_dump(mode="json")})
-        return ExplorationInfo.model_validate(result)
+        return self._call(
+            "explorations.replace",
+            {"new_exploration": new_exploration.model_dump(mode="json")},
+            ExplorationInfo.model_validate,
+        )
 
     def explorations_run(
         self, *, exploration_def: ExplorationDef, limit: int = 100, offset: int = 0
@@ -632,44 +862,40 @@ class MathesarClientRaw:
             "limit": limit,
             "offset": offset,
         }
-        result = self._post("explorations.run", data)
-        return ExplorationResult.model_validate(result)
+        return self._call("explorations.run", data, ExplorationResult.model_validate)
 
     def explorations_run_saved(self, *, exploration_id: int, limit: int = 100, offset: int = 0) -> ExplorationResult:
         data = {"exploration_id": exploration_id, "limit": limit, "offset": offset}
-        result = self._post("explorations.run_saved", data)
-        return ExplorationResult.model_validate(result)
+        return self._call("explorations.run_saved", data, ExplorationResult.model_validate)
 
     # Forms
     def forms_list(self, *, database_id: int, schema_oid: int) -> List[FormInfo]:
-        result = self._post("forms.list", {"database_id": database_id, "schema_oid": schema_oid})
-        return [FormInfo.model_validate(x) for x in result]
+        return self._call("forms.list", {"database_id": database_id, "schema_oid": schema_oid}, _list_of(FormInfo))
 
     def forms_get(self, *, form_token: str) -> FormInfo:
-        result = self._post("forms.get", {"form_token": form_token})
-        return FormInfo.model_validate(result)
+        return self._call("forms.get", {"form_token": form_token}, FormInfo.model_validate)
 
     def forms_add(self, *, form_def: AddFormDef) -> FormInfo:
-        result = self._post("forms.add", {"form_def": form_def.model_dump(mode="json")})
-        return FormInfo.model_validate(result)
+        return self._call("forms.add", {"form_def": form_def.model_dump(mode="json")}, FormInfo.model_validate)
 
     def forms_delete(self, *, form_id: int) -> None:
-        self._post("forms.delete", {"form_id": form_id})
-        return None
+        return self._call("forms.delete", {"form_id": form_id}, _ignore)
 
     def forms_regenerate_token(self, *, form_id: int) -> str:
-        return self._post("forms.regenerate_token", {"form_id": form_id})
+        return self._call("forms.regenerate_token", {"form_id": form_id})
 
     def forms_patch(self, *, update_form_def: SettableFormDef) -> FormInfo:
-        result = self._post("forms.patch", {"update_form_def": update_form_def.model_dump(mode="json")})
-        return FormInfo.model_validate(result)
+        return self._call(
+            "forms.patch",
+            {"update_form_def": update_form_def.model_dump(mode="json")},
+            FormInfo.model_validate,
+        )
 
     def forms_set_publish_public(self, *, form_id: int, publish_public: bool) -> bool:
-        return self._post("forms.set_publish_public", {"form_id": form_id, "publish_public": publish_public})
+        return self._call("forms.set_publish_public", {"form_id": form_id, "publish_public": publish_public})
 
     def forms_submit(self, *, form_token: str, values: Dict[str, Any]) -> None:
-        self._post("forms.submit", {"form_token": form_token, "values": values})
-        return None
+        return self._call("forms.submit", {"form_token": form_token, "values": values}, _ignore)
 
     def forms_list_related_records(
         self,
@@ -687,13 +913,11 @@ class MathesarClientRaw:
             data["offset"] = offset
         if search is not None:
             data["search"] = search
-        result = self._post("forms.list_related_records", data)
-        return RecordSummaryList.model_validate(result)
+        return self._call("forms.list_related_records", data, RecordSummaryList.model_validate)
 
     # Roles
     def roles_list(self, *, database_id: int) -> List[RoleInfo]:
-        result = self._post("roles.list", {"database_id": database_id})
-        return [RoleInfo.model_validate(x) for x in result]
+        return self._call("roles.list", {"database_id": database_id}, _list_of(RoleInfo))
 
     def roles_add(
         self, *, rolename: str, database_id: int, password: Optional[str] = None, login: Optional[bool] = None
@@ -703,46 +927,49 @@ class MathesarClientRaw:
             data["password"] = password
         if login is not None:
             data["login"] = login
-        result = self._post("roles.add", data)
-        return RoleInfo.model_validate(result)
+        return self._call("roles.add", data, RoleInfo.model_validate)
 
     def roles_delete(self, *, role_oid: int, database_id: int) -> None:
-        self._post("roles.delete", {"role_oid": role_oid, "database_id": database_id})
-        return None
+        return self._call("roles.delete", {"role_oid": role_oid, "database_id": database_id}, _ignore)
 
     def roles_get_current_role(self, *, database_id: int) -> Dict[str, Any]:
-        return self._post("roles.get_current_role", {"database_id": database_id})
+        return self._call("roles.get_current_role", {"database_id": database_id})
 
     def roles_set_members(self, *, parent_role_oid: int, members: List[int], database_id: int) -> RoleInfo:
         data = {"parent_role_oid": parent_role_oid, "members": members, "database_id": database_id}
-        result = self._post("roles.set_members", data)
-        return RoleInfo.model_validate(result)
+        return self._call("roles.set_members", data, RoleInfo.model_validate)
 
     # Roles configured
     def roles_configured_list(self, *, server_id: int) -> List[ConfiguredRoleInfo]:
-        result = self._post("roles.configured.list", {"server_id": server_id})
-        return [ConfiguredRoleInfo.model_validate(x) for x in result]
+        return self._call("roles.configured.list", {"server_id": server_id}, _list_of(ConfiguredRoleInfo))
 
     def roles_configured_add(self, *, server_id: int, name: str, password: str) -> ConfiguredRoleInfo:
-        result = self._post("roles.configured.add", {"server_id": server_id, "name": name, "password": password})
-        return ConfiguredRoleInfo.model_validate(result)
+        return self._call(
+            "roles.configured.add",
+            {"server_id": server_id, "name": name, "password": password},
+            ConfiguredRoleInfo.model_validate,
+        )
 
     def roles_configured_delete(self, *, configured_role_id: int) -> None:
-        self._post("roles.configured.delete", {"configured_role_id": configured_role_id})
-        return None
+        return self._call("roles.configured.delete", {"configured_role_id": configured_role_id}, _ignore)
 
     def roles_configured_set_password(self, *, configured_role_id: int, password: str) -> None:
-        self._post("roles.configured.set_password", {"configured_role_id": configured_role_id, "password": password})
-        return None
+        return self._call(
+            "roles.configured.set_password",
+            {"configured_role_id": configured_role_id, "password": password},
+            _ignore,
+        )
 
     # Schemas
     def schemas_list(self, *, database_id: int) -> List[SchemaInfo]:
-        result = self._post("schemas.list", {"database_id": database_id})
-        return [SchemaInfo.model_validate(x) for x in result]
+        return self._call("schemas.list", {"database_id": database_id}, self._model_parser(SchemaInfo, many=True))
 
     def schemas_get(self, *, schema_oid: int, database_id: int) -> SchemaInfo:
-        result = self._post("schemas.get", {"schema_oid": schema_oid, "database_id": database_id})
-        return SchemaInfo.model_validate(result)
+        return self._call(
+            "schemas.get",
+            {"schema_oid": schema_oid, "database_id": database_id},
+            self._model_parser(SchemaInfo),
+        )
 
     def schemas_add(
         self, *, name: str, database_id: int, owner_oid: Optional[int] = None, description: Optional[str] = None
@@ -752,22 +979,22 @@ class MathesarClientRaw:
             data["owner_oid"] = owner_oid
         if description is not None:
             data["description"] = description
-        result = self._post("schemas.add", data)
-        return SchemaInfo.model_validate(result)
+        return self._call("schemas.add", data, self._model_parser(SchemaInfo))
 
     def schemas_delete(self, *, schema_oids: List[int], database_id: int) -> None:
-        self._post("schemas.delete", {"schema_oids": schema_oids, "database_id": database_id})
-        return None
+        return self._call("schemas.delete", {"schema_oids": schema_oids, "database_id": database_id}, _ignore)
 
     def schemas_patch(self, *, schema_oid: int, database_id: int, patch: SchemaPatch) -> SchemaInfo:
         data = {"schema_oid": schema_oid, "database_id": database_id, "patch": patch.model_dump(mode="json")}
-        result = self._post("schemas.patch", data)
-        return SchemaInfo.model_validate(result)
+        return self._call("schemas.patch", data, self._model_parser(SchemaInfo))
 
     # Schema privileges
     def schemas_privileges_list_direct(self, *, schema_oid: int, database_id: int) -> List[SchemaPrivileges]:
-        result = self._post("schemas.privileges.list_direct", {"schema_oid": schema_oid, "database_id": database_id})
-        return [SchemaPrivileges.model_validate(x) for x in result]
+        return self._call(
+            "schemas.privileges.list_direct",
+            {"schema_oid": schema_oid, "database_id": database_id},
+            _list_of(SchemaPrivileges),
+        )
 
     def schemas_privileges_replace_for_roles(
         self, *, privileges: List[SchemaPrivileges], schema_oid: int, database_id: int
@@ -777,24 +1004,20 @@ class MathesarClientRaw:
             "schema_oid": schema_oid,
             "database_id": database_id,
         }
-        result = self._post("schemas.privileges.replace_for_roles", data)
-        return [SchemaPrivileges.model_validate(x) for x in result]
+        return self._call("schemas.privileges.replace_for_roles", data, _list_of(SchemaPrivileges))
 
     def schemas_privileges_transfer_ownership(
         self, *, schema_oid: int, new_owner_oid: int, database_id: int
     ) -> SchemaInfo:
         data = {"schema_oid": schema_oid, "new_owner_oid": new_owner_oid, "database_id": database_id}
-        result = self._post("schemas.privileges.transfer_ownership", data)
-        return SchemaInfo.model_validate(result)
+        return self._call("schemas.privileges.transfer_ownership", data, self._model_parser(SchemaInfo))
 
     # Tables
     def tables_list(self, *, schema_oid: int, database_id: int) -> List[TableInfo]:
-        result = self._post("tables.list", {"schema_oid": schema_oid, "database_id": database_id})
-        return [TableInfo.model_validate(x) for x in result]
+        return self._call("tables.list", {"schema_oid": schema_oid, "database_id": database_id}, self._model_parser(TableInfo, many=True))
 
     def tables_get(self, *, table_oid: int, database_id: int) -> TableInfo:
-        result = self._post("tables.get", {"table_oid": table_oid, "database_id": database_id})
-        return TableInfo.model_validate(result)
+        return self._call("tables.get", {"table_oid": table_oid, "database_id": database_id}, self._model_parser(TableInfo))
 
     def tables_add(
         self,
@@ -821,11 +1044,10 @@ class MathesarClientRaw:
             data["owner_oid"] = owner_oid
         if comment is not None:
             data["comment"] = comment
-        result = self._post("tables.add", data)
-        return AddedTableInfo.model_validate(result)
+        return self._call("tables.add", data, AddedTableInfo.model_validate)
 
     def tables_delete(self, *, table_oid: int, database_id: int, cascade: bool = False) -> str:
-        return self._post("tables.delete", {"table_oid": table_oid, "database_id": database_id, "cascade": cascade})
+        return self._call("tables.delete", {"table_oid": table_oid, "database_id": database_id, "cascade": cascade})
 
     def tables_patch(self, *, table_oid: int, table_data_dict: SettableTableInfo, database_id: int) -> str:
         data = {
@@ -833,7 +1055,7 @@ class MathesarClientRaw:
             "table_data_dict": table_data_dict.model_dump(mode="json"),
             "database_id": database_id,
         }
-        return self._post("tables.patch", data)
+        return self._call("tables.patch", data)
 
     def tables_import(
         self,
@@ -853,8 +1075,7 @@ class MathesarClientRaw:
             data["table_name"] = table_name
         if comment is not None:
             data["comment"] = comment
-        result = self._post("tables.import", data)
-        return AddedTableInfo.model_validate(result)
+        return self._call("tables.import", data, AddedTableInfo.model_validate)
 
     def tables_get_import_preview(
         self,
@@ -870,33 +1091,33 @@ class MathesarClientRaw:
             "database_id": database_id,
             "limit": limit,
         }
-        return self._post("tables.get_import_preview", data)
+        return self._call("tables.get_import_preview", data)
 
     def tables_list_joinable(self, *, table_oid: int, database_id: int, max_depth: int = 3) -> JoinableTableInfo:
         data = {"table_oid": table_oid, "database_id": database_id, "max_depth": max_depth}
-        result = self._post("tables.list_joinable", data)
-        return JoinableTableInfo.model_validate(result)
+        return self._call("tables.list_joinable", data, JoinableTableInfo.model_validate)
 
     def tables_list_with_metadata(self, *, schema_oid: int, database_id: int) -> List[Dict[str, Any]]:
-        return self._post("tables.list_with_metadata", {"schema_oid": schema_oid, "database_id": database_id})
+        return self._call("tables.list_with_metadata", {"schema_oid": schema_oid, "database_id": database_id})
 
     def tables_get_with_metadata(self, *, table_oid: int, database_id: int) -> Dict[str, Any]:
-        return self._post("tables.get_with_metadata", {"table_oid": table_oid, "database_id": database_id})
+        return self._call("tables.get_with_metadata", {"table_oid": table_oid, "database_id": database_id})
 
     # Tables metadata
     def tables_metadata_list(self, *, database_id: int) -> List[TableMetaDataRecord]:
-        result = self._post("tables.metadata.list", {"database_id": database_id})
-        return [TableMetaDataRecord.model_validate(x) for x in result]
+        return self._call("tables.metadata.list", {"database_id": database_id}, _list_of(TableMetaDataRecord))
 
     def tables_metadata_set(self, *, table_oid: int, metadata: TableMetaDataBlob, database_id: int) -> None:
         data = {"table_oid": table_oid, "metadata": metadata.model_dump(mode="json"), "database_id": database_id}
-        self._post("tables.metadata.set", data)
-        return None
+        return self._call("tables.metadata.set", data, _ignore)
 
     # Tables privileges
     def tables_privileges_list_direct(self, *, table_oid: int, database_id: int) -> List[TablePrivileges]:
-        result = self._post("tables.privileges.list_direct", {"table_oid": table_oid, "database_id": database_id})
-        return [TablePrivileges.model_validate(x) for x in result]
+        return self._call(
+            "tables.privileges.list_direct",
+            {"table_oid": table_oid, "database_id": database_id},
+            _list_of(TablePrivileges),
+        )
 
     def tables_privileges_replace_for_roles(
         self, *, privileges: List[TablePrivileges], table_oid: int, database_id: int
@@ -906,30 +1127,24 @@ class MathesarClientRaw:
             "table_oid": table_oid,
             "database_id": database_id,
         }
-        result = self._post("tables.privileges.replace_for_roles", data)
-        return [TablePrivileges.model_validate(x) for x in result]
+        return self._call("tables.privileges.replace_for_roles", data, _list_of(TablePrivileges))
 
     def tables_privileges_transfer_ownership(self, *, table_oid: int, new_owner_oid: int, database_id: int) -> TableInfo:
         data = {"table_oid": table_oid, "new_owner_oid": new_owner_oid, "database_id": database_id}
-        result = self._post("tables.privileges.transfer_ownership", data)
-        return TableInfo.model_validate(result)
+        return self._call("tables.privileges.transfer_ownership", data, self._model_parser(TableInfo))
 
     # Users
     def users_list(self) -> List[UserInfo]:
-        result = self._post("users.list", {})
-        return [UserInfo.model_validate(x) for x in result]
+        return self._call("users.list", {}, _list_of(UserInfo))
 
     def users_get(self, *, user_id: int) -> UserInfo:
-        result = self._post("users.get", {"user_id": user_id})
-        return UserInfo.model_validate(result)
+        return self._call("users.get", {"user_id": user_id}, UserInfo.model_validate)
 
     def users_add(self, *, user_def: UserDef) -> UserInfo:
-        result = self._post("users.add", {"user_def": user_def.model_dump(mode="json")})
-        return UserInfo.model_validate(result)
+        return self._call("users.add", {"user_def": user_def.model_dump(mode="json")}, UserInfo.model_validate)
 
     def users_delete(self, *, user_id: int) -> None:
-        self._post("users.delete", {"user_id": user_id})
-        return None
+        return self._call("users.delete", {"user_id": user_id}, _ignore)
 
     def users_patch_self(
         self, *, username: str, email: str, full_name: str, display_language: str
@@ -940,8 +1155,7 @@ class MathesarClientRaw:
             "full_name": full_name,
             "display_language": display_language,
         }
-        result = self._post("users.patch_self", data)
-        return UserInfo.model_validate(result)
+        return self._call("users.patch_self", data, UserInfo.model_validate)
 
     def users_patch_other(
         self,
@@ -961,33 +1175,206 @@ class MathesarClientRaw:
             "full_name": full_name,
             "display_language": display_language,
         }
-        result = self._post("users.patch_other", data)
-        return UserInfo.model_validate(result)
+        return self._call("users.patch_other", data, UserInfo.model_validate)
 
     def users_replace_own(self, *, old_password: str, new_password: str) -> None:
-        self._post("users.replace_own", {"old_password": old_password, "new_password": new_password})
-        return None
+        return self._call("users.replace_own", {"old_password": old_password, "new_password": new_password}, _ignore)
 
     def users_revoke(self, *, user_id: int, new_password: str) -> None:
-        self._post("users.revoke", {"user_id": user_id, "new_password": new_password})
-        return None
+        return self._call("users.revoke", {"user_id": user_id, "new_password": new_password}, _ignore)
+
+
+    def _call(self, method: str, params: Dict[str, Any], parse: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Execute an RPC call and convert its result with ``parse``.
+
+        While a batch is recording on this thread the call is queued on the batch
+        instead, and a Future for the parsed result is returned. With automatic
+        batching enabled the call is coalesced with concurrent calls from other
+        threads.
+        """
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            return batch._enqueue(method, params, parse)
+        if self._auto_batcher is not None:
+            return self._auto_batcher.submit(method, params, parse)
+        result = self._post(method, params)
+        return parse(result) if parse is not None else result
+
+    def _record_list_parser(self, validate: Optional[bool]) -> Callable[[Any], RecordList]:
+        if validate if validate is not None else self.validate:
+            return RecordList.model_validate
+        return _construct_record_list
+
+    def _model_parser(self, model: Any, many: bool = False) -> Callable[[Any], Any]:
+        # Parser for a reply holding ``model`` (or a list of them) in the selected backend
+        if self.model_backend == "compact":
+            parse = compact_parser(model, many)
+            if parse is not None:
+                return parse
+        return _list_of(model) if many else model.model_validate
+
+    def _next_id(self) -> int:
+        # next() on itertools.count is atomic, so ids stay unique across threads
+        return next(self._ids)
+
+    def _request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": self._next_id(),
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+        }
 
+    def _http_post(self, payload: Any, **kwargs: Any) -> Any:
+        body = self.codec.encode(payload)
+        headers = {**(kwargs.pop("headers", None) or {}), "Accept-Encoding": ACCEPT_ENCODING}
+        if self.compress_requests is not None and len(body) >= self.compress_requests:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+        return self.transport.post(self.__api_url, content=body, headers=headers, **kwargs)
+
+    def _send(self, payload: Any, stream: bool = False) -> Any:
+        policy = self.retry
+        if policy is None or not policy.allows(payload_methods(payload)):
+            return self._attempt(payload, stream)
+        policy.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return self._attempt(payload, stream)
+            except Exception as e:
+                if not policy.should_retry(e, attempt):
+                    raise
+                delay = self._retry_delay(policy, attempt, e)
+            sleep(delay)
+            attempt += 1
+
+    def _attempt(self, payload: Any, stream: bool = False) -> Any:
+        # With stream=True, returns the response and the callback that ends the
+        # attempt once the body has been read
+        if self.breaker is None and self.limiter is None:
+            response = self._send_once(payload, stream)
+            return (response, None) if stream else response
+        if self.limiter is not None:
+            self.limiter.acquire(remaining())
+        self._admit()
+        start = monotonic()
+        overloaded = False
+        held = False
+        try:
+            result = self._send_once(payload, stream)
+            if stream:
+                held = True
+                return result, self._stream_finisher(monotonic() - start)
+            return result
+        except Exception as e:
+            overloaded = is_overload(e)
+            raise
+        finally:
+            if not held:
+                self._record_attempt(monotonic() - start, overloaded)
+
+    def _stream_finisher(self, latency: float) -> Callable[[Optional[BaseException]], None]:
+        # A streamed body is still being downloaded after the headers arrive, so
+        # the limiter slot is kept until the stream is closed. The latency up to
+        # the headers is reported, so a slow consumer does not shrink the window.
+        def finish(error: Optional[BaseException]) -> None:
+            self._record_attempt(latency, error is not None and is_overload(error))
+
+        return finish
+
+    def _admit(self) -> None:
+        if self.breaker is None:
+            return
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError:
+            if self.limiter is not None:
+                self.limiter.release()
+            raise
+
+    def _record_attempt(self, latency: float, overloaded: bool) -> None:
+        # Reports latency and outcome of one attempt to the limiter and breaker
+        if self.limiter is not None:
+            self.limiter.release(latency, overloaded)
+        if self.breaker is not None:
+            self.breaker.record(overloaded)
+
+    @staticmethod
+    def _retry_delay(policy: RetryPolicy, attempt: int, error: Exception) -> float:
+        delay = policy.backoff(attempt)
+        left = remaining()
+        if left is not None and delay >= left:
+            raise DeadlineExceeded("Deadline exceeded before the call could be retried") from error
+        return delay
+
+    def _request_kwargs(self, auth_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        key = idempotency_key()
+        if key is not None:
+            auth_kwargs["headers"] = {**auth_kwargs.get("headers", {}), "Idempotency-Key": key}
+        left = remaining()
+        if left is not None:
+            auth_kwargs["timeout"] = capped_timeout(self.transport.timeout, left)
+        return auth_kwargs
+
+    def _send_once(self, payload: Any, stream: bool = False) -> Any:
+        # A rejected session is renewed once and the request is sent again.
+        # With stream=True the response is returned with its body still unread.
+        for renewed in (False, True):
+            kwargs = self._request_kwargs(self._auth.prepare(self.transport))
+            if stream:
+                kwargs["stream"] = True
+            try:
+                response = self._http_post(payload, **kwargs)
+            except Exception as e:
+                if expired():
+                    raise DeadlineExceeded("Deadline exceeded") from e
+                raise
+            if not renewed and self._auth.rejected(response):
+                response.close()
+                self._auth.login(self.transport)
+                continue
+            if stream:
+                if response.status_code >= 400:
+                    response.close()
+                response.raise_for_status()
+                return response
+            response.raise_for_status()
+            data = self.codec.decode(response.content)
+            if not renewed and self._auth.rejected_reply(data):
+                self._auth.login(self.transport)
+                continue
+            return data
+
+    @staticmethod
+    def _unwrap(reply: Dict[str, Any]) -> Any:
+        if "error" in reply:
+            raise MathesarClientError(reply["error"])
+        return reply["result"]
+
+    @staticmethod
+    def _match_replies(requests: List[Dict[str, Any]], replies: Any) -> List[Dict[str, Any]]:
+        if not isinstance(replies, list):
+            # The server rejected the batch as a whole
+            raise MathesarClientError(replies.get("error", replies))
+        by_id = {reply.get("id"): reply for reply in replies}
+        return [
+            by_id.get(request["id"], {"error": {"message": "No reply to JSON-RPC call", "id": request["id"]}})
+            for request in requests
+        ]
 
     def _post(self, method: str, data: Dict[str, Any]) -> Any:
-        response = post(
-            self.__api_url,
-            json={
-                "id": randint(1, 1000),
-                "jsonrpc": "2.0",
-                "method": method,
-                "params": data
-            },
-            auth=(self.__username, self.__password)
-        )
-        response.raise_for_status()
-        data = response.json()
+        return self._unwrap(self._send(self._request(method, data)))
+
+    def _open_stream(self, method: str, data: Dict[str, Any], chunk_size: int) -> Any:
+        response, finish = self._send(self._request(method, data), stream=True)
+        return RecordStream(response, chunk_size, on_close=finish)
 
-        if "error" in data:
-            raise MathesarClientError(data["error"])
+    def _post_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Send several calls in one JSON-RPC batch request.
 
-        return data["result"]
+        Returns:
+            The reply objects in the order of ``calls``, matched by request id.
+        """
+        requests = [self._request(method, params) for method, params in calls]
+        return self._match_replies(requests, self._send(requests))
@@ -0,0 +1,270 @@
+"""Low-level asyncio JSON-RPC client for Mathesar API.
+
+AsyncMathesarClientRaw exposes exactly the same methods, parameters and
+Pydantic models as MathesarClientRaw, but every API method returns an awaitable
+and requests go through a shared httpx connection pool.
+"""
+
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Semaphore, get_running_loop, sleep, timeout as async_timeout
+from time import monotonic
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from .auth import Auth
+from .batch import PendingCall, RpcBatch
+from .client_raw import MathesarClientRaw
+from .codec import CodecName, JsonCodec
+from .compact import ModelBackend
+from .deadlines import expired, remaining
+from .errors import DeadlineExceeded
+from .limiter import AdaptiveLimiter, CircuitBreaker, is_overload
+from .retry import RetryPolicy, payload_methods
+from .stream import AsyncRecordStream
+from .transport import _DEFAULT, AsyncHttpTransport, Timeout
+
+
+async def aresolve_calls(raw: AsyncMathesarClientRaw, calls: List[PendingCall]) -> None:
+    """Async counterpart of ``batch.resolve_calls``."""
+    if not calls:
+        return
+    try:
+        replies = await raw._post_batch([(c.method, c.params) for c in calls])
+    except BaseException as e:
+        for c in calls:
+            c.future.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+        return
+    for c, reply in zip(calls, replies):
+        try:
+            result = raw._unwrap(reply)
+            c.future.set_result(c.parse(result) if c.parse is not None else result)
+        except Exception as e:
+            c.future.set_exception(e)
+
+
+class AsyncRpcBatch(RpcBatch):
+    """JSON-RPC batch for the async raw client.
+
+    Use with ``async with``; the queued calls are sent when the block exits.
+
+    Example:
+        >>> async with raw.batch() as b:
+        ...     columns = b.columns_list(table_oid=123, database_id=1)
+        >>> columns.result()
+    """
+
+    async def send(self) -> None:  # type: ignore[override]
+        """Send all queued calls in one request and resolve their futures."""
+        calls, self._calls = self._calls, []
+        await aresolve_calls(self._raw, calls)  # type: ignore[arg-type]
+
+    def __enter__(self) -> AsyncRpcBatch:
+        raise TypeError("Use 'async with' for batches of AsyncMathesarClientRaw")
+
+    async def __aenter__(self) -> AsyncRpcBatch:
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            await self.send()
+        else:
+            self.cancel()
+
+
+class AsyncMathesarClientRaw(MathesarClientRaw):
+    """Low-level asyncio JSON-RPC client for Mathesar API.
+
+    Every API method of MathesarClientRaw is available with the same signature
+    and returns an awaitable resolving to the same Pydantic models. All calls
+    share one AsyncHttpTransport, so many calls can be in flight on a single
+    event loop without a thread per call.
+
+    Args:
+        base_url: Base URL of the Mathesar instance. Falls back to MATHESAR_BASE_URL env var.
+        username: Username to authenticate with. Falls back to MATHESAR_USERNAME env var.
+        password: Password to authenticate with. Falls back to MATHESAR_PASSWORD env var.
+        auth: "basic" (default), "session" or a custom Auth instance. See MathesarClientRaw.
+        retry: Retry policy for transient failures. See MathesarClientRaw.
+        limiter: Optional AdaptiveLimiter shared by all coroutines using this client.
+        breaker: Optional CircuitBreaker failing calls fast after a run of failures.
+        compress_requests: Gzip request bodies of at least this many bytes. See MathesarClientRaw.
+        validate: Validate record pages against RecordList. See MathesarClientRaw.
+        model_backend: "pydantic" or "compact" metadata models. See MathesarClientRaw.
+        json_codec: JSON codec for request bodies and responses. See MathesarClientRaw.
+        transport: Optional AsyncHttpTransport to send requests through.
+        pool_size: Maximum number of concurrent connections when no transport is given.
+        timeout: Default per-call timeout in seconds (or a (connect, read) tuple)
+                 when no transport is given. None waits indefinitely.
+        http2: Multiplex calls over one HTTP/2 connection when no transport is given.
+        table_concurrency: Maximum number of pages of one table fetched at the same
+                           time by all ``AsyncTable.fetch_all`` calls using this client.
+
+    Example:
+        >>> async with AsyncMathesarClientRaw() as client:
+        ...     records = await client.records_list(database_id=1, table_id=123)
+    """
+
+    transport: AsyncHttpTransport  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        *,
+        auth: Literal["basic", "session"] | Auth = "basic",
+        retry: Optional[RetryPolicy] = _DEFAULT,
+        limiter: Optional[AdaptiveLimiter] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        compress_requests: Optional[int] = None,
+        validate: bool = True,
+        model_backend: ModelBackend = "pydantic",
+        json_codec: CodecName | JsonCodec = "auto",
+        transport: Optional[AsyncHttpTransport] = None,
+        pool_size: int = 100,
+        timeout: Timeout = None,
+        http2: bool = False,
+        table_concurrency: int = 8,
+    ):
+        super().__init__(
+            base_url,
+            username,
+            password,
+            auth=auth,
+            retry=retry,
+            limiter=limiter,
+            breaker=breaker,
+            compress_requests=compress_requests,
+            validate=validate,
+            model_backend=model_backend,
+            json_codec=json_codec,
+            transport=transport or AsyncHttpTransport(max_connections=pool_size, timeout=timeout, http2=http2),  # type: ignore[arg-type]
+            table_concurrency=table_concurrency,
+        )
+        self._loop_table_slots: WeakKeyDictionary[AbstractEventLoop, Dict[Tuple[int, int], Semaphore]] = (
+            WeakKeyDictionary()
+        )
+
+    def _slots_for_table(self, database_id: int, table_oid: int) -> Semaphore:
+        # An asyncio semaphore belongs to the loop it is first used on, so a
+        # client used from several asyncio.run() calls keeps one set per loop
+        loop = get_running_loop()
+        with self._table_slots_lock:
+            tables = self._loop_table_slots.get(loop)
+            if tables is None:
+                tables = self._loop_table_slots[loop] = {}
+            slots = tables.get((database_id, table_oid))
+            if slots is None:
+                slots = tables[(database_id, table_oid)] = Semaphore(self.table_concurrency)
+        return slots
+
+    def batch(self) -> AsyncRpcBatch:
+        """Start a JSON-RPC batch, sent when its ``async with`` block exits."""
+        return AsyncRpcBatch(self)
+
+    def close(self) -> None:
+        raise TypeError("Use 'await client.aclose()' to close AsyncMathesarClientRaw")
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by the underlying transport."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> AsyncMathesarClientRaw:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _call(self, method: str, params: Dict[str, Any], parse: Optional[Callable[[Any], Any]] = None) -> Any:
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            return batch._enqueue(method, params, parse)
+        return self._acall(method, params, parse)
+
+    async def _acall(self, method: str, params: Dict[str, Any], parse: Optional[Callable[[Any], Any]]) -> Any:
+        result = await self._post(method, params)
+        return parse(result) if parse is not None else result
+
+    async def _send(self, payload: Any, stream: bool = False) -> Any:
+        policy = self.retry
+        if policy is None or not policy.allows(payload_methods(payload)):
+            return await self._attempt(payload, stream)
+        policy.budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(payload, stream)
+            except Exception as e:
+                if not policy.should_retry(e, attempt):
+                    raise
+                delay = self._retry_delay(policy, attempt, e)
+            await sleep(delay)
+            attempt += 1
+
+    async def _attempt(self, payload: Any, stream: bool = False) -> Any:  # type: ignore[override]
+        if self.breaker is None and self.limiter is None:
+            response = await self._send_once(payload, stream)
+            return (response, None) if stream else response
+        if self.limiter is not None:
+            await self.limiter.aacquire(remaining())
+        self._admit()
+        start = monotonic()
+        overloaded = False
+        held = False
+        try:
+            result = await self._send_once(payload, stream)
+            if stream:
+                # The slot is kept until the stream is closed. See MathesarClientRaw._stream_finisher.
+                held = True
+                return result, self._stream_finisher(monotonic() - start)
+            return result
+        except Exception as e:
+            overloaded = is_overload(e)
+            raise
+        finally:
+            if not held:
+                self._record_attempt(monotonic() - start, overloaded)
+
+    async def _send_once(self, payload: Any, stream: bool = False) -> Any:  # type: ignore[override]
+        for renewed in (False, True):
+            kwargs = self._request_kwargs(await self._auth.aprepare(self.transport))
+            if stream:
+                kwargs["stream"] = True
+            left = remaining()
+            try:
+                # httpx timeouts apply per phase, so the whole request is bounded too
+                async with async_timeout(left):
+                    response = await self._http_post(payload, **kwargs)
+            except Exception as e:
+                if expired() or (left is not None and isinstance(e, TimeoutError)):
+                    raise DeadlineExceeded("Deadline exceeded") from e
+                raise
+            if not renewed and self._auth.rejected(response):
+                await response.aclose()
+                await self._auth.alogin(self.transport)
+                continue
+            if stream:
+                if response.status_code >= 400:
+                    await response.aclose()
+                response.raise_for_status()
+                return response
+            response.raise_for_status()
+            data = self.codec.decode(response.content)
+            if not renewed and self._auth.rejected_reply(data):
+                await self._auth.alogin(self.transport)
+                continue
+            return data
+
+    async def _post(self, method: str, data: Dict[str, Any]) -> Any:
+        return self._unwrap(await self._send(self._request(method, data)))
+
+    async def _open_stream(self, method: str, data: Dict[str, Any], chunk_size: int) -> AsyncRecordStream:  # type: ignore[override]
+        response, finish = await self._send(self._request(method, data), stream=True)
+        return AsyncRecordStream(response, chunk_size, on_close=finish)
+
+    async def _post_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        requests = [self._request(method, params) for method, params in calls]
+        return self._match_replies(requests, await self._send(requests))
@@ -8,13 +8,19 @@ All models use Pydantic v2 for validation and serialization.
 from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional, Tuple, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Model(BaseModel):
+    # Validators are built on first use instead of at import time, so importing
+    # the package stays cheap for short-lived processes
+    model_config = ConfigDict(defer_build=True)
 
 
 # Records models
 
 
-class OrderBy(BaseModel):
+class OrderBy(_Model):
     """Specifies ordering for record queries.
     
     Attributes:
@@ -25,7 +31,7 @@ class OrderBy(BaseModel):
     direction: Literal["asc", "desc"]
 
 
-class FilterAttnum(BaseModel):
+class FilterAttnum(_Model):
     """Filter referencing a column by its attribute number.
     
     Attributes:
@@ -36,7 +42,7 @@ class FilterAttnum(BaseModel):
     value: int
 
 
-class FilterLiteral(BaseModel):
+class FilterLiteral(_Model):
     """Filter using a literal value.
     
     Attributes:
@@ -47,7 +53,7 @@ class FilterLiteral(BaseModel):
     value: Any
 
 
-class _Filter(BaseModel):
+class _Filter(_Model):
     """Recursive filter structure for complex query conditions.
     
     Attributes:
@@ -58,14 +64,12 @@ class _Filter(BaseModel):
     args: List[Union["_Filter", FilterAttnum, FilterLiteral]]
 
 
-# Expose Filter as alias to the recursive model
+# Expose Filter as alias to the recursive model. The self-reference is resolved
+# when the deferred schema is built.
 Filter = _Filter
 
-# Rebuild for self-referencing types
-_Filter.model_rebuild()
-
 
-class Grouping(BaseModel):
+class Grouping(_Model):
     """Specifies grouping for record queries.
     
     Attributes:
@@ -76,7 +80,7 @@ class Grouping(BaseModel):
     preproc: Optional[List[str]] = None
 
 
-class Group(BaseModel):
+class Group(_Model):
     """A single group in a grouping response.
     
     Attributes:
@@ -91,7 +95,7 @@ class Group(BaseModel):
     result_indices: List[int]
 
 
-class GroupingResponse(BaseModel):
+class GroupingResponse(_Model):
     """Response containing grouped query results.
     
     Attributes:
@@ -104,7 +108,7 @@ class GroupingResponse(BaseModel):
     groups: List[Group]
 
 
-class SearchParam(BaseModel):
+class SearchParam(_Model):
     """Search parameter for text search queries.
     
     Attributes:
@@ -118,7 +122,7 @@ class SearchParam(BaseModel):
 RecordObject = Dict[str, Any]
 
 
-class RecordList(BaseModel):
+class RecordList(_Model):
     """List of records returned from a query.
     
     Attributes:
@@ -137,7 +141,7 @@ class RecordList(BaseModel):
     download_links: Optional[Dict[str, Any]] = None
 
 
-class RecordAdded(BaseModel):
+class RecordAdded(_Model):
     """Response after adding or updating a record.
     
     Attributes:
@@ -150,7 +154,7 @@ class RecordAdded(BaseModel):
     record_summaries: Optional[Dict[str, str]] = None
 
 
-class SummarizedRecordReference(BaseModel):
+class SummarizedRecordReference(_Model):
     """A reference to a record with its display summary.
     
     Attributes:
@@ -161,7 +165,7 @@ class SummarizedRecordReference(BaseModel):
     summary: str
 
 
-class RecordSummaryList(BaseModel):
+class RecordSummaryList(_Model):
     """List of summarized record references.
     
     Attributes:
@@ -175,7 +179,7 @@ class RecordSummaryList(BaseModel):
 # Analytics
 
 
-class AnalyticsState(BaseModel):
+class AnalyticsState(_Model):
     """Current state of analytics collection.
     
     Attributes:
@@ -184,7 +188,7 @@ class AnalyticsState(BaseModel):
     enabled: bool
 
 
-class AnalyticsReport(BaseModel):
+class AnalyticsReport(_Model):
     """Analytics report containing usage statistics.
     
     Attributes:
@@ -212,7 +216,7 @@ class AnalyticsReport(BaseModel):
 # Collaborators
 
 
-class CollaboratorInfo(BaseModel):
+class CollaboratorInfo(_Model):
     """Information about a database collaborator.
     
     Attributes:
@@ -230,7 +234,7 @@ class CollaboratorInfo(BaseModel):
 # Columns
 
 
-class TypeOptions(BaseModel):
+class TypeOptions(_Model):
     """Options for configuring column data types.
     
     Attributes:
@@ -247,7 +251,7 @@ class TypeOptions(BaseModel):
     item_type: Optional[str] = None
 
 
-class ColumnDefault(BaseModel):
+class ColumnDefault(_Model):
     """Default value configuration for a column.
     
     Attributes:
@@ -258,7 +262,7 @@ class ColumnDefault(BaseModel):
     is_dynamic: bool
 
 
-class ColumnInfo(BaseModel):
+class ColumnInfo(_Model):
     """Complete information about a table column.
     
     Attributes:
@@ -285,7 +289,7 @@ class ColumnInfo(BaseModel):
     current_role_priv: List[Literal['SELECT', 'INSERT', 'UPDATE', 'REFERENCES']]
 
 
-class CreatablePkColumnInfo(BaseModel):
+class CreatablePkColumnInfo(_Model):
     """Configuration for creating a primary key column.
     
     Attributes:
@@ -296,7 +300,7 @@ class CreatablePkColumnInfo(BaseModel):
     type: Optional[Literal['IDENTITY', 'UUIDv4']] = None
 
 
-class CreatableColumnInfo(BaseModel):
+class CreatableColumnInfo(_Model):
     """Configuration for creating a new column.
     
     Attributes:
@@ -315,7 +319,7 @@ class CreatableColumnInfo(BaseModel):
     description: Optional[str] = None
 
 
-class SettableColumnInfo(BaseModel):
+class SettableColumnInfo(_Model):
     """Configuration for updating an existing column.
     
     Attributes:
@@ -338,7 +342,7 @@ class SettableColumnInfo(BaseModel):
     description: Optional[str] = None
 
 
-class ColumnMetaDataBlob(BaseModel):
+class ColumnMetaDataBlob(_Model):
     """Metadata for customizing column display and behavior.
     
     Attributes:
@@ -377,7 +381,7 @@ class ColumnMetaDataBlob(BaseModel):
     file_backend: Optional[int] = None
 
 
-class ColumnMetaDataRecord(BaseModel):
+class ColumnMetaDataRecord(_Model):
     """Stored column metadata record including database/table identifiers.
     
     Inherits all attributes from ColumnMetaDataBlob plus:
@@ -408,7 +412,7 @@ class ColumnMetaDataRecord(BaseModel):
 # Configured Databases
 
 
-class ConfiguredDatabaseInfo(BaseModel):
+class ConfiguredDatabaseInfo(_Model):
     """Information about a database configured in Mathesar.
     
     Attributes:
@@ -427,7 +431,7 @@ class ConfiguredDatabaseInfo(BaseModel):
     nickname: Optional[str] = None
 
 
-class ConfiguredDatabasePatch(BaseModel):
+class ConfiguredDatabasePatch(_Model):
     """Fields that can be updated on a configured database.
     
     Attributes:
@@ -441,7 +445,7 @@ class ConfiguredDatabasePatch(BaseModel):
 # Constraints
 
 
-class ForeignKeyConstraint(BaseModel):
+class ForeignKeyConstraint(_Model):
     """Foreign key constraint definition.
     
     Attributes:
@@ -466,7 +470,7 @@ class ForeignKeyConstraint(BaseModel):
     fkey_match_type: Optional[str] = None
 
 
-class PrimaryKeyConstraint(BaseModel):
+class PrimaryKeyConstraint(_Model):
     """Primary key constraint definition.
     
     Attributes:
@@ -481,7 +485,7 @@ class PrimaryKeyConstraint(BaseModel):
     deferrable: Optional[bool] = None
 
 
-class UniqueConstraint(BaseModel):
+class UniqueConstraint(_Model):
     """Unique constraint definition.
     
     Attributes:
@@ -499,7 +503,7 @@ class UniqueConstraint(BaseModel):
 CreatableConstraintInfo = List[Union[ForeignKeyConstraint, PrimaryKeyConstraint, UniqueConstraint]]
 
 
-class ConstraintInfo(BaseModel):
+class ConstraintInfo(_Model):
     """Generic constraint information from the database.
     
     Accepts any fields returned by the server.
@@ -512,7 +516,7 @@ class ConstraintInfo(BaseModel):
 # Data Modeling
 
 
-class MappingColumn(BaseModel):
+class MappingColumn(_Model):
     """Column specification for creating a mapping table.
     
     Attributes:
@@ -523,7 +527,7 @@ class MappingColumn(BaseModel):
     referent_table_oid: int
 
 
-class SplitTableInfo(BaseModel):
+class SplitTableInfo(_Model):
     """Information about a table split operation result.
     
     Attributes:
@@ -537,7 +541,7 @@ class SplitTableInfo(BaseModel):
 # Databases and privileges
 
 
-class DatabaseInfo(BaseModel):
+class DatabaseInfo(_Model):
     """Information about a PostgreSQL database.
     
     Attributes:
@@ -554,7 +558,7 @@ class DatabaseInfo(BaseModel):
     current_role_owns: bool
 
 
-class DBPrivileges(BaseModel):
+class DBPrivileges(_Model):
     """Privileges for a specific role on a database.
     
     Attributes:
@@ -568,7 +572,7 @@ class DBPrivileges(BaseModel):
 # Database setup
 
 
-class ConfiguredServerInfo(BaseModel):
+class ConfiguredServerInfo(_Model):
     """Information about a configured PostgreSQL server.
     
     Attributes:
@@ -581,7 +585,7 @@ class ConfiguredServerInfo(BaseModel):
     port: int | None = None
 
 
-class ConfiguredRoleInfo(BaseModel):
+class ConfiguredRoleInfo(_Model):
     """Information about a configured database role.
     
     Attributes:
@@ -594,7 +598,7 @@ class ConfiguredRoleInfo(BaseModel):
     server_id: int
 
 
-class DatabaseConnectionResult(BaseModel):
+class DatabaseConnectionResult(_Model):
     """Result of connecting or creating a database.
     
     Attributes:
@@ -610,7 +614,7 @@ class DatabaseConnectionResult(BaseModel):
 # Explorations
 
 
-class ExplorationInfo(BaseModel):
+class ExplorationInfo(_Model):
     """Information about a saved exploration (query).
     
     Attributes:
@@ -637,7 +641,7 @@ class ExplorationInfo(BaseModel):
     description: Optional[str] = None
 
 
-class ExplorationDef(BaseModel):
+class ExplorationDef(_Model):
     """Definition for creating or running an exploration.
     
     Attributes:
@@ -662,7 +666,7 @@ class ExplorationDef(BaseModel):
     description: Optional[str] = None
 
 
-class ExplorationResult(BaseModel):
+class ExplorationResult(_Model):
     """Result of running an exploration query.
     
     Attributes:
@@ -684,7 +688,7 @@ class ExplorationResult(BaseModel):
 # Forms
 
 
-class FieldInfo(BaseModel):
+class FieldInfo(_Model):
     """Information about a form field.
     
     Attributes:
@@ -722,7 +726,7 @@ class FieldInfo(BaseModel):
 FieldInfo.model_rebuild()
 
 
-class FormInfo(BaseModel):
+class FormInfo(_Model):
     """Complete information about a form.
     
     Attributes:
@@ -765,7 +769,7 @@ class FormInfo(BaseModel):
     fields: List[FieldInfo]
 
 
-class AddOrReplaceFieldDef(BaseModel):
+class AddOrReplaceFieldDef(_Model):
     """Definition for adding or replacing a form field.
     
     Attributes:
@@ -797,7 +801,7 @@ class AddOrReplaceFieldDef(BaseModel):
 AddOrReplaceFieldDef.model_rebuild()
 
 
-class AddFormDef(BaseModel):
+class AddFormDef(_Model):
     """Definition for creating a new form.
     
     Attributes:
@@ -833,7 +837,7 @@ class SettableFormDef(AddFormDef):
 # Roles and configured roles
 
 
-class RoleMember(BaseModel):
+class RoleMember(_Model):
     """Information about a role member.
     
     Attributes:
@@ -844,7 +848,7 @@ class RoleMember(BaseModel):
     admin: bool
 
 
-class RoleInfo(BaseModel):
+class RoleInfo(_Model):
     """Complete information about a PostgreSQL role.
     
     Attributes:
@@ -872,7 +876,7 @@ class RoleInfo(BaseModel):
 # Schemas and privileges
 
 
-class SchemaInfo(BaseModel):
+class SchemaInfo(_Model):
     """Information about a database schema.
     
     Attributes:
@@ -893,7 +897,7 @@ class SchemaInfo(BaseModel):
     table_count: int
 
 
-class SchemaPatch(BaseModel):
+class SchemaPatch(_Model):
     """Fields that can be updated on a schema.
     
     Attributes:
@@ -904,7 +908,7 @@ class SchemaPatch(BaseModel):
     description: Optional[str] = None
 
 
-class SchemaPrivileges(BaseModel):
+class SchemaPrivileges(_Model):
     """Privileges for a specific role on a schema.
     
     Attributes:
@@ -918,7 +922,7 @@ class SchemaPrivileges(BaseModel):
 # Tables and metadata and privileges
 
 
-class TableInfo(BaseModel):
+class TableInfo(_Model):
     """Information about a database table.
     
     Attributes:
@@ -942,7 +946,7 @@ class TableInfo(BaseModel):
     current_role_owns: bool
 
 
-class AddedTableInfo(BaseModel):
+class AddedTableInfo(_Model):
     """Information about a newly created table.
     
     Attributes:
@@ -955,7 +959,7 @@ class AddedTableInfo(BaseModel):
     renamed_columns: Optional[Dict[str, Any]] = None
 
 
-class SettableTableInfo(BaseModel):
+class SettableTableInfo(_Model):
     """Fields that can be updated on a table.
     
     Attributes:
@@ -968,7 +972,7 @@ class SettableTableInfo(BaseModel):
     columns: Optional[List[SettableColumnInfo]] = None
 
 
-class JoinableTableRecord(BaseModel):
+class JoinableTableRecord(_Model):
     """Information about a table that can be joined.
     
     Attributes:
@@ -987,7 +991,7 @@ class JoinableTableRecord(BaseModel):
     multiple_results: bool
 
 
-class JoinableTableInfo(BaseModel):
+class JoinableTableInfo(_Model):
     """List of tables that can be joined with a base table.
     
     Attributes:
@@ -998,7 +1002,7 @@ class JoinableTableInfo(BaseModel):
     target_table_info: List[Any]
 
 
-class TableMetaDataBlob(BaseModel):
+class TableMetaDataBlob(_Model):
     """Metadata for customizing table behavior.
     
     Attributes:
@@ -1015,7 +1019,7 @@ class TableMetaDataBlob(BaseModel):
     mathesar_added_pkey_attnum: Optional[int] = None
 
 
-class TableMetaDataRecord(BaseModel):
+class TableMetaDataRecord(_Model):
     """Stored table metadata record including identifiers.
     
     Inherits all fields from TableMetaDataBlob plus:
@@ -1033,7 +1037,7 @@ class TableMetaDataRecord(BaseModel):
     mathesar_added_pkey_attnum: Optional[int] = None
 
 
-class TablePrivileges(BaseModel):
+class TablePrivileges(_Model):
     """Privileges for a specific role on a table.
     
     Attributes:
@@ -1047,7 +1051,7 @@ class TablePrivileges(BaseModel):
 # Users
 
 
-class UserInfo(BaseModel):
+class UserInfo(_Model):
     """Information about a Mathesar user.
     
     Attributes:
@@ -1066,7 +1070,7 @@ class UserInfo(BaseModel):
     display_language: str
 
 
-class UserDef(BaseModel):
+class UserDef(_Model):
     """Definition for creating or updating a user.
     
     Attributes:
@@ -0,0 +1,153 @@
+"""JSON codecs used to encode requests and decode responses.
+
+The raw client serializes each request body to bytes itself and decodes the
+raw response bytes, so a fast codec never has to go through an intermediate
+``str``. msgspec is used when installed; the stdlib ``json`` module is always
+available as the fallback. Both decode every reply to the same values:
+documents msgspec rejects, such as numbers outside the float range, are
+decoded again with the stdlib. orjson is faster still, but decodes integers
+wider than 64 bits as floats, which alters wide ``numeric`` values, so it is
+only used when asked for by name.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Literal, Union
+
+from .errors import MathesarClientError
+
+
+def _invalid(e: Exception) -> MathesarClientError:
+    return MathesarClientError(f"Malformed JSON reply: {e}")
+
+
+class JsonCodec:
+    """Base class for JSON codecs.
+
+    Subclasses implement ``encode`` returning UTF-8 bytes and ``decode``
+    accepting the raw response bytes and raising MathesarClientError for
+    invalid JSON.
+    """
+
+    name = "base"
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class StdlibCodec(JsonCodec):
+    """Codec built on the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def decode(self, data: bytes) -> Any:
+        # json.loads detects the encoding of bytes input itself
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            raise _invalid(e) from e
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec built on orjson (``pip install mathesar-client[orjson]``).
+
+    Never picked by "auto": orjson decodes integers wider than 64 bits as
+    floats and rejects numbers outside the float range, so only choose it
+    for tables without such values.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._error = orjson.JSONDecodeError
+        # Record definitions may be keyed by attnum integers
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj: Any) -> bytes:
+        return self._dumps(obj, option=self._options)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._loads(data)
+        except self._error as e:
+            raise _invalid(e) from e
+
+
+class MsgspecCodec(JsonCodec):
+    """Codec built on msgspec (``pip install mathesar-client[fast]``).
+
+    msgspec rejects some documents the stdlib accepts, such as numbers
+    outside the float range (decoded as ``inf``) and ``NaN`` literals; these
+    are decoded with the stdlib instead, so results never depend on whether
+    msgspec is installed.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._error = msgspec.DecodeError
+        self._fallback = StdlibCodec()
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error:
+            return self._fallback.decode(data)
+
+
+CodecName = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+_CODECS = {"stdlib": StdlibCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def get_codec(codec: Union[CodecName, JsonCodec] = "auto") -> JsonCodec:
+    """Resolve a codec name to a codec instance.
+
+    Args:
+        codec: A JsonCodec instance, a backend name, or "auto" to pick msgspec
+               if it is installed and the stdlib otherwise. Both decode to
+               the same values and keep integers of any width exact; orjson
+               has to be named explicitly.
+
+    Returns:
+        The codec instance.
+
+    Raises:
+        ImportError: If the named backend is not installed.
+        ValueError: If the name is unknown.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        try:
+            return MsgspecCodec()
+        except ImportError:
+            return StdlibCodec()
+    try:
+        return _CODECS[codec]()
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec: {codec!r}") from None
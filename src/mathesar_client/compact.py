@@ -0,0 +1,176 @@
+"""Compact, slotted counterparts of the metadata models.
+
+Jobs that keep column, table and constraint metadata for thousands of tables
+pay for every pydantic instance in memory and in validation time. The classes
+here are plain ``__slots__`` dataclasses with the same field names as the
+models in ``client_raw_models``, built straight from the server reply without
+validation. Select them with ``MathesarClientRaw(model_backend="compact")``.
+
+Unknown fields sent by the server are dropped, except by ConstraintInfo,
+which keeps every member as its pydantic model does. A missing required field
+raises KeyError instead of a pydantic ValidationError.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Literal, Optional
+
+ModelBackend = Literal["pydantic", "compact"]
+
+
+@dataclass(slots=True)
+class TypeOptions:
+    """Compact counterpart of ``client_raw_models.TypeOptions``."""
+    precision: Optional[int] = None
+    scale: Optional[int] = None
+    fields: Optional[str] = None
+    length: Optional[int] = None
+    item_type: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TypeOptions:
+        get = data.get
+        return cls(get("precision"), get("scale"), get("fields"), get("length"), get("item_type"))
+
+
+@dataclass(slots=True)
+class ColumnDefault:
+    """Compact counterpart of ``client_raw_models.ColumnDefault``."""
+    value: str
+    is_dynamic: bool
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ColumnDefault:
+        return cls(data["value"], data["is_dynamic"])
+
+
+@dataclass(slots=True)
+class ColumnInfo:
+    """Compact counterpart of ``client_raw_models.ColumnInfo``."""
+    id: int
+    name: str
+    type: str
+    nullable: bool
+    primary_key: bool
+    has_dependents: bool
+    current_role_priv: List[str]
+    type_options: Optional[TypeOptions] = None
+    default: Optional[ColumnDefault] = None
+    description: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ColumnInfo:
+        type_options = data.get("type_options")
+        default = data.get("default")
+        return cls(
+            data["id"],
+            data["name"],
+            data["type"],
+            data["nullable"],
+            data["primary_key"],
+            data["has_dependents"],
+            data["current_role_priv"],
+            TypeOptions.from_dict(type_options) if type_options is not None else None,
+            ColumnDefault.from_dict(default) if default is not None else None,
+            data.get("description"),
+        )
+
+
+@dataclass(slots=True)
+class SchemaInfo:
+    """Compact counterpart of ``client_raw_models.SchemaInfo``."""
+    oid: int
+    name: str
+    owner_oid: int
+    current_role_priv: List[str]
+    current_role_owns: bool
+    table_count: int
+    description: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SchemaInfo:
+        return cls(
+            data["oid"],
+            data["name"],
+            data["owner_oid"],
+            data["current_role_priv"],
+            data["current_role_owns"],
+            data["table_count"],
+            data.get("description"),
+        )
+
+
+@dataclass(slots=True)
+class TableInfo:
+    """Compact counterpart of ``client_raw_models.TableInfo``.
+
+    As with the pydantic model, the API's ``schema`` member is exposed as ``schema_oid``.
+    """
+    oid: int
+    name: str
+    schema_oid: int
+    owner_oid: int
+    current_role_priv: List[str]
+    current_role_owns: bool
+    description: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> TableInfo:
+        return cls(
+            data["oid"],
+            data["name"],
+            data["schema"] if "schema" in data else data["schema_oid"],
+            data["owner_oid"],
+            data["current_role_priv"],
+            data["current_role_owns"],
+            data.get("description"),
+        )
+
+
+@dataclass(slots=True)
+class ConstraintInfo:
+    """Compact counterpart of ``client_raw_models.ConstraintInfo``.
+
+    The pydantic model declares no fields and keeps every member the server
+    sends, so this class does the same: the members are kept in ``extra`` and
+    read as attributes, e.g. ``constraint.oid``. A member the server did not
+    send raises AttributeError, as it does on the pydantic model.
+    """
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that are not slots; "extra" itself is unset
+        # while the instance is being unpickled or copied
+        if name == "extra":
+            raise AttributeError(name)
+        try:
+            return self.extra[name]
+        except KeyError:
+            raise AttributeError(f"'ConstraintInfo' object has no attribute '{name}'") from None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> ConstraintInfo:
+        return cls(dict(data))
+
+
+# Compact classes by the name of the pydantic model they replace
+COMPACT_MODELS: Dict[str, Any] = {
+    cls.__name__: cls for cls in (TypeOptions, ColumnDefault, ColumnInfo, SchemaInfo, TableInfo, ConstraintInfo)
+}
+
+
+def compact_parser(model: Any, many: bool = False) -> Optional[Callable[[Any], Any]]:
+    """Parser building the compact counterpart of ``model``, or None if it has none.
+
+    Args:
+        model: Pydantic model class from ``client_raw_models``.
+        many: Parse a list of objects instead of a single one.
+    """
+    compact = COMPACT_MODELS.get(model.__name__)
+    if compact is None:
+        return None
+    from_dict = compact.from_dict
+    if many:
+        return lambda result: [from_dict(item) for item in result]
+    return from_dict
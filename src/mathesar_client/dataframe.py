@@ -0,0 +1,249 @@
+"""pandas DataFrame export of Mathesar records.
+
+Picks a dtype for every column from its metadata and fills preallocated
+column buffers one page at a time, so neither a list of row dicts nor an
+object column per field is ever built for the whole table. With the record
+count known from the first page, the buffers are allocated once at their
+final size. Columns are converted one at a time when the frame is built,
+each releasing its buffers, so only one column exists twice at any moment.
+``benchmarks/bench_to_pandas.py`` measures a peak about 1.1x the size of the
+finished frame (200k rows, 10 columns), against about 2.2x for
+``pd.DataFrame`` over row dicts; the raw pages in flight come on top.
+
+Requires pandas 2.0 or later (``pip install mathesar-client[pandas]``).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError as e:
+    raise ImportError("DataFrame export requires pandas; install it with 'pip install mathesar-client[pandas]'") from e
+
+from .client_raw_models import ColumnInfo
+
+# Nullable pandas dtypes by column type, backed by numpy buffers of these types
+_INT_TYPES = {"smallint": np.int16, "integer": np.int32, "bigint": np.int64}
+_FLOAT_TYPES = {"real": np.float32, "double precision": np.float64, "numeric": np.float64, "decimal": np.float64}
+_DATETIME_TYPES = ("date", "timestamp without time zone", "timestamp with time zone")
+_TEXT_TYPES = ("text", "character varying", "character", "varchar", "char", "name", "citext")
+
+# Text columns with at most this many distinct values become categoricals
+DEFAULT_MAX_CATEGORIES = 1000
+
+
+def pandas_dtype(type_name: str) -> str:
+    """Name of the pandas dtype used for a Mathesar column type.
+
+    Integers become nullable ``Int16``/``Int32``/``Int64``, floating point
+    and numeric columns nullable ``Float32``/``Float64``, booleans
+    ``boolean``, and dates and timestamps ``datetime64[us]`` (UTC for
+    timestamps with time zone). Text columns become ``category`` when they
+    have few distinct values and ``string`` otherwise; every other type,
+    including JSON, is kept as ``object``.
+
+    Args:
+        type_name: Column type as reported in ``ColumnInfo.type``.
+
+    Returns:
+        The dtype name; "category" for text columns that may end up as strings.
+    """
+    name = type_name.lower()
+    if name in _INT_TYPES:
+        return np.dtype(_INT_TYPES[name]).name.capitalize()
+    if name in _FLOAT_TYPES:
+        return np.dtype(_FLOAT_TYPES[name]).name.capitalize()
+    if name == "boolean":
+        return "boolean"
+    if name == "timestamp with time zone":
+        return "datetime64[us, UTC]"
+    if name in _DATETIME_TYPES:
+        return "datetime64[us]"
+    if name in _TEXT_TYPES:
+        return "category"
+    return "object"
+
+
+class _Column:
+    """Growable buffers holding one column of the frame being built."""
+
+    __slots__ = ("name", "key", "kind", "data", "mask", "categories", "convert")
+
+    def __init__(self, column: ColumnInfo, capacity: int, convert: Optional[Callable[[Any], Any]]):
+        type_name = (column.type or "").lower()
+        self.name = column.name
+        self.key = str(column.id)
+        self.convert = convert
+        self.mask: Optional[np.ndarray] = None
+        self.categories: Dict[Any, int] = {}
+        if type_name in _INT_TYPES or type_name in _FLOAT_TYPES or type_name == "boolean":
+            self.kind = "masked"
+            dtype = _INT_TYPES.get(type_name) or _FLOAT_TYPES.get(type_name) or np.bool_
+            self.data = np.zeros(capacity, dtype=dtype)
+            self.mask = np.ones(capacity, dtype=np.bool_)
+        elif type_name in _DATETIME_TYPES:
+            self.kind = "utc" if type_name == "timestamp with time zone" else "datetime"
+            self.data = np.full(capacity, np.datetime64("NaT", "us"))
+        elif type_name in _TEXT_TYPES:
+            self.kind = "category"
+            self.data = np.full(capacity, -1, dtype=np.int32)
+        else:
+            self.kind = "object"
+            self.data = np.full(capacity, None, dtype=object)
+
+    def reserve(self, size: int) -> None:
+        # Doubles the capacity, for tables that grew after the first page
+        if size <= len(self.data):
+            return
+        size = max(size, 2 * len(self.data))
+        self.data = _grown(self.data, size)
+        if self.mask is not None:
+            self.mask = _grown(self.mask, size, True)
+
+    def write(self, start: int, values: List[Any], parse_datetime: Callable[[Any], Any]) -> None:
+        end = start + len(values)
+        if self.kind == "masked":
+            assert self.mask is not None
+            self.mask[start:end] = [v is None for v in values]
+            zero = self.data.dtype.type(0)
+            self.data[start:end] = [zero if v is None else v for v in values]
+        elif self.kind in ("datetime", "utc"):
+            self.data[start:end] = _datetimes(values, self.kind == "utc", parse_datetime)
+        elif self.kind == "category":
+            cats = self.categories
+            self.data[start:end] = [-1 if v is None else cats.setdefault(v, len(cats)) for v in values]
+        else:
+            convert = self.convert
+            if convert is not None:
+                values = [None if v is None else convert(v) for v in values]
+            # Item by item, as numpy would broadcast JSON lists into the slice
+            data = self.data
+            for i, v in enumerate(values, start):
+                data[i] = v
+
+    def to_strings(self) -> None:
+        # Leaves categorical mode, looking each code up once; code -1 picks the
+        # trailing None. The values are kept as objects until the frame is built.
+        lookup = np.empty(len(self.categories) + 1, dtype=object)
+        lookup[:-1] = list(self.categories)
+        self.data = lookup[self.data]
+        self.categories = {}
+        self.kind = "string"
+
+    def result(self, size: int) -> Any:
+        data = self.data[:size] if len(self.data) == size else self.data[:size].copy()
+        if self.kind == "masked":
+            assert self.mask is not None
+            mask = self.mask[:size] if len(self.mask) == size else self.mask[:size].copy()
+            return _masked(data, mask)
+        if self.kind == "utc":
+            return pd.DatetimeIndex(data).tz_localize("UTC").array
+        if self.kind == "category":
+            return pd.Categorical.from_codes(data, categories=pd.Index(list(self.categories)))
+        if self.kind == "string":
+            return pd.array(data, dtype="string")
+        return data
+
+
+def _grown(data: np.ndarray, size: int, fill: Any = None) -> np.ndarray:
+    grown = np.empty(size, dtype=data.dtype)
+    grown[: len(data)] = data
+    if fill is not None:
+        grown[len(data):] = fill
+    return grown
+
+
+def _masked(data: np.ndarray, mask: np.ndarray) -> Any:
+    if data.dtype.kind == "i":
+        return pd.arrays.IntegerArray(data, mask)
+    if data.dtype.kind == "f":
+        return pd.arrays.FloatingArray(data, mask)
+    return pd.arrays.BooleanArray(data, mask)
+
+
+def _datetimes(values: List[Any], utc: bool, parse_datetime: Callable[[Any], Any]) -> np.ndarray:
+    # ISO strings are parsed by pandas in bulk; anything it rejects, such as
+    # historical ' AD'/' BC' suffixes, goes through the Python parser first
+    try:
+        parsed = pd.to_datetime(values, format="ISO8601", utc=utc)
+    except (ValueError, TypeError):
+        parsed = pd.to_datetime([parse_datetime(v) for v in values], utc=utc)
+    if utc:
+        parsed = parsed.tz_convert(None)
+    return parsed.to_numpy("datetime64[us]")
+
+
+class FrameBuilder:
+    """Builds a DataFrame from raw ``records.list`` pages, one page at a time.
+
+    Args:
+        columns: Columns of the frame, in order.
+        parse_json: Parser for the values of JSON columns.
+        parse_datetime: Fallback parser for date/time strings pandas cannot parse.
+        max_categories: Text columns with more distinct values than this, or
+                        with distinct values for more than half of the rows,
+                        are built as strings instead of categoricals.
+
+    Example:
+        >>> builder = FrameBuilder(columns, parse_json, parse_datetime)
+        >>> for page in pages:
+        ...     builder.add(page.results, total=page.count)
+        >>> df = builder.frame()
+    """
+
+    def __init__(
+        self,
+        columns: List[ColumnInfo],
+        parse_json: Callable[[Any], Any],
+        parse_datetime: Callable[[Any], Any],
+        max_categories: int = DEFAULT_MAX_CATEGORIES,
+    ):
+        self._columns = columns
+        self._parse_json = parse_json
+        self._parse_datetime = parse_datetime
+        self._max_categories = max_categories
+        self._buffers: Optional[List[_Column]] = None
+        self.rows = 0
+
+    def add(self, rows: List[Dict[str, Any]], total: Optional[int] = None) -> None:
+        """Append the raw rows of one page.
+
+        Args:
+            rows: Raw rows keyed by attnum strings.
+            total: Expected number of rows of the whole frame, e.g. the page's
+                   ``count``; the buffers are allocated at this size on the first page.
+        """
+        end = self.rows + len(rows)
+        if self._buffers is None:
+            capacity = max(end, total or 0)
+            self._buffers = [
+                _Column(c, capacity, self._parse_json if "json" in (c.type or "").lower() else None)
+                for c in self._columns
+            ]
+        for buffer in self._buffers:
+            buffer.reserve(end)
+            buffer.write(self.rows, [rec.get(buffer.key) for rec in rows], self._parse_datetime)
+            if buffer.kind == "category" and len(buffer.categories) > self._max_categories:
+                buffer.to_strings()
+        self.rows = end
+
+    def frame(self) -> pd.DataFrame:
+        """The DataFrame of all rows added so far, with a default RangeIndex.
+
+        Each column's buffers are released as soon as it has been converted,
+        so the builder is empty afterwards; call this once, after the last page.
+        """
+        if self._buffers is None:
+            self.add([])
+        assert self._buffers is not None
+        buffers, self._buffers = self._buffers, []
+        data: Dict[str, Any] = {}
+        while buffers:
+            buffer = buffers.pop(0)
+            if buffer.kind == "category" and 2 * len(buffer.categories) > self.rows:
+                buffer.to_strings()
+            data[buffer.name] = buffer.result(self.rows)
+        return pd.DataFrame(data, index=pd.RangeIndex(self.rows), copy=False)
@@ -0,0 +1,69 @@
+"""Per-operation deadlines shared by every RPC call made inside them.
+
+A deadline is an absolute point in time stored in a context variable. Every
+call sent while it is active gets the remaining time as its timeout, retries
+stop backing off once it has passed, and calls that would start after it raise
+DeadlineExceeded without touching the network. Nested deadlines never extend
+an outer one. Context variables follow threads started with
+``contextvars.copy_context()`` and asyncio tasks created inside the block.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Iterator, Optional
+
+from .errors import DeadlineExceeded
+
+
+# Absolute time.monotonic() value by which the current operation must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("mathesar_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Limit all calls made inside the ``with`` block to ``seconds`` in total.
+
+    Args:
+        seconds: Time budget of the whole block, in seconds.
+
+    Example:
+        >>> with deadline(2.0):
+        ...     table = schema.table_by_name("users")
+        ...     page = table.records_list(limit=10)
+    """
+    at = monotonic() + seconds
+    outer = _deadline.get()
+    token = _deadline.set(at if outer is None else min(outer, at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline, or None when there is none.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    at = _deadline.get()
+    if at is None:
+        return None
+    left = at - monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+    return left
+
+
+def deadline_at() -> Optional[float]:
+    """The current deadline as a ``time.monotonic()`` value, or None when there is none."""
+    return _deadline.get()
+
+
+def expired() -> bool:
+    """Whether a deadline is active and has passed."""
+    at = _deadline.get()
+    return at is not None and monotonic() >= at
@@ -0,0 +1,16 @@
+"""Exceptions raised by the Mathesar clients."""
+
+
+class MathesarClientError(Exception):
+    """Exception raised when a Mathesar API call returns an error."""
+    pass
+
+
+class DeadlineExceeded(MathesarClientError, TimeoutError):
+    """Raised when the deadline of an operation runs out before a call completes."""
+    pass
+
+
+class CircuitOpenError(MathesarClientError):
+    """Raised without contacting the server while the circuit breaker is open."""
+    pass
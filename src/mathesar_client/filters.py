@@ -0,0 +1,154 @@
+"""Column-name filter expressions compiled to Mathesar's ``Filter`` tree.
+
+Build conditions from ``col()`` references with the comparison operators and
+combine them with ``&``, ``|`` and ``~``. The high-level Table methods compile
+them through the table's column cache, so the filtering runs on the server.
+
+As with pandas, ``&`` and ``|`` bind tighter than comparisons, so comparisons
+have to be parenthesized when they are combined. ``col("x") == None`` and
+``col("x") != None`` compile to ``is_null()`` and ``not_null()``, as comparing
+with NULL in SQL would never match.
+
+Example:
+    >>> from mathesar_client import col
+    >>> where = (col("status") == "open") & ((col("age") > 30) | col("manager").is_null())
+    >>> page = table.records_list(filter=where, limit=100)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Tuple
+
+from .client_raw_models import Filter, FilterAttnum, FilterLiteral
+
+
+class Condition:
+    """A boolean filter expression over table columns.
+
+    Conditions are created by comparing ``col()`` references and combined with
+    ``&`` (and), ``|`` (or) and ``~`` (not). Python's ``and``, ``or`` and ``not``
+    cannot be overloaded and raise TypeError instead of silently dropping a branch.
+
+    Attributes:
+        type: Mathesar filter type, e.g. "equal", "greater", "and".
+        args: Operands: column references, nested conditions or literal values.
+    """
+
+    __slots__ = ("type", "args")
+
+    def __init__(self, type: str, args: Tuple[Any, ...]):
+        self.type = type
+        self.args = args
+
+    def _combine(self, type: str, other: Condition) -> Condition:
+        if not isinstance(other, Condition):
+            return NotImplemented
+        # Flatten chains like a & b & c into a single "and"
+        args = self.args if self.type == type else (self,)
+        other_args = other.args if other.type == type else (other,)
+        return Condition(type, args + other_args)
+
+    def __and__(self, other: Condition) -> Condition:
+        return self._combine("and", other)
+
+    def __or__(self, other: Condition) -> Condition:
+        return self._combine("or", other)
+
+    def __invert__(self) -> Condition:
+        return Condition("not", (self,))
+
+    def __bool__(self) -> bool:
+        raise TypeError("Combine filter conditions with &, | and ~ instead of and, or and not")
+
+    def __repr__(self) -> str:
+        return f"Condition({self.type!r}, {self.args!r})"
+
+    def compile(self, resolve: Callable[[int | str], int]) -> Filter:
+        """Build the Filter tree sent to ``records.list``.
+
+        Args:
+            resolve: Maps a column name (or attnum) to its attnum, e.g. through
+                     a table's column cache.
+
+        Returns:
+            The equivalent Filter.
+        """
+        return Filter(type=self.type, args=[_compile_arg(a, resolve) for a in self.args])
+
+
+class ColumnRef:
+    """Reference to a table column by name (or attnum), created with ``col()``."""
+
+    __slots__ = ("column",)
+
+    # Comparisons build conditions instead of returning bools, so references are not hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, column: int | str):
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"col({self.column!r})"
+
+    def __eq__(self, value: Any) -> Condition:  # type: ignore[override]
+        # SQL's "= NULL" never matches, so None compares as IS NULL
+        if value is None:
+            return self.is_null()
+        return Condition("equal", (self, value))
+
+    def __ne__(self, value: Any) -> Condition:  # type: ignore[override]
+        if value is None:
+            return self.not_null()
+        return ~(self == value)
+
+    def __lt__(self, value: Any) -> Condition:
+        return Condition("lesser", (self, value))
+
+    def __le__(self, value: Any) -> Condition:
+        return Condition("lesser_or_equal", (self, value))
+
+    def __gt__(self, value: Any) -> Condition:
+        return Condition("greater", (self, value))
+
+    def __ge__(self, value: Any) -> Condition:
+        return Condition("greater_or_equal", (self, value))
+
+    def is_null(self) -> Condition:
+        return Condition("null", (self,))
+
+    def not_null(self) -> Condition:
+        return Condition("not_null", (self,))
+
+    def contains(self, value: str, case_sensitive: bool = True) -> Condition:
+        """Text columns containing ``value``."""
+        return Condition("contains" if case_sensitive else "contains_case_insensitive", (self, value))
+
+    def starts_with(self, value: str) -> Condition:
+        """Text columns starting with ``value``."""
+        return Condition("starts_with", (self, value))
+
+    def isin(self, values: Iterable[Any]) -> Condition:
+        """Column equal to any of ``values``.
+
+        Raises:
+            ValueError: If ``values`` is empty.
+        """
+        conditions = [self == v for v in values]
+        if not conditions:
+            raise ValueError("isin() needs at least one value")
+        if len(conditions) == 1:
+            return conditions[0]
+        return Condition("or", tuple(conditions))
+
+
+def col(column: int | str) -> ColumnRef:
+    """Reference a column by name (or attnum) in a filter expression."""
+    return ColumnRef(column)
+
+
+def _compile_arg(arg: Any, resolve: Callable[[int | str], int]) -> Any:
+    if isinstance(arg, Condition):
+        return arg.compile(resolve)
+    if isinstance(arg, ColumnRef):
+        return FilterAttnum(value=resolve(arg.column))
+    return FilterLiteral(value=arg)
@@ -0,0 +1,224 @@
+"""Client-side overload protection for the Mathesar RPC layer.
+
+AdaptiveLimiter caps the number of requests in flight and adapts the cap in
+AIMD style: it grows by one request per round trip while latency stays close
+to the best latency seen, and is cut multiplicatively when calls fail or
+latency climbs. CircuitBreaker fails fast for a cool-down period after a run
+of failures, then lets a single trial call through. One instance of each is
+shared by every thread (and coroutine) using the same raw client.
+"""
+
+from __future__ import annotations
+
+from os import getpid
+from threading import Condition, Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, List, Literal, Optional, Tuple
+
+from .errors import CircuitOpenError, DeadlineExceeded
+from .retry import is_transient
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop, Future
+
+
+# HTTP statuses signalling that the server is overloaded or failing
+OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_overload(exc: BaseException) -> bool:
+    """Whether a failed call indicates an overloaded or unreachable server."""
+    return isinstance(exc, DeadlineExceeded) or is_transient(exc, OVERLOAD_STATUSES)
+
+
+def _wake(future: Any) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter driven by observed latency and errors.
+
+    Args:
+        initial_limit: Concurrency window to start with.
+        min_limit: Smallest window the limiter may shrink to.
+        max_limit: Largest window the limiter may grow to.
+        backoff_ratio: Factor applied to the window on congestion.
+        latency_tolerance: Latency, as a multiple of the baseline, treated as congestion.
+        smoothing: Weight of the newest sample in the moving latency average.
+
+    Example:
+        >>> raw = MathesarClientRaw(limiter=AdaptiveLimiter(initial_limit=8, max_limit=64))
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self._limit = float(initial_limit)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._cond = Condition()
+        self._inflight = 0
+        self._waiters: List[Tuple[AbstractEventLoop, Future]] = []
+        self._baseline: Optional[float] = None
+        self._average: Optional[float] = None
+        self._last_decrease = 0.0
+        self._pid = getpid()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency window."""
+        return int(self._limit)
+
+    @property
+    def inflight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._inflight
+
+    def _try_acquire(self) -> bool:
+        if self._inflight < int(self._limit):
+            self._inflight += 1
+            return True
+        return False
+
+    def acquire(self, timeout: Optional[float] = None) -> None:
+        """Block until a slot is free.
+
+        Raises:
+            DeadlineExceeded: If no slot frees up within ``timeout`` seconds.
+        """
+        if self._pid != getpid():
+            self._reset()
+        with self._cond:
+            if not self._cond.wait_for(self._try_acquire, timeout):
+                raise DeadlineExceeded("Deadline exceeded while waiting for a concurrency slot")
+
+    async def aacquire(self, timeout: Optional[float] = None) -> None:
+        """Async counterpart of ``acquire``; waits without blocking the event loop."""
+        from asyncio import get_running_loop, timeout as async_timeout
+
+        loop = get_running_loop()
+        try:
+            async with async_timeout(timeout):
+                while True:
+                    with self._cond:
+                        if self._try_acquire():
+                            return
+                        future = loop.create_future()
+                        self._waiters.append((loop, future))
+                    await future
+        except TimeoutError as e:
+            raise DeadlineExceeded("Deadline exceeded while waiting for a concurrency slot") from e
+
+    def release(self, latency: Optional[float] = None, failed: bool = False) -> None:
+        """Free a slot and adapt the window to the outcome of the call.
+
+        Args:
+            latency: Duration of the call in seconds, or None when the call was
+                     never sent and the window should stay as it is.
+            failed: Whether the call failed in a way that signals overload.
+        """
+        with self._cond:
+            self._inflight -= 1
+            if latency is not None:
+                self._update(latency, failed)
+            waiters, self._waiters = self._waiters, []
+            self._cond.notify_all()
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # The waiter's event loop is already closed
+
+    def _update(self, latency: float, failed: bool) -> None:
+        if self._average is None or self._baseline is None:
+            self._average = self._baseline = latency
+        else:
+            self._average += self.smoothing * (latency - self._average)
+            # The baseline follows the best latency and slowly drifts up, so a
+            # permanently slower server does not pin the window at its minimum
+            self._baseline = min(latency, self._baseline + 0.01 * (self._average - self._baseline))
+        now = monotonic()
+        if failed or self._average > self.latency_tolerance * self._baseline:
+            # Cut at most once per round trip, so one burst of slow replies counts once
+            if now - self._last_decrease >= self._average:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._last_decrease = now
+        elif self._inflight + 1 >= self._limit / 2:
+            # Only grow while the window is actually in use
+            self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+
+class CircuitBreaker:
+    """Fails calls fast for a cool-down period after a run of failures.
+
+    After ``failure_threshold`` consecutive overload failures the circuit
+    opens and calls raise CircuitOpenError without contacting the server.
+    Once ``cooldown`` seconds have passed one trial call is let through; its
+    success closes the circuit, its failure opens it for another cool-down.
+
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        cooldown: Seconds the circuit stays open before a trial call.
+
+    Example:
+        >>> raw = MathesarClientRaw(breaker=CircuitBreaker(failure_threshold=5, cooldown=30))
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        """Current state of the circuit."""
+        if self._opened_at is None:
+            return "closed"
+        if self._trial or monotonic() - self._opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Admit a call or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or a trial call is already running.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            wait = self._opened_at + self.cooldown - monotonic()
+            if wait > 0 or self._trial:
+                raise CircuitOpenError(f"Circuit open after repeated failures; retry in {max(wait, 0):.1f}s")
+            self._trial = True
+
+    def record(self, failed: bool) -> None:
+        """Record the outcome of an admitted call."""
+        with self._lock:
+            if failed:
+                self._failures += 1
+                if self._trial or self._failures >= self.failure_threshold:
+                    self._opened_at = monotonic()
+            else:
+                self._failures = 0
+                self._opened_at = None
+            self._trial = False
@@ -0,0 +1,120 @@
+"""Background prefetching and parallel fetching for paginated record reads.
+
+``prefetched`` drives a page iterator from a background thread, so the next
+pages are already being fetched while the caller works through the current
+one. At most ``depth`` finished pages wait in a bounded queue, which keeps the
+memory use of a full-table scan independent of the table size.
+
+``ordered_map`` fetches independent pages on a small thread pool and hands
+them back in their original order, again with a bounded number in flight.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from queue import Full, Queue
+from threading import Event, Thread
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple, TypeVar
+
+A = TypeVar("A")
+T = TypeVar("T")
+
+# Marks the end of the pages in the queue, together with the error that ended them, if any
+_DONE = object()
+# How often a blocked producer checks whether the consumer has gone away
+_POLL_INTERVAL = 0.1
+
+
+def prefetched(pages: Iterator[T], depth: int) -> Iterator[T]:
+    """Iterate ``pages`` while a background thread fetches up to ``depth`` pages ahead.
+
+    The producer thread runs in a copy of the caller's context, so deadlines and
+    ``idempotent()`` blocks active in the caller also apply to the prefetched
+    calls. An exception raised while fetching is re-raised to the consumer when
+    it reaches that page. Closing the returned iterator early stops the producer
+    after the page it is currently fetching.
+
+    Args:
+        pages: Iterator producing the pages; it is advanced only by the background thread.
+        depth: Maximum number of fetched pages waiting to be consumed. With 0 the
+               pages are fetched in the caller's thread, one at a time.
+
+    Returns:
+        Iterator over the same pages, in order.
+    """
+    if depth < 0:
+        raise ValueError("depth must not be negative")
+    if depth == 0:
+        yield from pages
+        return
+    buffer: Queue[Tuple[Any, Optional[BaseException]]] = Queue(maxsize=depth)
+    stopped = Event()
+
+    def put(item: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in pages:
+                if not put((page, None)):
+                    return
+        except BaseException as e:
+            put((_DONE, e))
+        else:
+            put((_DONE, None))
+
+    Thread(target=copy_context().run, args=(produce,), name="mathesar-prefetch", daemon=True).start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield page
+    finally:
+        stopped.set()
+
+
+def ordered_map(fn: Callable[[A], T], items: Iterable[A], parallelism: int) -> Iterator[T]:
+    """Apply ``fn`` to ``items`` on up to ``parallelism`` threads, yielding results in input order.
+
+    Only ``2 * parallelism`` calls are submitted ahead of the consumer, so a
+    slow consumer does not make the finished results pile up in memory. Each
+    call runs in a copy of the caller's context. The first failing call raises
+    its exception to the consumer; closing the iterator early cancels the
+    calls that have not started yet.
+
+    Args:
+        fn: Function called once per item, typically fetching one page.
+        items: Arguments for ``fn``, consumed lazily.
+        parallelism: Maximum number of calls running at the same time.
+
+    Returns:
+        Iterator over the results of ``fn``, in the order of ``items``.
+    """
+    if parallelism < 1:
+        raise ValueError("parallelism must be at least 1")
+    pending: Deque[Future[T]] = deque()
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="mathesar-fetch") as pool:
+        try:
+            for item in islice(items, 2 * parallelism):
+                pending.append(pool.submit(copy_context().run, fn, item))
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(items, 1):
+                    pending.append(pool.submit(copy_context().run, fn, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
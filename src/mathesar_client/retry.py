@@ -0,0 +1,154 @@
+"""Retry policy for transient failures of Mathesar RPC calls.
+
+Calls are classified by JSON-RPC method. Read methods (``*.list``, ``*.get``,
+``records.search``, ...) are retried automatically on connection errors,
+timeouts and 429/502/503/504 responses. Writes are only retried when the policy
+allows it or the caller marks them idempotent, optionally with a client
+generated idempotency key. Retries are paced with exponential backoff and full
+jitter, and drawn from a shared retry budget so that a struggling server is not
+flooded with retries.
+"""
+
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from random import uniform
+from threading import Lock
+from typing import Any, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+
+# Last segment prefixes of read-only JSON-RPC methods
+READ_VERBS: Tuple[str, ...] = ("list", "get", "search", "view_report", "suggest_types", "run")
+
+# Set by MathesarClientRaw.idempotent() for the calls made inside the block
+_idempotent: ContextVar[bool] = ContextVar("mathesar_idempotent", default=False)
+_idempotency_key: ContextVar[Optional[str]] = ContextVar("mathesar_idempotency_key", default=None)
+
+
+def is_read_method(method: str) -> bool:
+    """Whether the JSON-RPC method only reads data and is safe to repeat."""
+    return method.rsplit(".", 1)[-1].startswith(READ_VERBS)
+
+
+def is_idempotent() -> bool:
+    """Whether the calls being made are inside an ``idempotent()`` block."""
+    return _idempotent.get()
+
+
+def idempotency_key() -> Optional[str]:
+    """The idempotency key set by the innermost ``idempotent()`` block, if any."""
+    return _idempotency_key.get()
+
+
+@contextmanager
+def idempotent(key: Optional[str] = None) -> Iterator[None]:
+    """Mark calls made inside the block as safe to retry.
+
+    Args:
+        key: Optional client-generated key sent as the ``Idempotency-Key`` header,
+             letting the server or a proxy recognize repeated deliveries.
+    """
+    marked = _idempotent.set(True)
+    keyed = _idempotency_key.set(key)
+    try:
+        yield
+    finally:
+        _idempotency_key.reset(keyed)
+        _idempotent.reset(marked)
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of regular traffic.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one,
+    so in steady state at most ``ratio`` retries are sent per request. The
+    bucket starts with, and never exceeds, ``max_tokens`` tokens.
+
+    Args:
+        ratio: Retries allowed per request.
+        max_tokens: Bucket capacity, i.e. the burst of retries allowed.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take a token for one retry; False when the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def is_transient(exc: BaseException, statuses: FrozenSet[int]) -> bool:
+    """Whether ``exc`` is a transport failure or an HTTP error with one of ``statuses``."""
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status in statuses
+    # Only check libraries that are already loaded, as only they can have raised
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(exc, httpx.TransportError)
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff retry policy classified by RPC method.
+
+    Attributes:
+        max_attempts: Total attempts per call, including the first one.
+        backoff_base: Backoff ceiling in seconds before the first retry.
+        backoff_max: Upper bound of the backoff ceiling.
+        retry_writes: Retry write methods as well, not only reads.
+        retry_statuses: HTTP status codes treated as transient.
+        budget: Retry budget shared by every call using this policy.
+
+    Example:
+        >>> raw = MathesarClientRaw(retry=RetryPolicy(max_attempts=5, backoff_max=2.0))
+        >>> with raw.idempotent("import-42-row-17"):
+        ...     raw.records_add(database_id=1, table_id=123, record_def={"2": "x"})
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    retry_writes: bool = False
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    budget: RetryBudget = field(default_factory=RetryBudget)
+
+    def allows(self, methods: Iterable[str]) -> bool:
+        """Whether a request carrying ``methods`` may be retried at all."""
+        if self.retry_writes or _idempotent.get():
+            return True
+        return all(is_read_method(m) for m in methods)
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """Whether to retry after ``exc`` failed attempt number ``attempt`` (0-based)."""
+        return (
+            attempt + 1 < self.max_attempts
+            and is_transient(exc, self.retry_statuses)
+            and self.budget.withdraw()
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying failed attempt ``attempt``, with full jitter."""
+        return uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+def payload_methods(payload: Any) -> Iterator[str]:
+    """JSON-RPC method names carried by a single or batch request payload."""
+    for request in payload if isinstance(payload, list) else [payload]:
+        yield request["method"]
@@ -0,0 +1,284 @@
+"""Incremental parsing of large ``records.list`` replies.
+
+A records.list reply is a single JSON document whose ``result.results`` array
+can hold tens of thousands of rows. RecordStream reads the HTTP response body
+in chunks and yields each row as soon as it has been parsed, so only the
+current row, not the whole page, is kept in memory. The remaining fields of
+the reply (``count``, summaries, ...) are collected along the way.
+"""
+
+from __future__ import annotations
+
+from codecs import getincrementaldecoder
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .errors import MathesarClientError
+
+
+# Bytes read from the response body at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _NeedMore(Exception):
+    """The buffered text ends before the next JSON token is complete."""
+
+
+class RecordsParser:
+    """Push parser yielding the elements of ``result.results`` of a JSON-RPC reply.
+
+    Feed it the body in arbitrary chunks; each call returns the rows completed
+    by that chunk. Every other member of the reply and of its ``result`` object
+    is parsed whole and kept in ``reply`` and ``result``.
+    """
+
+    def __init__(self) -> None:
+        self.reply: Dict[str, Any] = {}
+        self.result: Dict[str, Any] = {}
+        self._decoder = JSONDecoder()
+        self._text = getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._final = False
+        # Stack of containers being walked: "reply", "result" or "results"
+        self._path: List[str] = []
+        self._started = False
+        self._done = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body and return the rows it completed."""
+        self._buf += self._text.decode(chunk)
+        return self._advance()
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body and return the remaining rows.
+
+        Raises:
+            MathesarClientError: If the body is not a complete JSON-RPC reply.
+        """
+        self._buf += self._text.decode(b"", final=True)
+        self._final = True
+        rows = self._advance()
+        if not self._done:
+            raise MathesarClientError("Truncated or malformed records.list reply")
+        return rows
+
+    # ----- Tokenizer helpers -----
+    def _peek(self) -> str:
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        if pos == len(buf):
+            if self._final:
+                raise MathesarClientError("Unexpected end of records.list reply")
+            raise _NeedMore
+        return buf[pos]
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise MathesarClientError(f"Malformed records.list reply: expected {char!r} at {self._pos}")
+        self._pos += 1
+
+    def _value(self) -> Tuple[Any, int]:
+        self._peek()
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except JSONDecodeError as e:
+            if self._final:
+                raise MathesarClientError(f"Malformed records.list reply: {e}") from e
+            raise _NeedMore from None
+        # A number at the very end of the buffer may continue in the next chunk
+        if end == len(self._buf) and not self._final:
+            raise _NeedMore
+        return value, end
+
+    def _member(self) -> Tuple[Optional[str], int]:
+        # Returns the next key of the current object, or None at its end
+        char = self._peek()
+        if char == "}":
+            return None, self._pos + 1
+        if char == ",":
+            self._pos += 1
+        key, end = self._value()
+        if not isinstance(key, str):
+            raise MathesarClientError("Malformed records.list reply: expected an object key")
+        pos = end
+        while pos < len(self._buf) and self._buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(self._buf):
+            raise _NeedMore
+        if self._buf[pos] != ":":
+            raise MathesarClientError("Malformed records.list reply: expected ':'")
+        return key, pos + 1
+
+    # ----- State machine -----
+    def _advance(self) -> List[Any]:
+        rows: List[Any] = []
+        try:
+            while not self._done:
+                self._step(rows)
+        except _NeedMore:
+            pass
+        if self._pos > DEFAULT_CHUNK_SIZE:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        return rows
+
+    def _step(self, rows: List[Any]) -> None:
+        if not self._started:
+            self._expect("{")
+            self._started = True
+            self._path.append("reply")
+            return
+        where = self._path[-1]
+        if where == "results":
+            char = self._peek()
+            if char == "]":
+                self._pos += 1
+                self._path.pop()
+                return
+            if char == ",":
+                self._pos += 1
+            row, self._pos = self._value()
+            rows.append(row)
+            return
+        key, pos = self._member()
+        if key is None:
+            self._pos = pos
+            self._path.pop()
+            self._done = not self._path
+            return
+        # Nothing is consumed until the whole member can be, so a _NeedMore
+        # leaves the parser at the start of the member
+        saved = self._pos
+        self._pos = pos
+        try:
+            if where == "reply" and key == "result" and self._peek() == "{":
+                self._pos += 1
+                self._path.append("result")
+            elif where == "result" and key == "results" and self._peek() == "[":
+                self._pos += 1
+                self._path.append("results")
+            else:
+                value, self._pos = self._value()
+                (self.reply if where == "reply" else self.result)[key] = value
+        except _NeedMore:
+            self._pos = saved
+            raise
+
+
+class _RecordStreamBase:
+    def __init__(
+        self,
+        response: Any,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_close: Optional[Callable[[Optional[BaseException]], None]] = None,
+    ):
+        self._response = response
+        self._chunk_size = chunk_size
+        self._parser = RecordsParser()
+        # Called once when the stream is closed, with the error that ended the read, if any
+        self._on_close = on_close
+        self._error: Optional[BaseException] = None
+
+    def _closed(self) -> None:
+        on_close, self._on_close = getattr(self, "_on_close", None), None
+        if on_close is not None:
+            on_close(self._error)
+
+    def __del__(self) -> None:
+        # A stream dropped without being closed still hands back what it holds
+        self._closed()
+
+    @property
+    def count(self) -> Optional[int]:
+        """Total number of matching records, once that part of the reply has been read."""
+        return self._parser.result.get("count")
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Members of the result other than ``results``, as read so far."""
+        return self._parser.result
+
+    def _finish(self) -> List[Any]:
+        rows = self._parser.close()
+        error = self._parser.reply.get("error")
+        if error is not None:
+            raise MathesarClientError(error)
+        return rows
+
+
+class RecordStream(_RecordStreamBase):
+    """Rows of a records.list reply, parsed incrementally from the HTTP body.
+
+    Iterate it once to get the raw row dicts (keyed by attnum). ``count`` and
+    the other result members become available as the reply is read; they are
+    complete once iteration has finished. Close the stream (or use it as a
+    context manager) to release the connection early. With a limiter on the
+    client, the stream holds its concurrency slot until it is closed, which
+    happens on its own once iteration has finished.
+
+    Example:
+        >>> with raw.records_list_stream(database_id=1, table_id=123, limit=50000) as rows:
+        ...     for row in rows:
+        ...         process(row)
+    """
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        try:
+            # requests responses read with iter_content, httpx ones with iter_bytes
+            read = getattr(self._response, "iter_content", None) or self._response.iter_bytes
+            for chunk in read(self._chunk_size):
+                yield from self._parser.feed(chunk)
+            yield from self._finish()
+        except Exception as e:
+            self._error = e
+            raise
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        try:
+            self._response.close()
+        finally:
+            self._closed()
+
+    def __enter__(self) -> RecordStream:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class AsyncRecordStream(_RecordStreamBase):
+    """Async counterpart of RecordStream, iterated with ``async for``."""
+
+    async def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        try:
+            async for chunk in self._response.aiter_bytes(self._chunk_size):
+                for row in self._parser.feed(chunk):
+                    yield row
+            for row in self._finish():
+                yield row
+        except Exception as e:
+            self._error = e
+            raise
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Release the underlying connection."""
+        try:
+            await self._response.aclose()
+        finally:
+            self._closed()
+
+    async def __aenter__(self) -> AsyncRecordStream:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
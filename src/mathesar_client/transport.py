@@ -0,0 +1,395 @@
+"""HTTP transport layer for the Mathesar JSON-RPC client.
+
+This module owns the HTTP connections used by MathesarClientRaw. A single
+transport keeps a persistent keep-alive session with a bounded connection
+pool, so consecutive RPC calls reuse established TCP/TLS connections instead
+of performing a fresh handshake for every call.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+from os import getpid, register_at_fork
+from threading import Lock
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+# Sentinel distinguishing "use the transport default" from an explicit None timeout
+_DEFAULT: Any = object()
+
+# Transports alive in this process, reset in the child after os.fork()
+_transports: "WeakSet[HttpTransport]" = WeakSet()
+
+
+def capped_timeout(timeout: Timeout, limit: float) -> Timeout:
+    """Shorten ``timeout`` so that no phase of a request waits longer than ``limit``."""
+    if timeout is None:
+        return limit
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return (min(connect, limit), min(read, limit))
+    return min(timeout, limit)
+
+
+def _json_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    return {"Content-Type": "application/json", **(headers or {})}
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_transports):
+        transport._after_fork()
+
+
+register_at_fork(after_in_child=_reset_transports_after_fork)
+
+
+class HttpTransport:
+    """Pooled keep-alive HTTP transport.
+
+    The transport lazily creates a requests Session with a mounted HTTPAdapter
+    sized by ``pool_maxsize``. It is safe to share between threads and between
+    all Database/Schema/Table handles derived from one client. After os.fork()
+    the child process drops the inherited session (without closing the parent's
+    sockets) and builds a fresh one on first use.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept alive per host.
+        timeout: Default timeout in seconds for every call, either a single float
+                 or a (connect, read) tuple. None waits indefinitely.
+        keep_alive: Whether to keep connections open between calls.
+
+    Example:
+        >>> transport = HttpTransport(pool_maxsize=32, timeout=(3.05, 30))
+        >>> client = MathesarClientRaw(transport=transport)
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 1,
+        pool_maxsize: int = 10,
+        timeout: Timeout = None,
+        keep_alive: bool = True,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self._lock = Lock()
+        self._session: Optional[Session] = None
+        self._pid = getpid()
+        _transports.add(self)
+
+    @property
+    def session(self) -> Session:
+        """The underlying requests Session, created on first use."""
+        session = self._session
+        if session is not None and self._pid == getpid():
+            return session
+        with self._lock:
+            if self._session is None or self._pid != getpid():
+                self._session = self._new_session()
+                self._pid = getpid()
+            return self._session
+
+    def _new_session(self) -> Session:
+        # requests is imported with the first session, keeping package import cheap
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+
+        session = Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _after_fork(self) -> None:
+        # The inherited session shares sockets with the parent, so it is dropped
+        # rather than closed. The lock may have been held by another thread.
+        self._lock = Lock()
+        self._session = None
+        self._pid = getpid()
+
+    def post(
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Timeout = _DEFAULT,
+        stream: bool = False,
+    ) -> Response:
+        """Send a POST request over the pooled session.
+
+        Args:
+            url: Target URL.
+            json: JSON-serializable request body.
+            content: Already encoded JSON request body, used instead of ``json``.
+            auth: Optional (username, password) tuple for basic auth.
+            headers: Optional extra request headers.
+            timeout: Per-call timeout overriding the transport default.
+            stream: Return as soon as the headers arrive and read the body lazily.
+
+        Returns:
+            The HTTP response.
+        """
+        return self.session.post(
+            url,
+            json=json,
+            data=content,
+            auth=auth,
+            headers=_json_headers(headers) if content is not None else headers,
+            timeout=self.timeout if timeout is _DEFAULT else timeout,
+            stream=stream,
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Response:
+        """Send an arbitrary request over the pooled session (used for logging in)."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    @property
+    def cookies(self) -> Any:
+        """Cookie jar of the current session."""
+        return self.session.cookies
+
+    def close(self) -> None:
+        """Close all pooled connections. The transport can still be reused afterwards."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None and self._pid == getpid():
+            session.close()
+
+    def __enter__(self) -> HttpTransport:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _httpx_timeout(timeout: Timeout) -> Any:
+    import httpx
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _require_httpx(name: str, http2: bool = False) -> None:
+    try:
+        import httpx  # noqa: F401
+
+        if http2:
+            import h2  # noqa: F401
+    except ImportError as e:
+        extra = "http2" if http2 else "async"
+        raise ImportError(
+            f"{name} requires {'httpx with h2' if http2 else 'httpx'}; "
+            f"install it with 'pip install mathesar-client[{extra}]'"
+        ) from e
+
+
+class Http2Transport(HttpTransport):
+    """Multiplexed HTTP/2 transport, backed by httpx.
+
+    Concurrent calls from all threads share a single HTTP/2 connection per
+    host, with HPACK header compression, instead of one connection per
+    in-flight call. Servers (or proxies) that do not negotiate HTTP/2 via ALPN
+    are spoken to over HTTP/1.1 with a regular keep-alive pool. Plain
+    ``http://`` URLs always use HTTP/1.1. Requires ``pip install mathesar-client[http2]``.
+
+    Args:
+        max_connections: Maximum number of connections, used when falling back to HTTP/1.1.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        timeout: Default timeout in seconds for every call, either a single float
+                 or a (connect, read) tuple. None waits indefinitely.
+        keep_alive: Whether to keep connections open between calls.
+
+    Example:
+        >>> client = MathesarClientRaw(transport=Http2Transport(timeout=(3.05, 30)))
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        timeout: Timeout = None,
+        keep_alive: bool = True,
+    ):
+        _require_httpx("Http2Transport", http2=True)
+        super().__init__(pool_maxsize=max_connections, timeout=timeout, keep_alive=keep_alive)
+        self.max_keepalive_connections = max_keepalive_connections if keep_alive else 0
+
+    def _new_session(self) -> Any:
+        import httpx
+
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            timeout=_httpx_timeout(self.timeout),
+        )
+
+    def post(  # type: ignore[override]
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Timeout = _DEFAULT,
+        stream: bool = False,
+    ) -> Any:
+        """Send a POST request over the multiplexed client. See HttpTransport.post.
+
+        Returns:
+            The httpx response. With ``stream=True`` read it with ``iter_bytes()``
+            and close it afterwards.
+        """
+        client = self.session
+        kwargs: Dict[str, Any] = {}
+        if timeout is not _DEFAULT:
+            kwargs["timeout"] = _httpx_timeout(timeout)
+        if content is not None:
+            kwargs["content"] = content
+            headers = _json_headers(headers)
+        else:
+            kwargs["json"] = json
+        request = client.build_request("POST", url, headers=headers, **kwargs)
+        return client.send(request, auth=auth, stream=stream)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:  # type: ignore[override]
+        """Send an arbitrary request over the multiplexed client (used for logging in)."""
+        return self.session.request(method, url, **kwargs)
+
+
+class AsyncHttpTransport:
+    """Pooled keep-alive HTTP transport for asyncio, backed by httpx.
+
+    One transport holds a single httpx.AsyncClient whose connection pool is
+    shared by every coroutine, so thousands of in-flight calls can run on one
+    event loop while at most ``max_connections`` sockets are open. Requires the
+    optional ``httpx`` dependency (``pip install mathesar-client[async]``).
+
+    Args:
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept alive.
+        timeout: Default timeout in seconds for every call, either a single float
+                 or a (connect, read) tuple. None waits indefinitely.
+        keep_alive: Whether to keep connections open between calls.
+        http2: Multiplex concurrent calls over one HTTP/2 connection, falling back
+               to HTTP/1.1 when the server does not support it. Requires
+               ``pip install mathesar-client[http2]``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: Timeout = None,
+        keep_alive: bool = True,
+        http2: bool = False,
+    ):
+        _require_httpx("AsyncHttpTransport", http2=http2)
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections if keep_alive else 0
+        self.timeout = timeout
+        self._client: Any = None
+        self._pid = getpid()
+
+    @property
+    def client(self) -> Any:
+        """The underlying httpx.AsyncClient, created on first use."""
+        if self._client is None or self._pid != getpid():
+            self._client = self._new_client()
+            self._pid = getpid()
+        return self._client
+
+    def _new_client(self) -> Any:
+        import httpx
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            timeout=_httpx_timeout(self.timeout),
+        )
+
+    async def post(
+        self,
+        url: str,
+        *,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Timeout = _DEFAULT,
+        stream: bool = False,
+    ) -> Any:
+        """Send a POST request over the pooled async client.
+
+        Args:
+            url: Target URL.
+            json: JSON-serializable request body.
+            content: Already encoded JSON request body, used instead of ``json``.
+            auth: Optional (username, password) tuple for basic auth.
+            headers: Optional extra request headers.
+            timeout: Per-call timeout overriding the transport default.
+            stream: Return as soon as the headers arrive; the caller must read
+                    the body with ``aiter_bytes()`` and close the response.
+
+        Returns:
+            The httpx response.
+        """
+        kwargs: Dict[str, Any] = {}
+        if timeout is not _DEFAULT:
+            kwargs["timeout"] = _httpx_timeout(timeout)
+        if content is not None:
+            kwargs["content"] = content
+            headers = _json_headers(headers)
+        else:
+            kwargs["json"] = json
+        if stream:
+            request = self.client.build_request("POST", url, headers=headers, **kwargs)
+            return await self.client.send(request, auth=auth, stream=True)
+        return await self.client.post(url, auth=auth, headers=headers, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send an arbitrary request over the pooled client (used for logging in)."""
+        return await self.client.request(method, url, **kwargs)
+
+    @property
+    def cookies(self) -> Any:
+        """Cookie jar of the current client."""
+        return self.client.cookies
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        client, self._client = self._client, None
+        if client is not None and self._pid == getpid():
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncHttpTransport:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,77 @@
+import asyncio
+import time
+from threading import Barrier, Lock, Thread
+
+from mathesar_client.auth import SessionAuth
+
+WORKERS = 8
+
+
+class FakeTransport:
+    """Issues a new session cookie for every login POST."""
+
+    def __init__(self):
+        self.cookies = {"csrftoken": "token", "sessionid": "expired"}
+        self.logins = 0
+        self._lock = Lock()
+
+    def _handle(self, method):
+        if method == "POST":
+            with self._lock:
+                self.logins += 1
+                self.cookies["sessionid"] = f"session-{self.logins}"
+
+    def request(self, method, url, **kwargs):
+        time.sleep(0.01)
+        self._handle(method)
+
+
+class AsyncFakeTransport(FakeTransport):
+    async def request(self, method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        self._handle(method)
+
+
+def test_concurrent_rejections_log_in_once():
+    auth = SessionAuth("http://localhost/", "user", "password")
+    transport = FakeTransport()
+    ready = Barrier(WORKERS)
+
+    def rejected_request():
+        auth.prepare(transport)  # sends the expired session
+        ready.wait()
+        auth.login(transport)
+
+    threads = [Thread(target=rejected_request) for _ in range(WORKERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert transport.logins == 1
+    assert transport.cookies["sessionid"] == "session-1"
+
+
+def test_rejection_of_renewed_session_logs_in_again():
+    auth = SessionAuth("http://localhost/", "user", "password")
+    transport = FakeTransport()
+    auth.prepare(transport)
+    auth.login(transport)
+    auth.prepare(transport)
+    auth.login(transport)
+    assert transport.logins == 2
+
+
+def test_concurrent_async_rejections_log_in_once():
+    auth = SessionAuth("http://localhost/", "user", "password")
+    transport = AsyncFakeTransport()
+
+    async def rejected_request():
+        await auth.aprepare(transport)
+        await asyncio.sleep(0)
+        await auth.alogin(transport)
+
+    async def main():
+        await asyncio.gather(*(rejected_request() for _ in range(WORKERS)))
+
+    asyncio.run(main())
+    assert transport.logins == 1
@@ -0,0 +1,105 @@
+import json
+import time
+from threading import Lock, Thread
+
+from mathesar_client import MathesarClientRaw, RetryPolicy, deadline
+
+
+class HTTPError(Exception):
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+class FakeResponse:
+    def __init__(self, status_code, replies=None):
+        self.status_code = status_code
+        self.content = json.dumps(replies).encode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPError(self)
+
+    def close(self):
+        pass
+
+
+class FakeRaw(MathesarClientRaw):
+    """Answers every call, failing the first delivery of each request with a 502."""
+
+    def __init__(self, **kwargs):
+        super().__init__("http://localhost/", "user", "password", auto_batch=True, batch_window=0.2, **kwargs)
+        self.lock = Lock()
+        self.posts = []
+
+    def _http_post(self, payload, **kwargs):
+        requests = payload if isinstance(payload, list) else [payload]
+        ids = [r["id"] for r in requests]
+        with self.lock:
+            first = all(ids != post["ids"] for post in self.posts)
+            self.posts.append({"ids": ids, "headers": kwargs.get("headers", {}), "timeout": kwargs.get("timeout")})
+        if first:
+            return FakeResponse(502)
+        replies = [{"jsonrpc": "2.0", "id": r["id"], "result": {"results": [r["params"]["record_def"]]}} for r in requests]
+        return FakeResponse(200, replies if isinstance(payload, list) else replies[0])
+
+
+def add(raw, value):
+    return raw.records_add(database_id=1, table_id=2, record_def={"1": value})
+
+
+def run_pair(first, second):
+    results = {}
+
+    def run(name, fn):
+        try:
+            results[name] = fn()
+        except Exception as e:
+            results[name] = e
+
+    threads = [Thread(target=run, args=("first", first)), Thread(target=run, args=("second", second))]
+    threads[0].start()
+    time.sleep(0.02)  # the first call leads the batch
+    threads[1].start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_plain_write_is_not_retried_under_another_calls_idempotency_key():
+    raw = FakeRaw(retry=RetryPolicy(backoff_base=0))
+
+    def keyed():
+        with raw.idempotent("key-A"):
+            return add(raw, "a")
+
+    results = run_pair(keyed, lambda: add(raw, "b"))
+    assert results["first"].results == [{"1": "a"}]
+    assert isinstance(results["second"], HTTPError)
+    keyed_posts = [p for p in raw.posts if p["headers"].get("Idempotency-Key") == "key-A"]
+    plain_posts = [p for p in raw.posts if "Idempotency-Key" not in p["headers"]]
+    assert len(keyed_posts) == 2 and all(len(p["ids"]) == 1 for p in keyed_posts)
+    assert len(plain_posts) == 1 and len(plain_posts[0]["ids"]) == 1
+
+
+def test_follower_is_not_bound_by_the_leaders_deadline():
+    raw = FakeRaw(retry=RetryPolicy(backoff_base=0, retry_writes=True))
+
+    def bounded():
+        with deadline(5):
+            return add(raw, "a")
+
+    results = run_pair(bounded, lambda: add(raw, "b"))
+    assert results["first"].results == [{"1": "a"}]
+    assert results["second"].results == [{"1": "b"}]
+    assert all(len(p["ids"]) == 1 for p in raw.posts)
+    assert sorted(p["timeout"] is None for p in raw.posts) == [False, False, True, True]
+
+
+def test_calls_in_the_same_scope_share_a_batch():
+    raw = FakeRaw(retry=RetryPolicy(backoff_base=0, retry_writes=True))
+    results = run_pair(lambda: add(raw, "a"), lambda: add(raw, "b"))
+    assert results["first"].results == [{"1": "a"}]
+    assert results["second"].results == [{"1": "b"}]
+    assert [len(p["ids"]) for p in raw.posts] == [2, 2]
+
@@ -0,0 +1,48 @@
+import pytest
+
+from mathesar_client.client import _json_parser
+from mathesar_client.client_raw import MathesarClientRaw
+from mathesar_client.codec import get_codec
+from mathesar_client.errors import MathesarClientError
+
+WIDE = 123456789012345678901234567890
+
+
+def test_default_codec_keeps_wide_integers():
+    codec = MathesarClientRaw("http://localhost/", "user", "password").codec
+    reply = codec.decode(b'{"result": {"1": 123456789012345678901234567890}}')
+    assert reply["result"]["1"] == WIDE
+    assert type(reply["result"]["1"]) is int
+    assert codec.decode(codec.encode({"value": WIDE})) == {"value": WIDE}
+
+
+@pytest.mark.parametrize("name", ["auto", "stdlib", "msgspec"])
+def test_codec_round_trips_wide_integers(name):
+    if name == "msgspec":
+        pytest.importorskip("msgspec")
+    codec = get_codec(name)
+    assert codec.decode(codec.encode([WIDE, -WIDE])) == [WIDE, -WIDE]
+
+
+def test_auto_never_picks_orjson():
+    assert get_codec("auto").name in ("msgspec", "stdlib")
+
+
+def test_json_column_parser_keeps_wide_integers():
+    parse_json = _json_parser(get_codec().decode)
+    assert parse_json('{"amount": 123456789012345678901234567890}') == {"amount": WIDE}
+
+
+@pytest.mark.parametrize("name", ["auto", "stdlib", "msgspec"])
+def test_codec_decodes_out_of_range_numbers_like_stdlib(name):
+    if name == "msgspec":
+        pytest.importorskip("msgspec")
+    codec = get_codec(name)
+    assert codec.decode(b'{"result": [1e400, -1e400]}') == {"result": [float("inf"), float("-inf")]}
+
+
+@pytest.mark.parametrize("name", ["stdlib", "msgspec", "orjson"])
+def test_codec_wraps_decode_errors(name):
+    pytest.importorskip(name if name != "stdlib" else "json")
+    with pytest.raises(MathesarClientError, match="Malformed JSON reply"):
+        get_codec(name).decode(b'{"result": ')
@@ -0,0 +1,82 @@
+import asyncio
+import json
+from array import array
+
+from mathesar_client import AsyncMathesarClient, AsyncMathesarClientRaw, MathesarClient, MathesarClientRaw
+
+COLUMNS = [
+    {"id": 1, "name": "id", "type": "integer", "nullable": False, "primary_key": True,
+     "has_dependents": False, "current_role_priv": ["SELECT"]},
+    {"id": 2, "name": "doc", "type": "jsonb", "nullable": True, "primary_key": False,
+     "has_dependents": False, "current_role_priv": ["SELECT"]},
+]
+ROWS = [{"1": 1, "2": '{"a": 1}'}, {"1": 2, "2": None}, {"1": 3, "2": "[1, 2]"}]
+BODY = json.dumps({"jsonrpc": "2.0", "id": 1, "result": {"count": 3, "results": ROWS}}).encode()
+
+
+class FakeStreamResponse:
+    status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def iter_bytes(self, chunk_size):
+        # Small chunks, so rows arrive split across reads
+        for i in range(0, len(BODY), 7):
+            yield BODY[i:i + 7]
+
+    async def aiter_bytes(self, chunk_size):
+        for chunk in self.iter_bytes(chunk_size):
+            yield chunk
+
+    def close(self):
+        pass
+
+    async def aclose(self):
+        pass
+
+
+class FakeRaw(MathesarClientRaw):
+    """Serves columns.list as a decoded reply and records.list only as a stream."""
+
+    def __init__(self):
+        super().__init__("http://localhost/", "user", "password")
+        self.streamed = []
+
+    def _send(self, payload, stream=False):
+        if stream:
+            self.streamed.append(payload["params"])
+            return FakeStreamResponse(), None
+        assert payload["method"] == "columns.list"
+        return {"id": payload["id"], "result": COLUMNS}
+
+
+class AsyncFakeRaw(AsyncMathesarClientRaw):
+    def __init__(self):
+        super().__init__("http://localhost/", "user", "password")
+
+    async def _send(self, payload, stream=False):
+        if stream:
+            return FakeStreamResponse(), None
+        assert payload["method"] == "columns.list"
+        return {"id": payload["id"], "result": COLUMNS}
+
+
+def test_columnar_page_is_built_from_the_streamed_reply():
+    raw = FakeRaw()
+    table = MathesarClient(raw).database(1).table(7)
+    page = table.records_list(format="columnar", arrays=True, limit=3)
+    assert page.count == 3
+    assert page.columns["id"] == array("q", [1, 2, 3])
+    assert page.columns["doc"] == [{"a": 1}, None, [1, 2]]
+    assert raw.streamed == [{"database_id": 1, "table_oid": 7, "return_record_summaries": False, "limit": 3}]
+
+
+def test_async_columnar_page_is_built_from_the_streamed_reply():
+    async def read():
+        table = AsyncMathesarClient(AsyncFakeRaw()).database(1).table(7)
+        return await table.records_list(format="columnar")
+
+    page = asyncio.run(read())
+    assert page.count == 3
+    assert page.columns == {"id": [1, 2, 3], "doc": [{"a": 1}, None, [1, 2]]}
@@ -0,0 +1,47 @@
+import copy
+import pickle
+
+import pytest
+
+from mathesar_client import client_raw_models as models
+from mathesar_client.compact import compact_parser
+
+CONSTRAINTS = [
+    {
+        "oid": 2001,
+        "name": "orders_customer_fkey",
+        "type": "f",
+        "columns": [3],
+        "referent_table_oid": 1001,
+        "referent_columns": [1],
+        "deferrable": False,
+        "match_type": "simple",
+    },
+    # Members the compact model used to require may be missing
+    {"oid": 2002, "type": "p"},
+    {},
+]
+
+
+@pytest.mark.parametrize("payload", CONSTRAINTS)
+def test_constraint_info_backends_expose_the_same_fields(payload):
+    pydantic = models.ConstraintInfo.model_validate(payload)
+    compact = compact_parser(models.ConstraintInfo)(payload)
+    assert pydantic.model_dump() == compact.extra == payload
+    for name in ("oid", "name", "type", "columns", "referent_columns", "deferrable", "match_type"):
+        if name in payload:
+            assert getattr(compact, name) == getattr(pydantic, name)
+        else:
+            assert not hasattr(pydantic, name)
+            assert not hasattr(compact, name)
+
+
+def test_constraint_info_list_parser():
+    parsed = compact_parser(models.ConstraintInfo, many=True)(CONSTRAINTS)
+    assert [c.extra for c in parsed] == CONSTRAINTS
+
+
+def test_compact_constraint_info_copies_and_pickles():
+    constraint = compact_parser(models.ConstraintInfo)(CONSTRAINTS[0])
+    assert copy.deepcopy(constraint) == constraint
+    assert pickle.loads(pickle.dumps(constraint)).match_type == "simple"
@@ -0,0 +1,48 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from mathesar_client.client import _json_parser, _parse_datetime  # noqa: E402
+from mathesar_client.client_raw_models import ColumnInfo  # noqa: E402
+from mathesar_client.codec import get_codec  # noqa: E402
+from mathesar_client.dataframe import FrameBuilder  # noqa: E402
+
+
+def column(attnum, name, type_):
+    return ColumnInfo(
+        id=attnum, name=name, type=type_, nullable=True, primary_key=False,
+        has_dependents=False, current_role_priv=["SELECT"],
+    )
+
+
+COLUMNS = [column(1, "status", "text"), column(2, "email", "character varying"), column(3, "meta", "jsonb")]
+
+
+def build(rows, max_categories=1000, page_size=4):
+    builder = FrameBuilder(COLUMNS, _json_parser(get_codec().decode), _parse_datetime, max_categories)
+    for i in range(0, len(rows), page_size):
+        builder.add(rows[i:i + page_size], total=len(rows))
+    return builder.frame()
+
+
+ROWS = [
+    {"1": ["open", "closed"][i % 2], "2": f"user{i}@example.com" if i % 3 else None, "3": '{"tags": [1, 2]}'}
+    for i in range(10)
+]
+
+
+def test_text_dtypes():
+    df = build(ROWS)
+    assert isinstance(df["status"].dtype, pd.CategoricalDtype)
+    # Distinct values for more than half of the rows
+    assert isinstance(df["email"].dtype, pd.StringDtype)
+    assert df["email"].isna().tolist() == [i % 3 == 0 for i in range(10)]
+    assert df["email"][1] == "user1@example.com"
+    assert df["meta"].dtype == object
+    assert df["meta"][0] == {"tags": [1, 2]}
+
+
+def test_text_over_max_categories_becomes_string():
+    df = build(ROWS, max_categories=1)
+    assert isinstance(df["status"].dtype, pd.StringDtype)
+    assert df["status"].tolist() == [r["1"] for r in ROWS]
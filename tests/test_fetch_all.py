@@ -0,0 +1,96 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from mathesar_client import AsyncMathesarClient, AsyncMathesarClientRaw, MathesarClient, MathesarClientRaw
+
+ROWS = [{"1": i, "2": f"row {i}"} for i in range(1, 101)]
+COLUMNS = [
+    {"id": 1, "name": "id", "type": "integer", "nullable": False, "primary_key": True,
+     "has_dependents": False, "current_role_priv": ["SELECT"]},
+    {"id": 2, "name": "name", "type": "text", "nullable": True, "primary_key": False,
+     "has_dependents": False, "current_role_priv": ["SELECT"]},
+]
+
+
+class FakeRaw(MathesarClientRaw):
+    """Serves one table from memory, recording how many page calls overlap."""
+
+    def __init__(self, delay: float = 0.05, **kwargs):
+        super().__init__("http://localhost/", "user", "password", **kwargs)
+        self.delay = delay
+        self.lock = Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started = 0
+
+    def _send(self, payload, stream=False):
+        params = payload["params"]
+        if payload["method"] == "columns.list":
+            return {"id": payload["id"], "result": COLUMNS}
+        with self.lock:
+            self.started += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            offset = params.get("offset", 0)
+            rows = ROWS[offset:offset + params["limit"]]
+            return {"id": payload["id"], "result": {"count": len(ROWS), "results": rows}}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+
+class AsyncFakeRaw(AsyncMathesarClientRaw):
+    def __init__(self, **kwargs):
+        super().__init__("http://localhost/", "user", "password", **kwargs)
+
+    async def _send(self, payload, stream=False):
+        params = payload["params"]
+        if payload["method"] == "columns.list":
+            return {"id": payload["id"], "result": COLUMNS}
+        await asyncio.sleep(0.005)
+        offset = params.get("offset", 0)
+        rows = ROWS[offset:offset + params["limit"]]
+        return {"id": payload["id"], "result": {"count": len(ROWS), "results": rows}}
+
+def test_concurrent_fetches_share_the_table_cap():
+    raw = FakeRaw(table_concurrency=3)
+    client = MathesarClient(raw)
+
+    def export():
+        # A separate handle per export, as Database.table() creates them
+        table = client.database(1).table(7)
+        return [r["id"] for r in table.fetch_all(parallelism=3, page_size=10, return_record_summaries=False)]
+
+    with ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(lambda _: export(), range(2)))
+    assert results == [[r["1"] for r in ROWS]] * 2
+    assert raw.max_in_flight <= 3
+
+
+def test_pages_are_requested_before_first_rows_are_consumed():
+    raw = FakeRaw()
+    table = MathesarClient(raw).database(1).table(7)
+    rows = table.fetch_all(parallelism=4, page_size=10, return_record_summaries=False)
+    assert next(rows)["id"] == 1
+    # The consumer holds the first row; the next pages must already be on their way
+    time.sleep(0.02)
+    assert raw.started > 1
+    assert [r["id"] for r in rows] == [r["1"] for r in ROWS[1:]]
+
+
+def test_async_client_fetches_from_several_event_loops():
+    # The table cap is contended in both runs, each on its own event loop
+    raw = AsyncFakeRaw(table_concurrency=1)
+    client = AsyncMathesarClient(raw)
+
+    async def export():
+        table = client.database(1).table(7)
+        return [r["id"] async for r in table.fetch_all(parallelism=4, page_size=10, return_record_summaries=False)]
+
+    for _ in range(2):
+        assert asyncio.run(export()) == [r["1"] for r in ROWS]
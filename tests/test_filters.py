@@ -0,0 +1,25 @@
+from mathesar_client import col
+
+ATTNUMS = {"name": 2, "manager": 3}
+
+
+def compiled(condition):
+    return condition.compile(ATTNUMS.__getitem__).model_dump()
+
+
+def test_equal_none_compiles_to_null():
+    assert compiled(col("manager") == None) == compiled(col("manager").is_null())  # noqa: E711
+    assert compiled(col("manager") != None) == compiled(col("manager").not_null())  # noqa: E711
+    assert compiled(col("manager") == None)["type"] == "null"  # noqa: E711
+
+
+def test_isin_with_none_matches_nulls():
+    condition = compiled(col("name").isin(["a", None]))
+    assert condition["type"] == "or"
+    assert [arg["type"] for arg in condition["args"]] == ["equal", "null"]
+
+
+def test_not_equal_value_is_negated_equal():
+    condition = compiled(col("name") != "a")
+    assert condition["type"] == "not"
+    assert condition["args"][0]["type"] == "equal"
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from mathesar_client import AdaptiveLimiter, AsyncMathesarClientRaw, MathesarClientRaw
+
+BODY = b'{"jsonrpc": "2.0", "id": 1, "result": {"count": 2, "results": [{"1": 1}, {"1": 2}]}}'
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_bytes(self, chunk_size):
+        yield BODY[:20]
+        if self.fail:
+            raise ConnectionError("connection dropped")
+        yield BODY[20:]
+
+    async def aiter_bytes(self, chunk_size):
+        for chunk in self.iter_bytes(chunk_size):
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRaw(MathesarClientRaw):
+    def __init__(self, **kwargs):
+        super().__init__("http://localhost/", "user", "password", **kwargs)
+        self.fail = False
+
+    def _http_post(self, payload, **kwargs):
+        return FakeResponse(self.fail)
+
+
+class AsyncFakeRaw(AsyncMathesarClientRaw):
+    def __init__(self, **kwargs):
+        super().__init__("http://localhost/", "user", "password", **kwargs)
+
+    async def _http_post(self, payload, **kwargs):
+        return FakeResponse()
+
+
+def test_stream_holds_limiter_slot_until_read():
+    limiter = AdaptiveLimiter()
+    raw = FakeRaw(limiter=limiter)
+    rows = raw.records_list_stream(database_id=1, table_id=2)
+    assert limiter.inflight == 1
+    assert [r["1"] for r in rows] == [1, 2]
+    assert limiter.inflight == 0
+
+
+def test_stream_closed_early_releases_slot_once():
+    limiter = AdaptiveLimiter()
+    raw = FakeRaw(limiter=limiter)
+    with raw.records_list_stream(database_id=1, table_id=2):
+        assert limiter.inflight == 1
+    assert limiter.inflight == 0
+    second = raw.records_list_stream(database_id=1, table_id=2)
+    assert limiter.inflight == 1
+    second.close()
+    second.close()
+    assert limiter.inflight == 0
+
+
+def test_stream_read_error_releases_slot():
+    limiter = AdaptiveLimiter()
+    raw = FakeRaw(limiter=limiter)
+    raw.fail = True
+    with pytest.raises(ConnectionError):
+        list(raw.records_list_stream(database_id=1, table_id=2))
+    assert limiter.inflight == 0
+
+
+def test_async_stream_holds_limiter_slot_until_read():
+    limiter = AdaptiveLimiter()
+    raw = AsyncFakeRaw(limiter=limiter)
+
+    async def read():
+        rows = await raw.records_list_stream(database_id=1, table_id=2)
+        assert limiter.inflight == 1
+        ids = [r["1"] async for r in rows]
+        assert limiter.inflight == 0
+        return ids
+
+    assert asyncio.run(read()) == [1, 2]